@@ -0,0 +1,187 @@
+"""스텁 서버를 상대로 한 전체 수집 경로 벤치마크.
+
+benchmarks/stub_ecampus.py 서버를 띄우고 로그인 → 대시보드 → main.crawl_contents()
+경로를 HUD 없이 실행해 실행 시간, 가져온 페이지 수, WebDriver 명령 수, 최대 RSS를
+출력합니다. 저장소와 강좌명 캐시는 임시 디렉터리를 사용하므로 실제 캐시를 건드리지
+않습니다. 두 번째 실행부터는 같은 저장소를 쓰므로 증분 수집 효과가 드러납니다.
+
+    python benchmarks/crawl_bench.py --courses 12 --items 8 --latency 0.05 --runs 2
+    python benchmarks/crawl_bench.py --source html --browser   # Chrome으로 로그인까지 측정
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "src"))
+
+from stub_ecampus import StubCatalog, StubEcampusServer
+
+LOGIN_PATHS = {"/login.php", "/login/index.php", "/my/"}
+
+
+def peak_rss_mb():
+    """프로세스의 최대 RSS(MB). resource 모듈이 없는 환경(Windows)에서는 None."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class WebDriverCallCounter:
+    """WebDriver.execute를 감싸 브라우저로 보낸 명령 수를 셉니다."""
+
+    def __init__(self):
+        self.count = 0
+        self._original = None
+
+    def __enter__(self):
+        from selenium.webdriver.remote.webdriver import WebDriver
+
+        self._original = WebDriver.execute
+        counter = self
+
+        def execute(driver, *args, **kwargs):
+            counter.count += 1
+            return counter._original(driver, *args, **kwargs)
+
+        WebDriver.execute = execute
+        return self
+
+    def __exit__(self, *exc):
+        from selenium.webdriver.remote.webdriver import WebDriver
+
+        WebDriver.execute = self._original
+
+
+def login_with_http(base_url):
+    from crawler.http_session import HttpSession
+
+    session = HttpSession()
+    session.session.post(f"{base_url}/login/index.php", data={"username": "bench", "password": "bench"})
+    return session, session.get(f"{base_url}/my/")
+
+
+def login_with_browser(base_url):
+    """main()과 같은 방식으로 Chrome에서 로그인하고 세션을 HTTP로 넘깁니다."""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    from crawler.browser import start_chrome, wait_for_selector
+    from crawler.http_session import HttpSession
+    from crawler.login import DASHBOARD_READY
+
+    driver = start_chrome()
+    try:
+        driver.get(f"{base_url}/login.php")
+        driver.find_element(By.ID, "input-username").send_keys("bench")
+        driver.find_element(By.ID, "input-password").send_keys("bench")
+        driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+        WebDriverWait(driver, 10).until(lambda d: "/login" not in d.current_url)
+        wait_for_selector(driver, DASHBOARD_READY)
+        dashboard_html = driver.page_source
+        return HttpSession.from_driver(driver), dashboard_html
+    finally:
+        driver.quit()
+
+
+def run_once(server, args, work_dir):
+    import main
+    from crawler.course_cache import CourseTitleCache
+    from crawler.store import ContentStore
+    from utils.events import EventBus
+
+    shared_data = dict(main.shared_data)
+    shared_data.update({
+        "contents": [],
+        "cached_contents": [],
+        "events": EventBus(),
+        "running": True,
+        "exit": False,
+        "due_period": args.due_period,
+    })
+    store = ContentStore(os.path.join(work_dir, "contents.sqlite3"))
+    course_titles = CourseTitleCache.load(os.path.join(work_dir, "course_titles.json"))
+
+    server.reset_stats()
+    log = io.StringIO()
+    started = time.perf_counter()
+    with WebDriverCallCounter() if args.browser else contextlib.nullcontext() as counter:
+        with contextlib.redirect_stdout(sys.stdout if args.verbose else log):
+            login = login_with_browser if args.browser else login_with_http
+            session, dashboard_html = login(server.base_url)
+            login_done = time.perf_counter()
+            try:
+                contents = main.crawl_contents(session, dashboard_html, course_titles, store, shared_data,
+                                               data_source=args.source)
+            finally:
+                session.close()
+                store.close()
+    finished = time.perf_counter()
+
+    stats = dict(server.stats)
+    return {
+        "login": login_done - started,
+        "crawl": finished - login_done,
+        "items": len(contents or []),
+        "pages": sum(count for path, count in stats.items() if path not in LOGIN_PATHS),
+        "stats": stats,
+        "webdriver_calls": counter.count if counter else 0,
+        "events": len(shared_data["events"].drain()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스텁 서버 기반 수집 벤치마크")
+    parser.add_argument("--courses", type=int, default=8, help="강좌 수")
+    parser.add_argument("--items", type=int, default=6, help="강좌당 과제/영상 각각의 수")
+    parser.add_argument("--latency", type=float, default=0.03, help="요청당 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="지연 편차 (초)")
+    parser.add_argument("--due-period", type=int, default=7, help="수집 기간 (일)")
+    parser.add_argument("--source", choices=["ajax", "html"], default="html",
+                        help="수집 방식 (기본: 페이지 수집 경로 전체를 측정하는 html)")
+    parser.add_argument("--runs", type=int, default=2, help="같은 저장소로 반복 실행할 횟수")
+    parser.add_argument("--browser", action="store_true", help="로그인을 Chrome으로 수행")
+    parser.add_argument("--verbose", action="store_true", help="크롤러 출력 표시")
+    parser.add_argument("--trace", metavar="PATH", help="Chrome 트레이스(JSON) 파일 저장 경로")
+    args = parser.parse_args()
+
+    catalog = StubCatalog(courses=args.courses, items=args.items)
+    server = StubEcampusServer(catalog=catalog, latency=args.latency, jitter=args.jitter).start()
+    # 크롤러 모듈이 import될 때 읽는 서버 주소를 스텁으로 지정
+    os.environ["SMU_ECAMPUS_URL"] = server.base_url
+
+    print(f"스텁 서버 {server.base_url}: 강좌 {args.courses}개, 활동 {len(catalog.activities)}개, "
+          f"지연 {args.latency * 1000:.0f}ms, 수집 방식 {args.source}")
+    from utils import tracing
+    if args.trace:
+        tracing.tracer.start(args.trace)
+    try:
+        with tempfile.TemporaryDirectory(prefix="smu-bench-") as work_dir:
+            for run in range(1, args.runs + 1):
+                result = run_once(server, args, work_dir)
+                print(f"\n[실행 {run}] 로그인 {result['login']:.3f}s, 수집 {result['crawl']:.3f}s, "
+                      f"항목 {result['items']}개, 페이지 {result['pages']}개, "
+                      f"WebDriver 명령 {result['webdriver_calls']}회, HUD 이벤트 {result['events']}개")
+                for path, count in sorted(result["stats"].items()):
+                    print(f"  {path:<32} {count:5d}")
+    finally:
+        server.shutdown()
+        server.server_close()
+        tracing.finish()
+
+    rss = peak_rss_mb()
+    print(f"\n최대 RSS: {rss:.1f} MB" if rss is not None else "\n최대 RSS: 측정 불가")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""마감일 파서 마이크로벤치마크.
+
+e-캠퍼스 과제/영상 목록, 타임라인, 상세 페이지에서 실제로 나오는 마감 문자열로
+crawler.deadline.parse_deadline과 이전의 인라인 정규식 방식을 비교합니다.
+
+    python benchmarks/deadline_bench.py [반복 횟수]
+"""
+import datetime
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawler.deadline import parse_deadline, parse_due_date
+
+# 일괄 목록 표, 타임라인 블록, 상세 페이지에서 수집한 마감 문자열
+CORPUS = [
+    "2025년 5월 3일 (토요일) 오후 11:59",
+    "2025년 5월 3일 오전 9:00",
+    "2025년 05월 10일 (토) 23:59",
+    "2025-05-03 23:59",
+    "2025-05-12 09:00:00",
+    "2025.05.03 오후 6:00",
+    "2025/5/3 11:59 PM",
+    "25.05.03",
+    "25.05.03 23:59",
+    "25-05-14",
+    "5월 3일",
+    "5월 3일 오후 11:59 마감",
+    "5/3 12:00",
+    "과제 마감 5월 10일 (토)",
+    "마감 일시 2025년 6월 1일 일요일 오후 11:59",
+    "시작: 2025년 4월 28일 00:00 종료: 2025년 5월 4일 23:59",
+    "진도율 45% · 5/7 까지",
+    "5/3 까지 제출, 5/10 이후 공개",
+    "2025년 5월 3일 오후 11:59까지 제출 (지각 제출 허용: 2025년 5월 10일)",
+    "학습기간: 2025-04-28 00:00:00 ~ 2025-05-04 23:59:59",
+    "2025년 4월 28일 ~ 2025년 5월 4일",
+    "5월 3일 ~ 5월 4일",
+    "마감일 정보 없음",
+    "",
+]
+
+# 날짜가 여러 개인 문자열의 기대 결과 (오늘 = 2025-05-01). 벤치마크 전에 확인합니다.
+EXPECTED = {
+    "시작: 2025년 4월 28일 00:00 종료: 2025년 5월 4일 23:59": "2025-05-04T23:59:00+09:00",
+    "5/3 까지 제출, 5/10 이후 공개": "2025-05-03T23:59:59+09:00",
+    "2025년 5월 3일 오후 11:59까지 제출 (지각 제출 허용: 2025년 5월 10일)": "2025-05-03T23:59:00+09:00",
+    "학습기간: 2025-04-28 00:00:00 ~ 2025-05-04 23:59:59": "2025-05-04T23:59:00+09:00",
+    "2025년 4월 28일 ~ 2025년 5월 4일": "2025-05-04T23:59:59+09:00",
+    "5월 3일 ~ 5월 4일": "2025-05-04T23:59:59+09:00",
+}
+
+LEGACY_PATTERNS = [
+    r'(\d{4})[-년/\.]\s*(\d{1,2})[-월/\.]\s*(\d{1,2})',
+    r'(\d{2})[-/\.]\s*(\d{1,2})[-/\.]\s*(\d{1,2})',
+    r'(\d{1,2})\s*[월/]\s*(\d{1,2})'
+]
+
+
+def legacy_parse(text, today):
+    """이전 버전의 인라인 파싱 + HUD의 strptime/23:59:59 보정을 재현합니다."""
+    for pattern in LEGACY_PATTERNS:
+        date_match = re.search(pattern, text)
+        if date_match:
+            try:
+                if len(date_match.groups()) == 3:
+                    year = int(date_match.group(1))
+                    if year < 100:
+                        year += 2000
+                    month = int(date_match.group(2))
+                    day = int(date_match.group(3))
+                else:
+                    month = int(date_match.group(1))
+                    day = int(date_match.group(2))
+                    year = today.year
+                deadline = datetime.date(year, month, day)
+                if deadline < today:
+                    deadline = datetime.date(year + 1, month, day)
+                date = datetime.datetime.strptime(str(deadline), '%Y-%m-%d').date()
+                return datetime.datetime.combine(date, datetime.time(23, 59, 59))
+            except ValueError:
+                continue
+    return None
+
+
+def bench(label, func, number):
+    seconds = min(timeit.repeat(func, number=number, repeat=5))
+    per_item = seconds / (number * len(CORPUS)) * 1e6
+    print(f"{label:<28} {per_item:8.2f} µs/문자열")
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    today = datetime.date(2025, 5, 1)
+    due_dates = ["2025-05-03 23:59", "2025-05-03 09:00", "2025-05-10"] * 6
+
+    for text, expected in EXPECTED.items():
+        deadline = parse_deadline(text, today)
+        assert deadline and deadline.isoformat() == expected, f"{text!r}: {deadline} != {expected}"
+
+    print(f"문자열 {len(CORPUS)}개 × {number}회")
+    bench("legacy inline regex", lambda: [legacy_parse(text, today) for text in CORPUS], number)
+    bench("parse_deadline", lambda: [parse_deadline(text, today) for text in CORPUS], number)
+    bench("parse_due_date (HUD 갱신)", lambda: [parse_due_date(text) for text in due_dates], number)
+
+    print("\n파싱 결과")
+    for text in CORPUS:
+        deadline = parse_deadline(text, today)
+        print(f"  {text!r:<48} -> {deadline.isoformat() if deadline else None}")
+
+
+if __name__ == "__main__":
+    main()
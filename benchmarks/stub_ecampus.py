@@ -0,0 +1,399 @@
+"""e-캠퍼스(Moodle) 오프라인 스텁 서버.
+
+실제 학교 서버 대신 크롤러가 읽는 페이지를 합성해 제공합니다.
+
+- login.php, login/index.php: 로그인 폼 (POST 시 MoodleSession 쿠키 발급)
+- /, /my/: 강좌 목록과 타임라인 블록이 있는 대시보드 (M.cfg sesskey 포함)
+- course/view.php?id=N: 강좌 활동 목록
+- mod/assign/index.php, mod/econtents/index.php: 과제/영상 일괄 표
+- mod/assign/view.php, mod/econtents/view.php: 상세 페이지
+- lib/ajax/service.php: core_calendar_get_action_events_by_timesort
+
+로그인하지 않은 요청은 실제 서버처럼 로그인 페이지로 리다이렉트됩니다.
+경로별 요청 수는 StubEcampusServer.stats에 기록됩니다.
+
+    python benchmarks/stub_ecampus.py --port 8800 --courses 8 --items 6 --latency 0.05
+    SMU_ECAMPUS_URL=http://127.0.0.1:8800 python src/main.py
+"""
+import argparse
+import datetime
+import html
+import json
+import random
+import secrets
+import threading
+import time
+from collections import Counter
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+KST = datetime.timezone(datetime.timedelta(hours=9))
+
+SESSION_COOKIE = "MoodleSession"
+
+PROTECTED_PREFIXES = ("/my", "/course/", "/mod/", "/lib/ajax/")
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html><head><title>로그인</title></head>
+<body>
+<form action="/login/index.php" method="post" id="login">
+  <input type="text" name="username" id="input-username">
+  <input type="password" name="password" id="input-password">
+  <button type="submit" class="btn-login">로그인</button>
+</form>
+</body></html>"""
+
+
+class StubCatalog:
+    """강좌/활동 데이터를 시드 기반으로 합성합니다.
+
+    강좌마다 과제와 영상이 items개씩 있고, 마감일은 오늘부터 spread일 사이에 퍼집니다.
+    detail_ratio 비율의 활동은 강좌 페이지에 마감일이 없어 상세 페이지를 열어야 합니다.
+    """
+
+    def __init__(self, courses=8, items=6, spread=21, detail_ratio=0.25, seed=1):
+        rng = random.Random(seed)
+        today = datetime.datetime.now(KST).replace(hour=0, minute=0, second=0, microsecond=0)
+        self.sesskey = "stub" + secrets.token_hex(4)
+        self.courses = []
+        self.activities = {}
+
+        activity_id = 1000
+        for course_index in range(courses):
+            course_id = 100 + course_index
+            title = f"스텁강좌{course_index + 1} HBST{1000 + course_index} 홍길동"
+            course = {"id": course_id, "title": title, "activities": []}
+            for modname in ("assign", "econtents"):
+                for _ in range(items):
+                    activity_id += 1
+                    due = today + datetime.timedelta(
+                        days=rng.randrange(-2, spread), hours=rng.choice([9, 12, 18, 23]), minutes=rng.choice([0, 30, 59])
+                    )
+                    activity = {
+                        "id": activity_id,
+                        "course_id": course_id,
+                        "modname": modname,
+                        "name": f"{'과제' if modname == 'assign' else '영상'} {activity_id}",
+                        "due": due,
+                        "submitted": rng.random() < 0.4,
+                        "needs_detail": rng.random() < detail_ratio,
+                    }
+                    course["activities"].append(activity)
+                    self.activities[activity_id] = activity
+            self.courses.append(course)
+
+    def course(self, course_id):
+        return next((course for course in self.courses if course["id"] == course_id), None)
+
+    def events_between(self, timesort_from, timesort_to):
+        events = [
+            activity for activity in self.activities.values()
+            if timesort_from <= activity["due"].timestamp() <= timesort_to
+        ]
+        return sorted(events, key=lambda activity: (activity["due"], activity["id"]))
+
+
+def _korean_due(due):
+    meridiem = "오전" if due.hour < 12 else "오후"
+    hour = due.hour % 12 or 12
+    weekday = "월화수목금토일"[due.weekday()]
+    return f"{due.year}년 {due.month}월 {due.day}일 ({weekday}요일) {meridiem} {hour}:{due.minute:02d}"
+
+
+def _page(title, body, sesskey=None):
+    cfg = f'<script>M.cfg = {{"wwwroot":"","sesskey":"{sesskey}"}};</script>' if sesskey else ""
+    return (
+        f"<!DOCTYPE html><html><head><title>{html.escape(title)}</title>{cfg}</head>"
+        f"<body><div id=\"region-main\">{body}</div></body></html>"
+    )
+
+
+def _activity_url(activity):
+    return f"/mod/{activity['modname']}/view.php?id={activity['id']}"
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    server_version = "StubEcampus/1.0"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    # --- 공통 처리 ---
+
+    def _logged_in(self):
+        cookie = SimpleCookie(self.headers.get("Cookie") or "")
+        return SESSION_COOKIE in cookie and cookie[SESSION_COOKIE].value in self.server.sessions
+
+    def _send(self, status, body, content_type="text/html; charset=utf-8", headers=None):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _redirect(self, location, headers=None):
+        self.send_response(303)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+    def _dispatch(self, method):
+        url = urlparse(self.path)
+        self.server.record(url.path)
+        self.server.delay()
+
+        protected = url.path == "/" or url.path.startswith(PROTECTED_PREFIXES)
+        if protected and not self._logged_in():
+            self._redirect("/login/index.php")
+            return
+
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        handler = ROUTES.get((method, url.path))
+        if handler is None:
+            self._send(404, _page("404", "페이지를 찾을 수 없습니다."))
+            return
+        handler(self, query)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    # --- 라우트 ---
+
+    def login_page(self, query):
+        self._send(200, LOGIN_PAGE)
+
+    def login_submit(self, query):
+        length = int(self.headers.get("Content-Length") or 0)
+        form = parse_qs(self.rfile.read(length).decode("utf-8"))
+        if not form.get("username") or not form.get("password"):
+            self._redirect("/login/index.php?error=1")
+            return
+        token = secrets.token_hex(8)
+        self.server.sessions.add(token)
+        self._redirect("/my/", {"Set-Cookie": f"{SESSION_COOKIE}={token}; Path=/; HttpOnly"})
+
+    def dashboard(self, query):
+        catalog = self.server.catalog
+        course_boxes = "".join(
+            f'<div class="coursebox"><a href="/course/view.php?id={course["id"]}">{html.escape(course["title"])}</a></div>'
+            for course in catalog.courses
+        )
+        now = datetime.datetime.now(KST)
+        upcoming = [
+            activity for activity in sorted(catalog.activities.values(), key=lambda activity: activity["due"])
+            if activity["due"] >= now
+        ][:self.server.timeline_limit]
+        events = "".join(
+            f'<div class="list-group-item"><a href="{_activity_url(activity)}&amp;course={activity["course_id"]}">'
+            f'{html.escape(activity["name"])}</a><span>{_korean_due(activity["due"])}</span></div>'
+            for activity in upcoming
+        )
+        body = (
+            f'<section class="block_timeline"><h5 class="card-title">타임라인</h5>{events}</section>'
+            f'<section class="block_myoverview">{course_boxes}</section>'
+            f'<a href="/login/logout.php?sesskey={catalog.sesskey}">로그아웃</a>'
+        )
+        self._send(200, _page("대시보드", body, catalog.sesskey))
+
+    def course_view(self, query):
+        course = self.server.catalog.course(int(query.get("id", 0)))
+        if course is None:
+            self._send(404, _page("404", "강좌가 없습니다."))
+            return
+        items = []
+        for activity in course["activities"]:
+            # view.php 링크는 크롤러가 일괄 페이지 몫으로 건너뛰므로, 상세 확인이 필요한
+            # 활동만 마감일 없이 다른 진입 링크로 노출해 상세 페이지 요청을 유도
+            if activity["needs_detail"]:
+                link = f"/mod/{activity['modname']}/grade.php?id={activity['id']}"
+                text = ""
+            else:
+                link = _activity_url(activity)
+                text = f"마감: {_korean_due(activity['due'])}"
+            items.append(
+                f'<li class="activity modtype_{activity["modname"]}"><a href="{link}">{html.escape(activity["name"])}</a>'
+                f'<div class="description">{text}</div></li>'
+            )
+        body = (
+            f'<div class="page-header-headings"><h1>{html.escape(course["title"])}</h1></div>'
+            f'<ul class="section">{"".join(items)}</ul>'
+        )
+        self._send(200, _page(course["title"], body))
+
+    def bulk_index(self, query):
+        modname = urlparse(self.path).path.split("/")[2]
+        course = self.server.catalog.course(int(query.get("id", 0)))
+        if course is None:
+            self._send(404, _page("404", "강좌가 없습니다."))
+            return
+        status_header = "제출 상태" if modname == "assign" else "시청 상태"
+        rows = []
+        for activity in course["activities"]:
+            if activity["modname"] != modname:
+                continue
+            if modname == "assign":
+                status = "제출 완료" if activity["submitted"] else "미제출"
+            else:
+                status = "100%" if activity["submitted"] else "미시청"
+            rows.append(
+                f'<tr><td><a href="{_activity_url(activity)}">{html.escape(activity["name"])}</a></td>'
+                f'<td>{activity["due"].strftime("%Y-%m-%d %H:%M")}</td><td>{status}</td></tr>'
+            )
+        body = (
+            f'<table class="generaltable"><tr><th>이름</th><th>마감 일시</th><th>{status_header}</th></tr>'
+            f'{"".join(rows)}</table>'
+        )
+        self._send(200, _page(course["title"], body))
+
+    def activity_detail(self, activity_id):
+        activity = self.server.catalog.activities.get(activity_id)
+        if activity is None:
+            self._send(404, _page("404", "활동이 없습니다."))
+            return
+        if activity["modname"] == "assign":
+            state = "제출 완료" if activity["submitted"] else "미제출"
+            status = f'<table class="submissionstatustable"><tr><td class="c1">{state}</td></tr></table>'
+        else:
+            progress = "100%" if activity["submitted"] else "35%"
+            status = f'<div class="progress-bar">{progress}</div>'
+        body = f"<h2>{html.escape(activity['name'])}</h2><p>마감 일시 {_korean_due(activity['due'])}</p>{status}"
+        self._send(200, _page(activity["name"], body))
+
+    def detail_view(self, query):
+        self.activity_detail(int(query.get("id", 0)))
+
+    def ajax_service(self, query):
+        catalog = self.server.catalog
+        length = int(self.headers.get("Content-Length") or 0)
+        calls = json.loads(self.rfile.read(length) or b"[]")
+        if query.get("sesskey") != catalog.sesskey:
+            self._send(200, json.dumps({"error": "Invalid sesskey", "errorcode": "invalidsesskey"}),
+                       "application/json")
+            return
+
+        responses = []
+        for call in calls:
+            if call.get("methodname") != "core_calendar_get_action_events_by_timesort":
+                responses.append({"error": True, "exception": {"message": "지원하지 않는 함수"}})
+                continue
+            args = call.get("args") or {}
+            events = catalog.events_between(args.get("timesortfrom", 0), args.get("timesortto") or float("inf"))
+            after = args.get("aftereventid") or 0
+            if after:
+                ids = [activity["id"] for activity in events]
+                events = events[ids.index(after) + 1:] if after in ids else []
+            page = events[:args.get("limitnum", 50)]
+            responses.append({"error": False, "data": {
+                "events": [self.ajax_event(activity) for activity in page],
+                "lastid": page[-1]["id"] if page else None,
+            }})
+        self._send(200, json.dumps(responses, ensure_ascii=False), "application/json")
+
+    def ajax_event(self, activity):
+        course = self.server.catalog.course(activity["course_id"])
+        return {
+            "id": activity["id"],
+            "name": f"{activity['name']} 마감",
+            "activityname": activity["name"],
+            "modulename": activity["modname"],
+            "timesort": int(activity["due"].timestamp()),
+            "url": f"{self.server.base_url}{_activity_url(activity)}",
+            "course": {"id": course["id"], "fullname": course["title"]},
+            "action": {"actionable": not activity["submitted"]},
+        }
+
+
+ROUTES = {
+    ("GET", "/login.php"): StubRequestHandler.login_page,
+    ("GET", "/login/index.php"): StubRequestHandler.login_page,
+    ("POST", "/login/index.php"): StubRequestHandler.login_submit,
+    ("GET", "/"): StubRequestHandler.dashboard,
+    ("GET", "/my/"): StubRequestHandler.dashboard,
+    ("GET", "/course/view.php"): StubRequestHandler.course_view,
+    ("GET", "/mod/assign/index.php"): StubRequestHandler.bulk_index,
+    ("GET", "/mod/econtents/index.php"): StubRequestHandler.bulk_index,
+    ("GET", "/mod/assign/view.php"): StubRequestHandler.detail_view,
+    ("GET", "/mod/econtents/view.php"): StubRequestHandler.detail_view,
+    ("GET", "/mod/assign/grade.php"): StubRequestHandler.detail_view,
+    ("GET", "/mod/econtents/grade.php"): StubRequestHandler.detail_view,
+    ("POST", "/lib/ajax/service.php"): StubRequestHandler.ajax_service,
+}
+
+
+class StubEcampusServer(ThreadingHTTPServer):
+    """요청마다 latency초(± jitter)의 지연을 넣어 응답하는 스텁 서버."""
+
+    daemon_threads = True
+
+    def __init__(self, address=("127.0.0.1", 0), catalog=None, latency=0.0, jitter=0.0,
+                 timeline_limit=20, verbose=False):
+        super().__init__(address, StubRequestHandler)
+        self.catalog = catalog or StubCatalog()
+        self.latency = latency
+        self.jitter = jitter
+        self.timeline_limit = timeline_limit
+        self.verbose = verbose
+        self.sessions = set()
+        self.stats = Counter()
+        self.stats_lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def record(self, path):
+        with self.stats_lock:
+            self.stats[path] += 1
+
+    def reset_stats(self):
+        with self.stats_lock:
+            self.stats.clear()
+
+    def delay(self):
+        if self.latency or self.jitter:
+            time.sleep(max(0.0, self.latency + random.uniform(-self.jitter, self.jitter)))
+
+    def start(self):
+        """백그라운드 스레드에서 서버를 시작하고 자신을 반환합니다."""
+        thread = threading.Thread(target=self.serve_forever, name="stub-ecampus", daemon=True)
+        thread.start()
+        return self
+
+
+def main():
+    parser = argparse.ArgumentParser(description="e-캠퍼스 오프라인 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--courses", type=int, default=8, help="강좌 수")
+    parser.add_argument("--items", type=int, default=6, help="강좌당 과제/영상 각각의 수")
+    parser.add_argument("--latency", type=float, default=0.0, help="요청당 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="지연 편차 (초)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--verbose", action="store_true", help="요청 로그 출력")
+    args = parser.parse_args()
+
+    catalog = StubCatalog(courses=args.courses, items=args.items, seed=args.seed)
+    server = StubEcampusServer((args.host, args.port), catalog, args.latency, args.jitter, verbose=args.verbose)
+    print(f"스텁 서버 실행 중: {server.base_url} (강좌 {args.courses}개, 활동 {len(catalog.activities)}개)")
+    print(f"SMU_ECAMPUS_URL={server.base_url} 로 크롤러를 실행하세요.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+import json
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+from utils import tracing
+from utils.config import (
+    CHROMEDRIVER_CACHE_PATH, CHROMEDRIVER_CACHE_TTL, LEAN_BLOCKED_URL_PATTERNS, LEAN_BROWSER, TIMEOUT, USER_AGENT,
+)
+
+
+def chrome_options(lean=LEAN_BROWSER):
+    """Headless Chrome 실행 옵션을 만듭니다.
+
+    lean이면 DOMContentLoaded까지만 기다리는 eager 로딩을 쓰고 이미지를 받지 않습니다.
+    """
+    from selenium import webdriver
+
+    options = webdriver.ChromeOptions()
+    options.add_argument('--headless=new')  # 최신 Headless 모드 사용
+    options.add_argument('--disable-gpu')
+    options.add_argument('--disable-extensions')
+    options.add_argument('--disable-infobars')
+    options.add_argument('--disable-notifications')
+    options.add_argument('--window-size=1920,1080')  # 해상도 설정
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument(f"user-agent={USER_AGENT}")
+    if lean:
+        options.page_load_strategy = "eager"
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    return options
+
+
+def block_heavy_resources(driver, patterns=LEAN_BLOCKED_URL_PATTERNS):
+    """CDP로 이미지, 미디어, 글꼴, 분석 스크립트 요청을 네트워크 단계에서 차단합니다."""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+    except Exception as e:
+        print(f"리소스 차단 설정 실패, 모든 리소스를 불러옵니다: {str(e)}")
+
+
+def _load_cached_driver_path(path=CHROMEDRIVER_CACHE_PATH):
+    """캐시된 chromedriver 경로와 확인 시각을 반환합니다. 파일이 없어졌으면 (None, 0)."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None, 0
+    driver_path = cached.get("path")
+    if not driver_path or not os.path.exists(driver_path):
+        return None, 0
+    return driver_path, cached.get("resolved_at", 0)
+
+
+def _save_driver_path(driver_path, path=CHROMEDRIVER_CACHE_PATH):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"path": driver_path, "resolved_at": time.time()}, f)
+        os.replace(temp_path, path)
+    except OSError as e:
+        print(f"chromedriver 경로 캐시 저장 실패: {str(e)}")
+
+
+def invalidate_driver_path(path=CHROMEDRIVER_CACHE_PATH):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def resolve_driver_path(refresh=False):
+    """chromedriver 경로를 찾습니다.
+
+    캐시가 CHROMEDRIVER_CACHE_TTL 이내면 webdriver_manager의 버전 확인 없이 바로 사용하고,
+    버전 확인(네트워크)에 실패하면 오래된 캐시라도 사용합니다. 둘 다 없으면 None을
+    반환해 Selenium Manager가 드라이버를 찾도록 합니다.
+    """
+    cached_path, resolved_at = _load_cached_driver_path()
+    if cached_path and not refresh and time.time() - resolved_at < CHROMEDRIVER_CACHE_TTL:
+        return cached_path
+
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        driver_path = ChromeDriverManager().install()
+    except Exception as e:
+        print(f"chromedriver 버전 확인 실패, {'캐시된 경로' if cached_path else 'Selenium Manager'}를 사용합니다: {str(e)}")
+        return cached_path
+
+    _save_driver_path(driver_path)
+    return driver_path
+
+
+def start_chrome(timer=None):
+    """Headless Chrome 드라이버를 실행합니다.
+
+    캐시된 드라이버가 설치된 Chrome과 맞지 않아 실행에 실패하면 경로를 다시 확인해
+    한 번 더 시도합니다. timer가 주어지면 import/경로 확인/실행 시간을 기록합니다.
+    """
+    phase = timer.phase if timer else (lambda name: tracing.span(name))
+
+    with phase("selenium_import"):
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+
+        options = chrome_options()
+
+    with phase("driver_resolve"):
+        driver_path = resolve_driver_path()
+
+    with tracing.span("chrome_start"), phase("browser_spawn"):
+        try:
+            driver = webdriver.Chrome(service=Service(driver_path), options=options)
+        except Exception as e:
+            if not driver_path:
+                raise
+            print(f"캐시된 chromedriver로 실행 실패, 경로를 다시 확인합니다: {str(e)}")
+            invalidate_driver_path()
+            driver = webdriver.Chrome(service=Service(resolve_driver_path(refresh=True)), options=options)
+    if LEAN_BROWSER:
+        block_heavy_resources(driver)
+    return tracing.instrument_driver(driver)
+
+
+class DriverPool:
+    """Chrome 드라이버를 최대 size개까지 띄워 여러 계정의 로그인에 돌려 씁니다.
+
+    reuse가 True이면 반납된 드라이버의 쿠키를 지우고 다음 계정에 넘기며, False이면
+    반납할 때 바로 종료해 수집 중에 브라우저 메모리를 차지하지 않도록 합니다. 쿠키는 현재
+    페이지와 상관없이 브라우저 전체에서 지우고, 그 뒤 첫 탭만 빈 페이지로 남깁니다.
+    로그인은 새 탭을 열지 않으므로 보통 닫을 탭은 없지만, 로그인 페이지가 바뀌어 탭이
+    열리더라도 계정 수만큼 탭(렌더러)이 쌓이지 않도록 합니다.
+    """
+
+    def __init__(self, size=1, reuse=True):
+        self.size = size
+        self.reuse = reuse
+        self._idle = queue.LifoQueue()
+        self._slots = threading.Semaphore(size)
+        self._lock = threading.Lock()
+        self._drivers = []
+        self.started = 0
+        self.reused = 0  # 반납된 드라이버를 다시 빌려 준 횟수
+        self.tabs_closed = 0  # 반납할 때 닫은 여분의 탭 수
+
+    def _start(self):
+        driver = start_chrome()
+        with self._lock:
+            self._drivers.append(driver)
+            self.started += 1
+        tracing.count("chrome_started")
+        return driver
+
+    def _discard(self, driver):
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @contextmanager
+    def driver(self):
+        """드라이버를 빌려 줍니다. 모두 사용 중이면 반납될 때까지 기다립니다."""
+        self._slots.acquire()
+        driver = None
+        try:
+            try:
+                driver = self._idle.get_nowait()
+                with self._lock:
+                    self.reused += 1
+                tracing.count("chrome_reused")
+            except queue.Empty:
+                driver = self._start()
+            yield driver
+        except Exception:
+            # 오류가 난 드라이버는 상태를 믿을 수 없으므로 버림
+            if driver is not None:
+                self._discard(driver)
+                driver = None
+            raise
+        finally:
+            if driver is not None:
+                self._release(driver)
+            self._slots.release()
+
+    def _release(self, driver):
+        if not self.reuse:
+            self._discard(driver)
+            return
+        try:
+            # 다음 계정이 이전 계정의 세션을 물려받지 않도록 빈 페이지로 옮기기 전에 지움
+            self._clear_cookies(driver)
+            self._reset_tabs(driver)
+        except Exception:
+            self._discard(driver)
+            return
+        self._idle.put(driver)
+
+    @staticmethod
+    def _clear_cookies(driver):
+        """브라우저의 모든 쿠키를 지웁니다.
+
+        delete_all_cookies()는 현재 페이지 도메인의 쿠키만 지우므로 CDP를 먼저 쓰고,
+        CDP를 쓸 수 없는 드라이버에서는 e-campus 페이지에 있는 동안 delete_all_cookies()로 지웁니다.
+        """
+        try:
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except Exception:
+            driver.delete_all_cookies()
+
+    def _reset_tabs(self, driver):
+        """첫 탭만 남기고 닫은 뒤 빈 페이지로 이동해 이전 페이지의 렌더러 메모리를 놓습니다."""
+        handles = list(driver.window_handles)
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        driver.get("about:blank")
+        closed = len(handles) - 1
+        if closed:
+            with self._lock:
+                self.tabs_closed += closed
+            tracing.count("chrome_tabs_closed", closed)
+
+    def stats(self):
+        """드라이버 사용 통계 (실행, 재사용, 닫은 탭 수)."""
+        with self._lock:
+            return {"started": self.started, "reused": self.reused, "tabs_closed": self.tabs_closed}
+
+    def close(self):
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+def wait_for_page_load(driver, timeout=TIMEOUT):
+    """문서 로딩(document.readyState)이 끝날 때까지 기다립니다."""
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    WebDriverWait(driver, timeout).until(
+        lambda d: d.execute_script("return document.readyState") == "complete"
+    )
+
+
+def wait_for_selector(driver, css_selector, timeout=TIMEOUT):
+    """css_selector에 맞는 요소가 나타날 때까지 기다립니다.
+
+    lean 모드에서는 문서 전체 로딩 대신 해당 단계에 필요한 요소만 확인하고,
+    일반 모드에서는 document.readyState가 complete가 될 때까지 함께 기다립니다.
+    """
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    if not LEAN_BROWSER:
+        wait_for_page_load(driver, timeout)
+    WebDriverWait(driver, timeout).until(lambda d: d.find_elements("css selector", css_selector))
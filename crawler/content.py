@@ -0,0 +1,244 @@
+import datetime
+import re
+from dataclasses import dataclass
+from enum import Enum
+
+from crawler.deadline import parse_due_date
+from crawler.search import SearchIndex
+
+COURSE_CODE_PATTERN = re.compile(r'\b[A-Z]{2,4}\d{4}\b')  # 학수번호 (예: HBXX0000)
+PROFESSOR_PATTERN = re.compile(r'[가-힣]{2,4}')  # 교수 이름 (예: '최영훈')
+BRACKETS_PATTERN = re.compile(r'\[.*?\]')
+PARENTHESES_PATTERN = re.compile(r'\(.*?\)')
+
+
+class Status(str, Enum):
+    """콘텐츠의 제출 상태. 값은 화면과 내보내기에 쓰는 문구입니다."""
+    UNSUBMITTED = "미제출"
+    SUBMITTED = "제출됨"
+    UNKNOWN = "확인필요"
+
+    @classmethod
+    def parse(cls, text):
+        """상태 문구를 Status로 바꿉니다. 알 수 없는 문구는 확인필요로 봅니다."""
+        try:
+            return cls(text)
+        except ValueError:
+            return cls.UNKNOWN
+
+
+def extract_course_details(course_name):
+    """과목명에서 학수번호와 교수 이름을 분리."""
+    course_code = None
+    professor_name = None
+
+    # 학수번호 추출 (예: HBXX0000 형식)
+    course_code_match = COURSE_CODE_PATTERN.search(course_name)
+    if course_code_match:
+        course_code = course_code_match.group()
+        course_name = course_name.replace(course_code, "").strip()
+
+    # 교수 이름 추출 (예: '최영훈' 형식)
+    professor_name_match = PROFESSOR_PATTERN.search(course_name)
+    if professor_name_match:
+        professor_name = professor_name_match.group()
+        course_name = course_name.replace(professor_name, "").strip()
+
+    course_name = BRACKETS_PATTERN.sub('', course_name)  # 대괄호 내용 제거
+    # ')' 이후 남은 내용 제거
+    if '(' in course_name:
+        course_name = course_name.split('(')[0]
+    course_name = course_name.strip()
+
+    return course_name, course_code, professor_name
+
+
+@dataclass(slots=True)
+class ContentItem:
+    """HUD에 표시하는 콘텐츠 한 건.
+
+    수집 결과(dict)를 받을 때 마감 일시를 한 번 파싱하고 강좌명, 학수번호, 교수 이름과
+    표시용 문자열을 미리 만들어 두므로, 화면 갱신 때는 필드만 읽으면 됩니다.
+    """
+    link: str
+    title: str
+    course: str  # 원래 강좌명 (상세 정보 표시용)
+    course_name: str  # 학수번호, 교수 이름, 괄호를 뺀 표시용 강좌명
+    course_code: str | None
+    professor_name: str | None
+    category: str
+    type: str
+    status: Status
+    deadline: datetime.datetime
+    due_date: str
+    context: str
+    cached: bool = False
+    detail_pending: bool = False  # 상세 페이지를 아직 가져오지 않음 (마감일은 기간의 마지막 날로 표시)
+    display_title: str = ""
+    due_label: str = ""  # 표의 마감일 칸 (MM-DD HH:MM)
+    sort_key: tuple = ()  # pipeline.due_key와 같은 순서 (마감, 링크, 제목)
+
+    @classmethod
+    def from_dict(cls, content):
+        """수집 결과나 저장된 항목(dict)에서 만듭니다."""
+        course_name, course_code, professor_name = extract_course_details(content['course'])
+        course_name = PARENTHESES_PATTERN.sub('', course_name).replace("\n", " ").strip()
+        deadline = parse_due_date(content['due_date'])
+        link = content.get('link') or ""
+        title = content.get('title') or ""
+        return cls(
+            link=link,
+            title=title,
+            course=content['course'],
+            course_name=course_name,
+            course_code=course_code,
+            professor_name=professor_name,
+            category=content.get('category') or "일반",
+            type=content.get('type') or "기타",
+            status=Status.parse(content.get('status')),
+            deadline=deadline,
+            due_date=content['due_date'],
+            context=content.get('context') or "",
+            cached=bool(content.get('cached')),
+            detail_pending=bool(content.get('detail_pending')),
+            display_title=title.replace("\n", " ").strip(),
+            due_label=deadline.strftime('%m-%d %H:%M'),
+            sort_key=(deadline, link, title),
+        )
+
+    def to_dict(self):
+        """수집 결과와 같은 형식의 dict로 되돌립니다."""
+        content = {
+            'link': self.link,
+            'title': self.title,
+            'course': self.course,
+            'due_date': self.due_date,
+            'status': self.status.value,
+            'type': self.type,
+            'context': self.context,
+            'category': self.category,
+        }
+        if self.cached:
+            content['cached'] = True
+        if self.detail_pending:
+            content['detail_pending'] = True
+        return content
+
+    @property
+    def unsubmitted(self):
+        return self.status is Status.UNSUBMITTED
+
+
+STATUS_ORDER = {Status.UNSUBMITTED: 0, Status.UNKNOWN: 1, Status.SUBMITTED: 2}
+
+# HUD 칼럼별 정렬 키. 같은 값이면 마감 순서를 유지합니다 (남은 시간은 마감 순서와 같음).
+SORT_KEYS = {
+    'course': lambda item: (item.course_name, item.sort_key),
+    'title': lambda item: (item.display_title, item.sort_key),
+    'type': lambda item: (item.type, item.sort_key),
+    'submission': lambda item: (STATUS_ORDER[item.status], item.sort_key),
+    'due_date': lambda item: item.sort_key,
+    'remaining_time': lambda item: item.sort_key,
+}
+
+
+class ContentTable:
+    """HUD 목록의 정렬/필터 상태와 표시할 행 목록.
+
+    칼럼별 정렬 결과는 목록이 바뀔 때까지 재사용하므로, 헤더를 다시 누르거나 필터를 바꿀 때는
+    정렬된 목록을 한 번 훑기만 합니다. 행 ID(링크, 중복이면 '#번호')는 목록을 받을 때 정합니다.
+    검색어는 SearchIndex로 일치하는 행 ID를 먼저 구한 뒤 같은 방식으로 거릅니다.
+    """
+
+    def __init__(self, items=()):
+        self.sort_column = 'due_date'
+        self.descending = False
+        self.filters = {}  # 'status' | 'type' | 'course' → 값 (None이면 전체)
+        self.query = ""
+        self.index = SearchIndex()
+        self._query_matches = None  # 검색어와 일치하는 행 ID 집합 (검색어가 없으면 None)
+        self.set_items(items)
+
+    def set_items(self, items):
+        """목록 전체를 바꿉니다. items는 마감 순으로 정렬된 ContentItem 목록입니다."""
+        self.items = list(items)
+        self.by_key = {}
+        key_counts = {}
+        for item in self.items:
+            # 같은 링크가 두 번 나오면 두 번째부터 번호를 붙여 행 ID를 구분
+            key = item.link or item.title
+            key_counts[key] = key_counts.get(key, 0) + 1
+            if key_counts[key] > 1:
+                key = f"{key}#{key_counts[key]}"
+            self.by_key[key] = item
+        self.index.update(self.by_key)
+        self._query_matches = self.index.search(self.query)
+        self._sorted = {}
+        self._rows = None
+
+    def sort_by(self, column):
+        """칼럼으로 정렬합니다. 같은 칼럼을 다시 고르면 순서를 뒤집습니다."""
+        if column not in SORT_KEYS:
+            return
+        if column == self.sort_column:
+            self.descending = not self.descending
+        else:
+            self.sort_column = column
+            self.descending = False
+        self._rows = None
+
+    def set_filter(self, name, value):
+        if self.filters.get(name) != value:
+            self.filters[name] = value
+            self._rows = None
+
+    def set_query(self, query):
+        """검색어를 바꿉니다. 공백으로 나눈 단어가 모두 들어 있는 항목만 남깁니다."""
+        if query != self.query:
+            self.query = query
+            self._query_matches = self.index.search(query)
+            self._rows = None
+
+    def _matches(self, key, item):
+        if self._query_matches is not None and key not in self._query_matches:
+            return False
+        status = self.filters.get('status')
+        content_type = self.filters.get('type')
+        course = self.filters.get('course')
+        return ((status is None or item.status is status)
+                and (content_type is None or item.type == content_type)
+                and (course is None or item.course_name == course))
+
+    def rows(self):
+        """현재 정렬/필터를 적용한 [(행 ID, ContentItem), ...]."""
+        if self._rows is None:
+            ordered, positions = self._sorted_rows()
+            matches = self._query_matches
+            if matches is not None and len(matches) * 4 < len(ordered):
+                # 검색 결과가 적으면 전체를 훑지 않고 일치한 행만 정렬 위치 순으로 나열
+                keys = sorted(matches, key=positions.__getitem__, reverse=self.descending)
+                self._rows = [(key, self.by_key[key]) for key in keys if self._matches(key, self.by_key[key])]
+            else:
+                if self.descending:
+                    ordered = reversed(ordered)
+                if any(value is not None for value in self.filters.values()):
+                    self._rows = [pair for pair in ordered if self._matches(*pair)]
+                elif matches is not None:
+                    self._rows = [pair for pair in ordered if pair[0] in matches]
+                else:
+                    self._rows = list(ordered)
+        return self._rows
+
+    def _sorted_rows(self):
+        """현재 정렬 칼럼의 (정렬된 행 목록, 행 ID → 위치). 목록이 바뀔 때까지 재사용합니다."""
+        cached = self._sorted.get(self.sort_column)
+        if cached is None:
+            key = SORT_KEYS[self.sort_column]
+            ordered = sorted(self.by_key.items(), key=lambda pair: key(pair[1]))
+            cached = ordered, {row_key: position for position, (row_key, _) in enumerate(ordered)}
+            self._sorted[self.sort_column] = cached
+        return cached
+
+    def courses(self):
+        """필터 목록에 쓸 강좌명 (가나다순)."""
+        return sorted({item.course_name for item in self.items})
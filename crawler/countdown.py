@@ -0,0 +1,80 @@
+import datetime
+import heapq
+
+from utils.config import DEADLINE_ALERT_HOURS
+
+MINUTE = datetime.timedelta(minutes=1)
+
+
+class DeadlineScheduler:
+    """마감 시각으로 정렬한 최소 힙으로 마감(expire)과 마감 임박 알림(alert) 시점을 관리합니다.
+
+    힙에는 항목마다 다음에 일어날 일만 들어 있으므로 advance()는 그 사이에 시점이 지난
+    항목만 꺼내 처리하고, 나머지 항목은 건드리지 않습니다. 남은 시간 표시는 분 단위로만
+    바뀌므로 깨어날 시각도 다음 분 경계 또는 힙의 가장 이른 시점으로 맞춥니다.
+    alert_hooks에 등록한 함수는 알림 시점마다 (키, 남은 시간)으로 호출됩니다.
+    """
+
+    def __init__(self, alert_hours=DEADLINE_ALERT_HOURS):
+        self.alert_hours = sorted(alert_hours, reverse=True)
+        self.deadlines = {}  # 키 → 마감 일시
+        self.expired = set()
+        self._heap = []  # (시각, 순번, 키, 마감 일시, 알림 시간 또는 None)
+        self._counter = 0
+        self.alert_hooks = []
+
+    def _push(self, when, key, deadline, hours=None):
+        self._counter += 1
+        heapq.heappush(self._heap, (when, self._counter, key, deadline, hours))
+
+    def track(self, key, deadline, current_time):
+        """항목의 마감을 등록합니다. 이미 지난 알림 중 가장 가까운 것은 바로 알립니다."""
+        if self.deadlines.get(key) == deadline:
+            return
+        self.deadlines[key] = deadline
+        self.expired.discard(key)
+        if deadline <= current_time:
+            self._push(current_time, key, deadline)
+            return
+        passed = None
+        for hours in self.alert_hours:
+            alert_time = deadline - datetime.timedelta(hours=hours)
+            if alert_time > current_time:
+                self._push(alert_time, key, deadline, hours)
+            else:
+                passed = hours
+        if passed is not None:
+            self._push(current_time, key, deadline, passed)
+        self._push(deadline, key, deadline)
+
+    def sync(self, deadlines_by_key, current_time):
+        """{키: 마감 일시}와 같아지도록 새 항목은 등록하고 사라진 항목은 뺍니다."""
+        for key in [key for key in self.deadlines if key not in deadlines_by_key]:
+            del self.deadlines[key]  # 힙에 남은 항목은 꺼낼 때 무시
+            self.expired.discard(key)
+        for key, deadline in deadlines_by_key.items():
+            self.track(key, deadline, current_time)
+
+    def advance(self, current_time):
+        """current_time까지 시점이 지난 일을 꺼내 (새로 마감된 키 목록, [(키, 알림 시간)])을 반환합니다."""
+        expired = []
+        alerts = []
+        while self._heap and self._heap[0][0] <= current_time:
+            _, _, key, deadline, hours = heapq.heappop(self._heap)
+            if self.deadlines.get(key) != deadline:
+                continue  # 목록에서 빠졌거나 마감이 바뀐 항목
+            if hours is None:
+                self.expired.add(key)
+                expired.append(key)
+            else:
+                alerts.append((key, hours))
+                for hook in self.alert_hooks:
+                    hook(key, hours)
+        return expired, alerts
+
+    def next_wake(self, current_time):
+        """다음에 깨어날 시각. 다음 분 경계와 힙의 가장 이른 시점 중 빠른 쪽입니다."""
+        next_minute = current_time.replace(second=0, microsecond=0) + MINUTE
+        if self._heap and self._heap[0][0] < next_minute:
+            return self._heap[0][0]
+        return next_minute
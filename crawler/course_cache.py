@@ -0,0 +1,64 @@
+import json
+import os
+import re
+from threading import Lock
+
+from utils.config import COURSE_TITLE_CACHE_PATH
+
+
+def course_id_from_url(url):
+    """course/view.php?id=N 또는 ...&course=N 형식의 URL에서 강좌 ID를 추출합니다."""
+    pattern = r'[?&]id=(\d+)' if "course/view.php" in url else r'[?&]course=(\d+)'
+    match = re.search(pattern, url)
+    return match.group(1) if match else None
+
+
+class CourseTitleCache:
+    """강좌 ID → 강좌명 캐시. 실행 간에 JSON 파일로 유지됩니다."""
+
+    def __init__(self, path=COURSE_TITLE_CACHE_PATH):
+        self.path = path
+        self.titles = {}
+        self.lock = Lock()
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path=COURSE_TITLE_CACHE_PATH):
+        cache = cls(path)
+        try:
+            with open(path, encoding="utf-8") as f:
+                cache.titles = {str(k): v for k, v in json.load(f).items()}
+        except (OSError, ValueError):
+            pass
+        return cache
+
+    def get(self, course_id, default=None):
+        with self.lock:
+            return self.titles.get(str(course_id), default)
+
+    def set(self, course_id, title):
+        if not course_id or not title:
+            return
+        with self.lock:
+            if self.titles.get(str(course_id)) != title:
+                self.titles[str(course_id)] = title
+                self.dirty = True
+
+    def update_from_links(self, course_links):
+        """main()이 수집한 (강좌 URL, 강좌명) 목록으로 캐시를 채웁니다."""
+        for course_url, course_title in course_links:
+            self.set(course_id_from_url(course_url), course_title)
+
+    def save(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self.titles, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, self.path)
+                self.dirty = False
+            except OSError as e:
+                print(f"강좌명 캐시 저장 오류: {str(e)}")
@@ -0,0 +1,187 @@
+import datetime
+import re
+from functools import lru_cache
+
+from utils.config import UTC_OFFSET_HOURS
+
+# e-캠퍼스의 마감 시각은 모두 한국 시간 기준
+KST = datetime.timezone(datetime.timedelta(hours=UTC_OFFSET_HOURS), "KST")
+
+# 시각이 표시되지 않은 마감일은 그날 자정 직전까지로 간주
+END_OF_DAY = datetime.time(23, 59, 59)
+
+# 콘텐츠의 due_date 저장 형식 (문자열 정렬 = 시간순 정렬)
+DUE_FORMAT = "%Y-%m-%d %H:%M"
+
+# (정규식, 연도 포함 여부) - 앞에서부터 먼저 일치하는 형식을 사용
+DATE_PATTERNS = (
+    # 2025년 5월 3일, 2025-05-03, 2025.5.3, 2025/05/03
+    (re.compile(r'(\d{4})\s*[-년/.]\s*(\d{1,2})\s*[-월/.]\s*(\d{1,2})'), True),
+    # 25.05.03, 25-05-03, 25/05/03
+    (re.compile(r'(?<!\d)(\d{2})\s*[-/.]\s*(\d{1,2})\s*[-/.]\s*(\d{1,2})(?!\d)'), True),
+    # 5월 3일, 5/3
+    (re.compile(r'(?<!\d)(\d{1,2})\s*(?:월|月|/)\s*(\d{1,2})'), False),
+)
+
+# 위 형식을 한 번에 찾는 정규식. 같은 위치에서는 앞 형식이 우선하며, 일치한 형식은
+# lastindex(형식을 감싼 그룹 번호)로 구분 → (형식 순위, 연도 포함 여부, 그룹 수)
+DATE_PATTERN = re.compile('|'.join(f'({pattern.pattern})' for pattern, _ in DATE_PATTERNS))
+
+
+def _date_groups():
+    groups = {}
+    index = 1
+    for rank, (pattern, has_year) in enumerate(DATE_PATTERNS):
+        groups[index] = (rank, has_year, pattern.groups)
+        index += pattern.groups + 1
+    return groups
+
+
+DATE_GROUPS = _date_groups()
+
+# 날짜 뒤에 오는 시각: 오후 11:59, 23:59, 11:59 PM
+TIME_PATTERN = re.compile(
+    r'(오전|오후|AM|PM)?\s*(\d{1,2})\s*:\s*(\d{2})(?:\s*:\s*\d{2})?\s*(AM|PM)?',
+    re.IGNORECASE,
+)
+
+# 날짜가 여러 개일 때 마감일을 가리키는 표시. 마감/종료/due는 뒤의 날짜("종료: 5월 4일"),
+# 까지는 바로 앞의 날짜("5/3 까지 제출, 5/10 이후 공개")를 우선 사용
+DEADLINE_MARKER = re.compile(r'(마감|종료|due)|(까지)', re.IGNORECASE)
+
+# "2025-04-28 00:00 ~ 2025-05-04 23:59", "5월 3일 (토) ~ 5월 4일" 같은 기간은 끝 날짜를 마감일로 봄.
+# 첫 날짜 뒤의 '일', 괄호 속 요일, 시각을 건너뛰고 물결표를 찾음
+RANGE_SEPARATOR = re.compile(
+    r'\s*일?\s*(?:\([^)]*\))?\s*(?:' + TIME_PATTERN.pattern + r')?\s*[~～]\s*',
+    re.IGNORECASE,
+)
+
+# 날짜와 시각 사이에 올 수 있는 요일 표기 등을 감안한 탐색 범위
+TIME_SEARCH_WINDOW = 24
+
+
+def now():
+    """현재 한국 시간을 반환합니다."""
+    return datetime.datetime.now(KST)
+
+
+def end_of_day(date):
+    """날짜를 그날 23:59:59(KST) 마감 시각으로 변환합니다."""
+    return datetime.datetime.combine(date, END_OF_DAY, tzinfo=KST)
+
+
+def _parse_time(text, start, end):
+    """start 바로 뒤의 시각과 그 끝 위치. 없으면 (None, start)."""
+    match = TIME_PATTERN.search(text, start, min(start + TIME_SEARCH_WINDOW, end))
+    if not match:
+        return None, start
+
+    meridiem = (match.group(1) or match.group(4) or "").upper()
+    hour = int(match.group(2))
+    minute = int(match.group(3))
+    if meridiem in ("오후", "PM") and hour < 12:
+        hour += 12
+    elif meridiem in ("오전", "AM") and hour == 12:
+        hour = 0
+    if hour > 23 or minute > 59:
+        return None, start
+    return datetime.time(hour, minute), match.end()
+
+
+def parse_deadline(text, today=None):
+    """문자열에서 마감 일시를 찾아 KST 기준 datetime으로 반환합니다. 없으면 None.
+
+    연도가 없는 날짜(5월 3일)는 오늘 이전이면 다음 해로 봅니다.
+    시각이 없으면 그날 23:59:59로 간주합니다.
+    """
+    if not text:
+        return None
+
+    dates = _find_dates(text, today)
+    if len(dates) < 2:
+        return _deadline_at(text, dates, 0)[0] if dates else None
+
+    marker = DEADLINE_MARKER.search(text)
+    if marker and marker.group(2):
+        # "... 까지": 표시 바로 앞의 날짜
+        before = [i for i, (_, start, _, _) in enumerate(dates) if start < marker.start()]
+        if before:
+            return _deadline_at(text, dates, before[-1])[0]
+    elif marker:
+        after = [i for i, (_, start, _, _) in enumerate(dates) if start >= marker.end()]
+        if after:
+            return _pick_deadline(text, dates, after)
+    return _pick_deadline(text, dates, range(len(dates)))
+
+
+def _pick_deadline(text, dates, indexes):
+    """indexes 중 우선순위가 가장 높은 형식의 첫 날짜. 뒤에 "~ 날짜"가 이어지면 기간의 끝 날짜."""
+    index = min(indexes, key=lambda i: dates[i][0])
+    deadline, end = _deadline_at(text, dates, index)
+    while index + 1 < len(dates) and RANGE_SEPARATOR.fullmatch(text, end, dates[index + 1][1]):
+        index += 1
+        deadline, end = _deadline_at(text, dates, index)
+    return deadline
+
+
+def _deadline_at(text, dates, index):
+    """index번째 날짜와 뒤따르는 시각으로 (마감 일시, 시각까지 포함한 끝 위치)를 만듭니다."""
+    _, _, end, date = dates[index]
+    # 시각은 다음 날짜 앞까지만 찾음 ("5/3 ~ 5/4 23:59"의 23:59는 5/4의 시각)
+    limit = dates[index + 1][1] if index + 1 < len(dates) else len(text)
+    time_of_day, end = _parse_time(text, end, limit)
+    if time_of_day is None:
+        return end_of_day(date), end
+    return datetime.datetime.combine(date, time_of_day, tzinfo=KST), end
+
+
+def _find_dates(text, today):
+    """text의 날짜 후보 [(형식 순위, 시작, 끝, 날짜)] (위치순)."""
+    dates = []
+    for match in DATE_PATTERN.finditer(text):
+        rank, has_year, group_count = DATE_GROUPS[match.lastindex]
+        groups = match.groups()[match.lastindex:match.lastindex + group_count]
+        try:
+            if has_year:
+                year, month, day = (int(group) for group in groups)
+                if year < 100:
+                    year += 2000
+                date = datetime.date(year, month, day)
+            else:
+                today = today or now().date()
+                month, day = (int(group) for group in groups)
+                date = datetime.date(today.year, month, day)
+                if date < today:
+                    date = datetime.date(today.year + 1, month, day)
+        except ValueError:
+            # 5/32 같은 잘못된 날짜는 건너뛰고 다음 후보 확인
+            continue
+        dates.append((rank, match.start(), match.end(), date))
+    return dates
+
+
+def deadline_from_timestamp(timestamp):
+    """Unix 타임스탬프를 KST 마감 일시로 변환합니다."""
+    return datetime.datetime.fromtimestamp(timestamp, KST)
+
+
+def format_due(deadline):
+    """마감 일시를 콘텐츠의 due_date 문자열로 변환합니다."""
+    return deadline.astimezone(KST).strftime(DUE_FORMAT)
+
+
+@lru_cache(maxsize=1024)
+def parse_due_date(due_date):
+    """due_date 문자열을 KST 마감 일시로 되돌립니다.
+
+    이전 버전에서 저장된 날짜만 있는 값(YYYY-MM-DD)은 23:59:59로 간주합니다.
+    """
+    if len(due_date) == 10:
+        return end_of_day(datetime.date.fromisoformat(due_date))
+    return datetime.datetime.strptime(due_date, DUE_FORMAT).replace(tzinfo=KST)
+
+
+def days_until(deadline, today=None):
+    """오늘부터 마감일까지 남은 날짜 수 (시각은 무시)."""
+    today = today or now().date()
+    return (deadline.date() - today).days
@@ -0,0 +1,83 @@
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from utils.config import DETAIL_CACHE_SIZE, DETAIL_CACHE_TTL, DETAIL_FETCH_WORKERS
+
+
+class DetailCache:
+    """상세 페이지 파싱 결과를 링크별로 보관하는 LRU 캐시 (TTL 적용).
+
+    request()는 캐시에 없는 페이지를 작업 스레드에서 가져오고, 같은 링크를 이미 가져오는
+    중이면 요청을 합칩니다. 결과(실패하면 None)는 callback(link, detail)으로 전달되며
+    작업 스레드에서 호출될 수 있으므로 HUD는 이벤트 버스로 넘겨 받습니다.
+    """
+
+    def __init__(self, fetch, size=DETAIL_CACHE_SIZE, ttl=DETAIL_CACHE_TTL, workers=DETAIL_FETCH_WORKERS):
+        self.fetch = fetch  # link → 상세 정보 dict
+        self.size = size
+        self.ttl = ttl
+        self.lock = Lock()
+        self._entries = OrderedDict()  # link → (가져온 시각, 상세 정보)
+        self._waiting = {}  # 가져오는 중인 link → 콜백 목록
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="detail")
+
+    def get(self, link):
+        """캐시된 상세 정보. 없거나 TTL이 지났으면 None."""
+        with self.lock:
+            entry = self._entries.get(link)
+            if entry is None:
+                return None
+            fetched_at, detail = entry
+            if time.time() - fetched_at > self.ttl:
+                del self._entries[link]
+                return None
+            self._entries.move_to_end(link)
+            return detail
+
+    def _put(self, link, detail):
+        with self.lock:
+            self._entries[link] = (time.time(), detail)
+            self._entries.move_to_end(link)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def request(self, link, callback=None):
+        """상세 정보를 가져와 callback으로 전달합니다. 캐시에 있으면 바로 호출합니다."""
+        detail = self.get(link)
+        if detail is not None:
+            if callback:
+                callback(link, detail)
+            return
+        with self.lock:
+            if link in self._waiting:
+                if callback:
+                    self._waiting[link].append(callback)
+                return
+            self._waiting[link] = [callback] if callback else []
+        try:
+            self._executor.submit(self._load, link)
+        except RuntimeError:  # close() 이후 요청
+            with self.lock:
+                self._waiting.pop(link, None)
+
+    def prefetch(self, links, callback=None):
+        """여러 링크를 미리 가져옵니다 (앞쪽부터 순서대로 요청)."""
+        for link in links:
+            self.request(link, callback)
+
+    def _load(self, link):
+        detail = None
+        try:
+            detail = self.fetch(link)
+            self._put(link, detail)
+        except Exception as e:
+            print(f"상세 페이지 확인 오류: {str(e)}")
+        with self.lock:
+            callbacks = self._waiting.pop(link, [])
+        for callback in callbacks:
+            callback(link, detail)
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,67 @@
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils import tracing
+from utils.config import HTTP_POOL_SIZE, HTTP_RETRIES, TIMEOUT, USER_AGENT
+
+
+class SessionExpiredError(Exception):
+    """요청이 로그인 페이지로 리다이렉트된 경우 (세션 만료)."""
+
+
+class HttpSession:
+    """Selenium 로그인 세션의 쿠키를 재사용해 페이지를 HTTP로 직접 가져옵니다."""
+
+    def __init__(self, cookies=None, user_agent=USER_AGENT, pool_size=HTTP_POOL_SIZE):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=HTTP_RETRIES)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "User-Agent": user_agent,
+            "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+        })
+        for cookie in cookies or []:
+            self.session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain"),
+                path=cookie.get("path", "/"),
+            )
+
+    @classmethod
+    def from_driver(cls, driver):
+        """로그인된 드라이버의 쿠키를 복사해 세션을 만듭니다."""
+        return cls(driver.get_cookies())
+
+    def export_cookies(self):
+        """현재 쿠키를 생성자에 다시 넘길 수 있는 형태로 반환합니다."""
+        return [
+            {"name": cookie.name, "value": cookie.value, "domain": cookie.domain, "path": cookie.path}
+            for cookie in self.session.cookies
+        ]
+
+    def get(self, url, timeout=TIMEOUT):
+        """페이지 HTML을 반환합니다. 로그인 페이지로 돌아가면 SessionExpiredError."""
+        tracing.count("http_requests")
+        with tracing.span("http_get", url=url):
+            response = self.session.get(url, timeout=timeout)
+        response.raise_for_status()
+        if urlparse(response.url).path.startswith("/login"):
+            raise SessionExpiredError(f"세션이 만료되었습니다: {url}")
+        return response.text
+
+    def post_json(self, url, payload, timeout=TIMEOUT):
+        """JSON 본문으로 POST 요청을 보내고 JSON 응답을 반환합니다."""
+        tracing.count("http_requests")
+        with tracing.span("http_post", url=url):
+            response = self.session.post(url, json=payload, timeout=timeout)
+        response.raise_for_status()
+        if urlparse(response.url).path.startswith("/login"):
+            raise SessionExpiredError(f"세션이 만료되었습니다: {url}")
+        return response.json()
+
+    def close(self):
+        self.session.close()
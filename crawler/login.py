@@ -1,15 +1,145 @@
+from urllib.parse import urlparse
+
+from crawler.browser import wait_for_selector
+from utils.config import LOGIN_URL, TIMELINE_TIMEOUT, TIMEOUT
+
+# selenium의 By.ID / By.CSS_SELECTOR 값 (시작 시간 단축을 위해 selenium을 여기서 import하지 않음)
+BY_ID = "id"
+BY_CSS = "css selector"
+
+USERNAME_SELECTORS = [(BY_ID, "input-username"), (BY_CSS, "input[name='username']")]
+PASSWORD_SELECTORS = [(BY_ID, "input-password"), (BY_CSS, "input[name='password']")]
+SUBMIT_SELECTOR = (BY_CSS, "button[type='submit'], input[type='submit'], .btn-login")
+ERROR_SELECTOR = (BY_CSS, ".loginerrors, .alert, .alert-danger, .error")
+# 단계별로 기다릴 요소 (페이지 전체 로딩 완료 대신 사용)
+LOGIN_FORM_READY = "#input-username, input[name='username']"
+DASHBOARD_READY = ".course_box, .coursebox, .course-listitem"
+# 타임라인 블록은 스크립트로 채워지므로 일정 목록이나 빈 목록 안내가 나타나야 읽을 수 있음
+TIMELINE_BLOCK = ".block_timeline"
+TIMELINE_READY = (
+    ".block_timeline .list-group-item, .block_timeline [data-region='event-list-item'], "
+    ".block_timeline [data-region='empty-message'], .block_timeline [data-region='no-events-empty-message']"
+)
+
+
+def is_login_page(url):
+    """URL이 로그인 페이지(/login...)인지 확인합니다."""
+    return urlparse(url).path.startswith("/login")
+
+
 class Login:
+    """Selenium 드라이버로 e-캠퍼스 로그인 폼을 채워 제출합니다.
+
+    HUD와 CLI가 같은 절차를 사용하며, on_status 콜백으로 진행 상황을 전달받을 수 있습니다.
+    """
+
     def __init__(self, driver, username, password):
         self.driver = driver
         self.username = username
         self.password = password
 
-    def perform_login(self):
-        self.driver.get("https://ecampus.smu.ac.kr/login.php")
-        username_field = self.driver.find_element("name", "username")
-        password_field = self.driver.find_element("name", "password")
-        login_button = self.driver.find_element("name", "login")
+    def _find_first(self, selectors):
+        for by, value in selectors:
+            elements = self.driver.find_elements(by, value)
+            if elements:
+                return elements[0]
+        return None
+
+    def open_login_page(self):
+        self.driver.get(LOGIN_URL)
+        wait_for_selector(self.driver, LOGIN_FORM_READY)
+
+    def wait_for_dashboard(self):
+        """대시보드의 강좌 목록과 타임라인 블록이 그려질 때까지 기다립니다.
+
+        강좌 목록이나 타임라인(일정 또는 빈 목록 안내) 중 하나가 보이면 대시보드가 뜬 것으로 보므로
+        강좌가 없는 계정도 TIMEOUT까지 기다리지 않습니다. 타임라인 블록이 있으면 그 내용이 채워질
+        때까지 TIMELINE_TIMEOUT만큼 더 기다립니다.
+        """
+        try:
+            wait_for_selector(self.driver, f"{DASHBOARD_READY}, {TIMELINE_READY}")
+        except Exception:
+            print("대시보드 강좌 목록을 찾지 못했습니다. 현재 페이지로 계속 진행합니다.")
+            return
+        if not self.driver.find_elements(BY_CSS, TIMELINE_BLOCK):
+            return
+        try:
+            wait_for_selector(self.driver, TIMELINE_READY, timeout=TIMELINE_TIMEOUT)
+        except Exception:
+            print("타임라인 블록이 아직 그려지지 않았습니다. 타임라인 항목 없이 계속 진행합니다.")
+
+    def wait_for_result(self, login_page, timeout=TIMEOUT):
+        """로그인 페이지를 벗어나거나, 새로 열린 로그인 페이지에 오류 메시지가 보일 때까지 기다립니다.
+
+        login_page는 제출 전 페이지의 <html> 요소로, 제출 전부터 있던 안내 문구를
+        오류로 오인하지 않도록 페이지가 바뀐 뒤에만 오류 요소를 확인합니다.
+        """
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support import expected_conditions
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        page_replaced = expected_conditions.staleness_of(login_page)
+
+        def finished(driver):
+            if not is_login_page(driver.current_url):
+                return True
+            return page_replaced(driver) and bool(driver.find_elements(*ERROR_SELECTOR))
+
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(finished)
+        except TimeoutException:
+            print("로그인 결과 대기 시간 초과")
+
+    def perform_login(self, on_status=None):
+        """로그인을 시도하고 (성공 여부, 메시지)를 반환합니다."""
+        report = on_status or (lambda message: None)
+
+        if not is_login_page(self.driver.current_url):
+            print("로그인 페이지로 이동합니다.")
+            self.open_login_page()
+
+        id_field = self._find_first(USERNAME_SELECTORS)
+        pw_field = self._find_first(PASSWORD_SELECTORS)
+        if not id_field or not pw_field:
+            print("로그인 폼 요소를 찾을 수 없습니다. 페이지 소스 일부:")
+            print(self.driver.page_source[:500])
+            return False, "로그인 폼을 찾을 수 없습니다. 새로고침 후 다시 시도하세요."
+
+        id_field.clear()
+        id_field.send_keys(self.username)
+        print("아이디 입력 완료")
+        report("아이디 입력 완료, 비밀번호 처리 중...")
+
+        pw_field.clear()
+        pw_field.send_keys(self.password)
+        print("비밀번호 입력 완료")
+        report("로그인 정보 입력 완료, 로그인 시도 중...")
+
+        submit_buttons = self.driver.find_elements(*SUBMIT_SELECTOR)
+        if not submit_buttons:
+            print("로그인 버튼을 찾을 수 없습니다.")
+            return False, "로그인 버튼을 찾을 수 없습니다."
+
+        print("로그인 버튼 클릭")
+        report("로그인 진행 중입니다. 잠시만 기다려주세요...")
+        login_page = self.driver.find_element("tag name", "html")
+        submit_buttons[0].click()
+
+        print("로그인 결과 확인 중...")
+        report("로그인 확인 중입니다. 잠시만 기다려주세요...")
+        self.wait_for_result(login_page)
+
+        current_url = self.driver.current_url
+        print(f"현재 URL: {current_url}")
+        if not is_login_page(current_url):
+            print("로그인 성공으로 판단됨")
+            self.wait_for_dashboard()
+            return True, "로그인 성공! 데이터를 불러오는 중..."
 
-        username_field.send_keys(self.username)
-        password_field.send_keys(self.password)
-        login_button.click()
\ No newline at end of file
+        print("로그인 실패 - 페이지에 오류 메시지 확인 중")
+        error_elements = self.driver.find_elements(*ERROR_SELECTOR)
+        error_message = "알 수 없는 오류로 로그인에 실패했습니다."
+        if error_elements:
+            error_message = error_elements[0].text
+            print(f"오류 메시지: {error_message}")
+        return False, f"로그인 실패: {error_message}"
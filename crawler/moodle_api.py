@@ -0,0 +1,93 @@
+import datetime
+
+from crawler.deadline import KST, deadline_from_timestamp, format_due
+from utils.config import ECAMPUS_URL
+
+MODULE_TYPES = {
+    "assign": "과제",
+    "econtents": "영상",
+}
+
+
+class MoodleApiError(Exception):
+    """Moodle AJAX 웹서비스가 오류를 반환한 경우."""
+
+
+class MoodleAjaxSource:
+    """Moodle AJAX 웹서비스(/lib/ajax/service.php)에서 마감 일정을 JSON으로 가져옵니다.
+
+    대시보드 타임라인 블록이 사용하는 core_calendar_get_action_events_by_timesort를
+    로그인 세션의 sesskey로 직접 호출하므로, 페이지 수십 개를 여는 대신 한두 번의
+    요청으로 기간 내 일정을 모두 받을 수 있습니다.
+    """
+
+    PAGE_SIZE = 50
+    MAX_PAGES = 10
+
+    def __init__(self, session, sesskey, base_url=ECAMPUS_URL):
+        self.session = session
+        self.sesskey = sesskey
+        self.base_url = base_url
+        self.courses = {}  # 응답에 포함된 강좌 ID → 강좌명
+
+    def call(self, methodname, args):
+        url = f"{self.base_url}/lib/ajax/service.php?sesskey={self.sesskey}&info={methodname}"
+        response = self.session.post_json(url, [{"index": 0, "methodname": methodname, "args": args}])
+
+        # 세션/sesskey 오류는 목록이 아닌 단일 객체로 돌아옴
+        if not isinstance(response, list) or not response:
+            raise MoodleApiError(f"{methodname}: {response}")
+        result = response[0]
+        if result.get("error"):
+            exception = result.get("exception") or {}
+            raise MoodleApiError(f"{methodname}: {exception.get('message', exception)}")
+        return result.get("data") or {}
+
+    def get_action_events(self, timesort_from, timesort_to):
+        """기간 내 action 이벤트를 페이지 단위로 모두 가져옵니다."""
+        events = []
+        after_event_id = 0
+        for _ in range(self.MAX_PAGES):
+            data = self.call("core_calendar_get_action_events_by_timesort", {
+                "limitnum": self.PAGE_SIZE,
+                "timesortfrom": timesort_from,
+                "timesortto": timesort_to,
+                "aftereventid": after_event_id,
+            })
+            page = data.get("events", [])
+            events.extend(page)
+            if len(page) < self.PAGE_SIZE:
+                break
+            after_event_id = data.get("lastid") or page[-1]["id"]
+        return events
+
+    def collect(self, due_period, today=None):
+        """오늘부터 due_period일 이내 마감인 과제/영상을 콘텐츠 목록으로 반환합니다."""
+        today = today or datetime.datetime.now(KST).date()
+        start = datetime.datetime.combine(today, datetime.time.min, tzinfo=KST)
+        end = start + datetime.timedelta(days=due_period + 1)
+        events = self.get_action_events(int(start.timestamp()), int(end.timestamp()) - 1)
+
+        contents = []
+        for event in events:
+            content_type = MODULE_TYPES.get(event.get("modulename"))
+            if not content_type:
+                continue
+
+            course = event.get("course") or {}
+            course_name = (course.get("fullname") or "").replace("[천안]", "").strip()
+            if course.get("id") and course_name:
+                self.courses[str(course["id"])] = course_name
+
+            action = event.get("action") or {}
+            deadline = deadline_from_timestamp(event["timesort"])
+            contents.append({
+                "course": course_name,
+                "title": event.get("activityname") or event.get("name", ""),
+                "link": event.get("url", ""),
+                "due_date": format_due(deadline),
+                "status": "미제출" if action.get("actionable") else "확인필요",
+                "context": event.get("name", ""),
+                "type": content_type,
+            })
+        return contents
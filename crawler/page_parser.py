@@ -0,0 +1,192 @@
+import re
+from urllib.parse import urljoin
+
+import lxml.html
+
+from utils.config import ECAMPUS_URL
+
+NAME_HEADER_KEYWORDS = ["이름", "제목", "과제", "콘텐츠"]
+DUE_HEADER_KEYWORDS = ["기한", "마감", "종료", "due"]
+STATUS_HEADER_KEYWORDS = ["상태", "제출", "시청", "status"]
+
+
+def _has_class(*names):
+    """CSS 클래스 선택자에 해당하는 XPath 조건식을 만듭니다."""
+    return " or ".join(
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')" for name in names
+    )
+
+
+TIMELINE_BLOCKS_XPATH = f"//*[{_has_class('block_timeline', 'block_calendar_upcoming', 'block_myoverview')}]"
+BLOCK_TITLE_XPATH = f".//*[{_has_class('card-title', 'header')}]"
+EVENT_XPATH = f".//*[{_has_class('list-group-item', 'event')}]"
+COURSE_BOX_XPATH = f"//*[{_has_class('course_box', 'coursebox', 'course-listitem')}]"
+ACTIVITY_XPATH = f"//*[{_has_class('activity', 'modtype_assign', 'modtype_econtents', 'activityinstance', 'activity-item')}]"
+GENERALTABLE_XPATH = f"//table[{_has_class('generaltable')}]"
+SUBMISSION_STATUS_XPATH = (
+    f"//*[{_has_class('submissionstatustable')}]//*[{_has_class('c1')}] | //*[{_has_class('statedetails')}]"
+)
+PROGRESS_XPATH = f"//*[{_has_class('progress-bar', 'progresstext')}]"
+
+
+def parse_document(html):
+    """HTML 문자열(page_source 또는 HTTP 응답)을 한 번만 파싱합니다."""
+    if not html or not html.strip():
+        return None
+    return lxml.html.document_fromstring(html)
+
+
+def element_text(element, separator=" "):
+    """요소의 텍스트 조각을 공백을 정리해 이어 붙입니다."""
+    return separator.join(part.strip() for part in element.itertext() if part.strip())
+
+
+def _first_link(element, base_url):
+    for anchor in element.iter("a"):
+        href = anchor.get("href")
+        if href:
+            return urljoin(base_url, href), element_text(anchor)
+    return None, ""
+
+
+def find_column_indices(header_texts):
+    """헤더 텍스트에서 이름/기한/상태 칼럼 위치를 찾습니다."""
+    name_idx, due_idx, status_idx = 0, 1, 2
+    for i, header in enumerate(header_texts):
+        if any(keyword in header for keyword in NAME_HEADER_KEYWORDS):
+            name_idx = i
+        elif any(keyword in header for keyword in DUE_HEADER_KEYWORDS):
+            due_idx = i
+        elif any(keyword in header for keyword in STATUS_HEADER_KEYWORDS):
+            status_idx = i
+    return name_idx, due_idx, status_idx
+
+
+def parse_bulk_table(html, base_url=ECAMPUS_URL):
+    """과제/영상 일괄 페이지(index.php)의 첫 번째 generaltable을 읽습니다.
+
+    테이블이 없으면 None, 있으면 (칼럼 인덱스, 행 목록)을 반환합니다.
+    각 행은 title, link, due_text, status_text 키를 가집니다.
+    """
+    doc = parse_document(html)
+    if doc is None:
+        return None
+    tables = doc.xpath(GENERALTABLE_XPATH)
+    if not tables:
+        return None
+
+    rows = tables[0].xpath(".//tr")
+    if not rows:
+        return (0, 1, 2), []
+
+    header_texts = [element_text(th).lower() for th in rows[0].xpath("./th")]
+    name_idx, due_idx, status_idx = find_column_indices(header_texts)
+
+    items = []
+    for row in rows[1:]:
+        cells = row.xpath("./td")
+        if len(cells) <= name_idx:
+            continue
+        link, title = _first_link(cells[name_idx], base_url)
+        if not link:
+            continue
+        items.append({
+            "title": title,
+            "link": link,
+            "due_text": element_text(cells[due_idx]) if due_idx < len(cells) else None,
+            "status_text": element_text(cells[status_idx]) if status_idx < len(cells) else None,
+        })
+    return (name_idx, due_idx, status_idx), items
+
+
+def parse_course_links(html, base_url=ECAMPUS_URL):
+    """메인 페이지에서 (강좌 URL, 강좌명) 목록을 추출합니다.
+
+    강좌 박스에서 3개 미만이 발견되면 페이지의 모든 <a>를 확인합니다.
+    """
+    doc = parse_document(html)
+    if doc is None:
+        return []
+
+    course_links = []
+    for box in doc.xpath(COURSE_BOX_XPATH):
+        for anchor in box.iter("a"):
+            href = urljoin(base_url, anchor.get("href") or "")
+            if "course/view.php?id=" in href:
+                title = element_text(anchor).replace("[천안]", "").strip()
+                if title:
+                    course_links.append((href, title))
+                    break
+
+    if len(course_links) < 3:
+        for anchor in doc.iter("a"):
+            href = urljoin(base_url, anchor.get("href") or "")
+            if "course/view.php?id=" in href:
+                title = element_text(anchor).replace("[천안]", "").strip()
+                if title and len(title) > 3 and (href, title) not in course_links:
+                    course_links.append((href, title))
+    return course_links
+
+
+def parse_course_activities(html, base_url=ECAMPUS_URL):
+    """강좌 페이지의 과제/영상 활동을 title, link, text 목록으로 반환합니다."""
+    doc = parse_document(html)
+    if doc is None:
+        return []
+
+    activities = []
+    for item in doc.xpath(ACTIVITY_XPATH):
+        link, title = _first_link(item, base_url)
+        if not link or not title:
+            continue
+        if "mod/assign" not in link and "mod/econtents" not in link:
+            continue
+        activities.append({"title": title, "link": link, "text": element_text(item, "\n")})
+    return activities
+
+
+def parse_timeline_events(html, base_url=ECAMPUS_URL):
+    """대시보드의 타임라인/다가오는 일정 블록에서 과제/영상 이벤트를 추출합니다."""
+    doc = parse_document(html)
+    if doc is None:
+        return []
+
+    events = []
+    for block in doc.xpath(TIMELINE_BLOCKS_XPATH):
+        titles = block.xpath(BLOCK_TITLE_XPATH)
+        block_title = element_text(titles[0]) if titles else ""
+        for event in block.xpath(EVENT_XPATH):
+            link, title = _first_link(event, base_url)
+            if not link or not any(keyword in link for keyword in ['/mod/assign/', '/mod/econtents/']):
+                continue
+            events.append({
+                "block": block_title,
+                "title": title,
+                "link": link,
+                "text": element_text(event, "\n"),
+            })
+    return events
+
+
+def parse_detail_page(html):
+    """활동 상세 페이지의 본문 텍스트, 제출 상태, 진도율, 요약을 추출합니다."""
+    doc = parse_document(html)
+    if doc is None:
+        return {"text": "", "status_text": None, "progress_text": None, "context": None}
+
+    body = doc.find("body")
+    status_elems = doc.xpath(SUBMISSION_STATUS_XPATH)
+    progress_elems = doc.xpath(PROGRESS_XPATH)
+    main_content = doc.get_element_by_id("region-main", None)
+    return {
+        "text": element_text(body, "\n") if body is not None else "",
+        "status_text": element_text(status_elems[0]) if status_elems else None,
+        "progress_text": element_text(progress_elems[0]) if progress_elems else None,
+        "context": element_text(main_content, "\n")[:150] + "..." if main_content is not None else None,
+    }
+
+
+def parse_sesskey(html):
+    """페이지의 M.cfg 또는 로그아웃 링크에서 Moodle sesskey를 찾습니다."""
+    match = re.search(r'"sesskey"\s*:\s*"([^"]+)"', html or "") or re.search(r'sesskey=(\w+)', html or "")
+    return match.group(1) if match else None
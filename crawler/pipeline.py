@@ -0,0 +1,99 @@
+import bisect
+import heapq
+from threading import Lock
+
+from crawler.deadline import parse_due_date
+
+
+def due_key(content):
+    """마감 순 정렬 키. 마감이 같으면 링크와 제목 순으로 고정합니다."""
+    return (parse_due_date(content["due_date"]), content.get("link") or "", content.get("title") or "")
+
+
+def merge_sorted(*sorted_lists):
+    """마감 순으로 정렬된 목록들을 다시 정렬하지 않고 하나로 합칩니다."""
+    return list(heapq.merge(*sorted_lists, key=due_key))
+
+
+class ContentSink:
+    """수집 파이프라인의 마지막 단계. 중복을 걸러 마감 순서를 유지한 채 항목을 모읍니다.
+
+    항목은 bisect로 제자리에 삽입하므로 추가할 때마다 전체를 정렬하지 않습니다.
+    flush()는 마지막 flush 이후 새로 들어온 항목만 on_delta 콜백으로 넘기므로,
+    소비자(HUD)는 전체 목록 대신 변경분만 받습니다. 여러 작업 스레드에서 함께 사용합니다.
+    """
+
+    def __init__(self, on_delta=None, prepare=None):
+        self.on_delta = on_delta
+        self.prepare = prepare  # 삽입 전에 항목을 다듬는 함수 (분류 등)
+        self.lock = Lock()
+        self._items = []
+        self._keys = []
+        self._claimed = set()
+        self._pending = []
+
+    def claim(self, title, link):
+        """(제목, 링크)를 처음 보는 경우에만 True. 상세 페이지를 열기 전 중복 확인에 씁니다."""
+        with self.lock:
+            if (title, link) in self._claimed:
+                return False
+            self._claimed.add((title, link))
+            return True
+
+    def _insert(self, item):
+        if self.prepare:
+            self.prepare(item)
+        key = due_key(item)
+        index = bisect.bisect_right(self._keys, key)
+        self._keys.insert(index, key)
+        self._items.insert(index, item)
+        self._pending.append(item)
+
+    def add(self, item, claimed=False):
+        """항목을 추가합니다. claimed가 True이면 이미 claim()으로 중복을 확인한 항목입니다."""
+        with self.lock:
+            identity = (item["title"], item["link"])
+            if not claimed:
+                if identity in self._claimed:
+                    return False
+                self._claimed.add(identity)
+            self._insert(item)
+            return True
+
+    def extend(self, items):
+        """반복 가능한 항목들을 중복 없이 추가하고, 실제로 추가된 항목 목록을 반환합니다."""
+        return [item for item in items if self.add(item)]
+
+    def replace(self, update):
+        """update(item)이 돌려준 새 항목으로 바꾸고, 바뀐 항목 목록을 반환합니다.
+
+        이미 게시된 항목은 다른 스레드(HUD)가 읽고 있을 수 있으므로 고치지 않고 새 항목으로
+        교체합니다. update는 정렬 키(마감일, 링크, 제목)를 바꾸지 않아야 하며, 바꿀 필요가
+        없으면 None을 돌려줍니다.
+        """
+        with self.lock:
+            replaced = {}
+            for index, item in enumerate(self._items):
+                new_item = update(item)
+                if new_item is not None:
+                    self._items[index] = new_item
+                    replaced[id(item)] = new_item
+            self._pending = [replaced.get(id(item), item) for item in self._pending]
+            return list(replaced.values())
+
+    def flush(self):
+        """쌓인 변경분을 on_delta로 한 번에 전달합니다."""
+        with self.lock:
+            added, self._pending = self._pending, []
+        if added and self.on_delta:
+            self.on_delta(sorted(added, key=due_key))
+        return added
+
+    def items(self):
+        """현재 목록의 복사본 (마감 순)."""
+        with self.lock:
+            return list(self._items)
+
+    def __len__(self):
+        with self.lock:
+            return len(self._items)
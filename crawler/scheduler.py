@@ -0,0 +1,82 @@
+import time
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from utils.config import CRAWL_WORKERS
+
+
+def wait_while_paused(shared_data, interval=1):
+    """HUD에서 중단된 동안 대기합니다. 프로그램이 종료되면 False를 반환합니다."""
+    while not shared_data["running"] and not shared_data["exit"]:
+        time.sleep(interval)
+    return not shared_data["exit"]
+
+
+def _run_task(shared_data, label, func, args):
+    # 대기열에 있던 작업도 시작 직전에 중단/종료 상태를 확인
+    if not wait_while_paused(shared_data):
+        return
+    try:
+        func(*args)
+    except Exception as e:
+        print(f"{label} 처리 오류: {str(e)}")
+
+
+def run_course_tasks(course_links, make_tasks, shared_data, workers=CRAWL_WORKERS, on_progress=None):
+    """강좌별 페이지 요청을 제한된 크기의 스레드 풀에서 병렬로 실행합니다.
+
+    make_tasks(idx, course_url, course_title)는 (설명, 함수, 인자) 목록을 반환합니다.
+    중단 상태에서는 새 강좌를 제출하지 않고, 종료 시 남은 작업을 취소합니다.
+    on_progress(done, total)는 강좌 하나의 작업이 모두 끝날 때마다 호출됩니다.
+    """
+    max_pending = workers * 2
+    pending = set()
+    total = len(course_links)
+    progress = {"done": 0}
+    progress_lock = Lock()
+
+    def track_course(futures):
+        # 작업이 없는 강좌도 완료로 셈
+        remaining = {"count": len(futures) or 1}
+
+        def on_done(_=None):
+            with progress_lock:
+                remaining["count"] -= 1
+                if remaining["count"]:
+                    return
+                progress["done"] += 1
+                done = progress["done"]
+            if on_progress:
+                on_progress(done, total)
+
+        if not futures:
+            on_done()
+        for future in futures:
+            future.add_done_callback(on_done)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="course-crawl") as executor:
+        for idx, (course_url, course_title) in enumerate(course_links):
+            if not shared_data["running"] or shared_data["exit"]:
+                if not shared_data["exit"]:
+                    print("크롤링이 일시 중단되었습니다. HUD에서 '재시작' 버튼을 누르면 계속됩니다.")
+                if not wait_while_paused(shared_data):
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    return
+                print("크롤링을 재개합니다.")
+
+            futures = [
+                executor.submit(_run_task, shared_data, label, func, args)
+                for label, func, args in make_tasks(idx, course_url, course_title)
+            ]
+            pending.update(futures)
+            track_course(futures)
+
+            # 대기 작업 수를 제한해 중단 요청이 빠르게 반영되도록 함
+            while len(pending) >= max_pending:
+                _, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+        while pending:
+            if shared_data["exit"]:
+                executor.shutdown(wait=False, cancel_futures=True)
+                return
+            _, pending = wait(pending, timeout=1, return_when=FIRST_COMPLETED)
@@ -0,0 +1,73 @@
+from collections import defaultdict
+
+
+def ngrams(text):
+    """text의 한 글자와 두 글자 조각. 한글은 두 글자로도 충분히 후보가 좁혀집니다."""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+class SearchIndex:
+    """콘텐츠 검색용 n-gram 색인 (제목, 강좌명, 학수번호, 교수 이름).
+
+    문서마다 한 글자/두 글자 조각을 색인해 두고, 검색어의 조각이 모두 들어 있는 문서만
+    후보로 골라 실제 포함 여부를 확인합니다. update()는 새로 들어오거나 바뀐 문서만
+    다시 색인하므로 수집 중 목록이 조금씩 늘어날 때 전체를 다시 만들지 않습니다.
+    """
+
+    def __init__(self):
+        self.texts = {}  # 문서 ID → 검색 대상 문자열 (소문자)
+        self.postings = defaultdict(set)  # 조각 → 문서 ID 집합
+
+    @staticmethod
+    def document_text(item):
+        fields = (item.title, item.course_name, item.course_code, item.professor_name)
+        return "\n".join(field for field in fields if field).lower()
+
+    def add(self, key, text):
+        self.texts[key] = text
+        for gram in ngrams(text):
+            self.postings[gram].add(key)
+
+    def remove(self, key):
+        text = self.texts.pop(key, None)
+        if text is None:
+            return
+        for gram in ngrams(text):
+            keys = self.postings[gram]
+            keys.discard(key)
+            if not keys:
+                del self.postings[gram]
+
+    def update(self, items_by_key):
+        """{문서 ID: ContentItem}과 같아지도록 사라진 문서는 빼고 새 문서만 색인합니다."""
+        for key in [key for key in self.texts if key not in items_by_key]:
+            self.remove(key)
+        for key, item in items_by_key.items():
+            text = self.document_text(item)
+            if self.texts.get(key) != text:
+                self.remove(key)
+                self.add(key, text)
+
+    def search(self, query):
+        """공백으로 나눈 검색어가 모두 들어 있는 문서 ID 집합. 검색어가 비어 있으면 None."""
+        terms = query.lower().split()
+        if not terms:
+            return None
+        matches = None
+        for term in terms:
+            # 가장 적은 문서가 가진 조각부터 교집합을 구함
+            grams = {term} if len(term) < 2 else {term[i:i + 2] for i in range(len(term) - 1)}
+            grams = sorted(grams, key=lambda gram: len(self.postings.get(gram, ())))
+            candidates = set(self.postings.get(grams[0], ()))
+            for gram in grams[1:]:
+                if not candidates:
+                    break
+                candidates &= self.postings.get(gram, set())
+            if len(term) > 2:
+                candidates = {key for key in candidates if term in self.texts[key]}
+            matches = candidates if matches is None else matches & candidates
+            if not matches:
+                break
+        return matches
@@ -0,0 +1,136 @@
+import json
+import os
+import time
+
+from crawler.http_session import HttpSession, SessionExpiredError
+from utils.config import DASHBOARD_URL, SESSION_CACHE, SESSION_CACHE_PATH, SESSION_KEY_PATH, TIMEOUT
+
+
+class SessionCache:
+    """로그인 쿠키를 암호화해 저장하고, 다음 실행에서 아직 유효하면 로그인 없이 재사용합니다.
+
+    쿠키는 Fernet(AES-CBC + HMAC)으로 암호화하고 키는 본인만 읽을 수 있는 별도 파일에
+    보관합니다. cryptography 패키지가 없거나 SESSION_CACHE가 꺼져 있으면 아무것도 하지 않습니다.
+    """
+
+    def __init__(self, path=SESSION_CACHE_PATH, key_path=SESSION_KEY_PATH, enabled=SESSION_CACHE):
+        self.path = path
+        self.key_path = key_path
+        self.enabled = enabled
+
+    def _fernet(self, create=False):
+        try:
+            from cryptography.fernet import Fernet
+        except ImportError:
+            return None
+
+        try:
+            with open(self.key_path, "rb") as f:
+                return Fernet(f.read().strip())
+        except FileNotFoundError:
+            if not create:
+                return None
+        except (OSError, ValueError):
+            if not create:
+                return None
+            # 다른 스레드가 아직 쓰는 중일 수 있으므로 잠시 다시 읽어 보고,
+            # 그래도 읽을 수 없으면 손상된 키로 보고 지운 뒤 새로 만듦
+            fernet = self._read_key(Fernet)
+            if fernet is not None:
+                return fernet
+            try:
+                os.remove(self.key_path)
+            except OSError:
+                pass
+        key = Fernet.generate_key()
+        os.makedirs(os.path.dirname(self.key_path), exist_ok=True)
+        try:
+            # 여러 계정을 동시에 수집할 때 다른 스레드가 만든 키를 덮어쓰지 않도록 새 파일로만 생성
+            fd = os.open(self.key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            return self._read_key(Fernet)
+        with os.fdopen(fd, "wb") as f:
+            f.write(key)
+        return Fernet(key)
+
+    def _read_key(self, fernet_class, attempts=50):
+        """다른 스레드/프로세스가 먼저 만든 키를 읽습니다. 아직 쓰는 중이면 잠시 기다립니다."""
+        for _ in range(attempts):
+            try:
+                with open(self.key_path, "rb") as f:
+                    return fernet_class(f.read().strip())
+            except (OSError, ValueError):
+                time.sleep(0.01)
+        return None
+
+    def save(self, session, userid, due_period):
+        """로그인된 HTTP 세션의 쿠키를 암호화해 저장합니다."""
+        if not self.enabled:
+            return
+        try:
+            fernet = self._fernet(create=True)
+            if fernet is None:
+                print("cryptography 패키지가 없어 로그인 세션을 저장하지 않습니다.")
+                return
+            state = {
+                "userid": userid,
+                "due_period": due_period,
+                "cookies": session.export_cookies(),
+                "saved_at": time.time(),
+            }
+            token = fernet.encrypt(json.dumps(state).encode("utf-8"))
+            tmp_path = f"{self.path}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(token)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"로그인 세션 저장 오류: {str(e)}")
+
+    def load(self):
+        """저장된 세션 정보(dict)를 반환합니다. 없거나 복호화할 수 없으면 None."""
+        if not self.enabled:
+            return None
+        fernet = self._fernet()
+        if fernet is None:
+            return None
+        try:
+            with open(self.path, "rb") as f:
+                return json.loads(fernet.decrypt(f.read()))
+        except OSError:
+            return None
+        except Exception:
+            # 키가 바뀌었거나 파일이 손상된 경우
+            self.clear()
+            return None
+
+    def restore(self, userid=None, timeout=TIMEOUT):
+        """저장된 쿠키로 대시보드를 한 번 요청해 세션이 살아 있는지 확인합니다.
+
+        유효하면 (HTTP 세션, 대시보드 HTML, 저장된 정보)를, 아니면 None을 반환합니다.
+        userid가 주어지면 같은 사용자의 세션만 사용합니다.
+        """
+        state = self.load()
+        if not state or (userid and state.get("userid") != userid):
+            return None
+
+        session = HttpSession(state.get("cookies"))
+        try:
+            dashboard_html = session.get(DASHBOARD_URL, timeout=timeout)
+        except SessionExpiredError:
+            print("저장된 로그인 세션이 만료되었습니다. 다시 로그인합니다.")
+            session.close()
+            self.clear()
+            return None
+        except Exception as e:
+            print(f"저장된 로그인 세션 확인 실패: {str(e)}")
+            session.close()
+            return None
+        print(f"저장된 로그인 세션을 사용합니다. (ID: {state.get('userid')})")
+        return session, dashboard_html, state
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
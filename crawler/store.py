@@ -0,0 +1,162 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from threading import Lock
+
+from utils.config import STORE_PATH
+
+ITEM_FIELDS = ("link", "title", "course", "due_date", "status", "type", "context", "category", "detail_pending")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    link TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    course TEXT,
+    due_date TEXT,
+    status TEXT,
+    type TEXT,
+    context TEXT,
+    category TEXT,
+    detail_pending INTEGER,
+    source TEXT,
+    last_seen REAL
+);
+CREATE INDEX IF NOT EXISTS items_source ON items (source);
+CREATE INDEX IF NOT EXISTS items_last_seen ON items (last_seen);
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    index_fingerprint TEXT,
+    fetched_at REAL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def fingerprint(*parts):
+    """파싱 결과와 필터 조건으로 페이지 내용의 해시를 만듭니다."""
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class ContentStore:
+    """수집한 콘텐츠와 페이지 해시를 보관하는 로컬 SQLite 저장소.
+
+    페이지의 파싱 결과 해시가 지난 실행과 같으면 해당 페이지에서 나온 항목을
+    저장소에서 그대로 꺼내 쓰고, 상세 페이지 요청을 건너뜁니다. 강좌의 일괄 페이지가
+    강좌 페이지를 마지막으로 가져올 때와 같으면 강좌 페이지 자체도 요청하지 않습니다.
+    """
+
+    def __init__(self, path=STORE_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.lock = Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        with self.lock, self.conn:
+            self.conn.executescript(SCHEMA)
+            # 이전 버전에서 만든 저장소에는 없는 칼럼 추가
+            columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(items)")}
+            if "detail_pending" not in columns:
+                self.conn.execute("ALTER TABLE items ADD COLUMN detail_pending INTEGER")
+            columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(pages)")}
+            if "index_fingerprint" not in columns:
+                self.conn.execute("ALTER TABLE pages ADD COLUMN index_fingerprint TEXT")
+
+    def page_fingerprint(self, url):
+        with self.lock:
+            row = self.conn.execute("SELECT fingerprint FROM pages WHERE url = ?", (url,)).fetchone()
+        return row["fingerprint"] if row else None
+
+    def page_index_fingerprint(self, url, max_age=None):
+        """페이지를 저장할 때 함께 기록한 일괄 페이지 해시. max_age초보다 오래됐으면 None."""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT index_fingerprint, fetched_at FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+        if not row or (max_age is not None and time.time() - (row["fetched_at"] or 0) > max_age):
+            return None
+        return row["index_fingerprint"]
+
+    def page_items(self, url):
+        """해당 페이지에서 수집됐던 항목 목록을 반환합니다."""
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT {', '.join(ITEM_FIELDS)} FROM items WHERE source = ?", (url,)
+            ).fetchall()
+        return [self._row_to_item(row) for row in rows]
+
+    def save_page(self, url, page_fingerprint, items, index_fingerprint=None):
+        """페이지 해시와 그 페이지에서 나온 항목을 함께 교체 저장합니다.
+
+        index_fingerprint는 강좌 페이지를 가져올 때의 일괄 페이지 해시로, 다음 실행에서
+        일괄 페이지가 그대로이면 강좌 페이지 요청을 건너뛰는 데 씁니다.
+
+        last_seen은 실행이 끝날 때 save_items()만 기록합니다. 수집이 중간에 끊겨도 지난 실행의
+        목록이 그대로 남도록 기존 항목의 last_seen은 두고, 새 항목은 last_seen 없이 넣습니다.
+        """
+        with self.lock, self.conn:
+            self.conn.execute("UPDATE items SET source = NULL WHERE source = ?", (url,))
+            self._upsert(items, None, source=url)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO pages (url, fingerprint, index_fingerprint, fetched_at) VALUES (?, ?, ?, ?)",
+                (url, page_fingerprint, index_fingerprint, time.time()),
+            )
+
+    def save_items(self, items, seen_at=None, userid=None):
+        """이번 실행에서 확인된 항목의 last_seen을 갱신합니다 (출처는 유지).
+
+        userid는 이번 실행의 로그인 사용자로, load_items()가 다른 사용자에게 목록을 보이지 않도록 기록합니다.
+        """
+        with self.lock, self.conn:
+            self._upsert(items, seen_at or time.time())
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('userid', ?)", (userid,))
+
+    def load_items(self, seen_at=None, userid=None):
+        """seen_at 시점에 확인된 항목을 반환합니다. 생략하면 마지막으로 끝까지 수집한 실행 기준입니다.
+
+        userid가 주어지면 마지막 실행이 같은 사용자였을 때만 반환합니다.
+        """
+        with self.lock:
+            if userid is not None:
+                row = self.conn.execute("SELECT value FROM meta WHERE key = 'userid'").fetchone()
+                if not row or row["value"] != userid:
+                    return []
+            if seen_at is None:
+                row = self.conn.execute("SELECT MAX(last_seen) AS last FROM items").fetchone()
+                seen_at = row["last"]
+                if seen_at is None:
+                    return []
+            rows = self.conn.execute(
+                f"SELECT {', '.join(ITEM_FIELDS)} FROM items WHERE last_seen = ? ORDER BY due_date",
+                (seen_at,),
+            ).fetchall()
+        return [self._row_to_item(row) for row in rows]
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+    def _upsert(self, items, seen_at, source=None):
+        self.conn.executemany(
+            f"""INSERT INTO items ({', '.join(ITEM_FIELDS)}, source, last_seen)
+                VALUES ({', '.join('?' * (len(ITEM_FIELDS) + 2))})
+                ON CONFLICT(link) DO UPDATE SET
+                    {', '.join(f'{field} = excluded.{field}' for field in ITEM_FIELDS[1:])},
+                    source = COALESCE(excluded.source, items.source),
+                    last_seen = COALESCE(excluded.last_seen, items.last_seen)""",
+            [tuple(item.get(field) for field in ITEM_FIELDS) + (source, seen_at) for item in items],
+        )
+
+    @staticmethod
+    def _row_to_item(row):
+        item = {field: row[field] for field in ITEM_FIELDS}
+        if item["category"] is None:
+            del item["category"]
+        if not item["detail_pending"]:
+            del item["detail_pending"]
+        return item
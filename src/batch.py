@@ -0,0 +1,170 @@
+"""여러 계정을 한 프로세스에서 동시에 수집하는 일괄 모드 (CLI --accounts).
+
+    python src/main.py --cli --accounts accounts.csv --format csv -o all.csv
+    python src/main.py --cli --accounts accounts.csv --split -o out/
+
+계정 목록 파일은 한 줄에 '아이디,비밀번호' 하나씩 적습니다 (빈 줄과 #으로 시작하는 줄은 무시).
+계정마다 저장소와 로그인 세션 캐시를 따로 두고, Chrome은 BATCH_BROWSERS개만 띄워 로그인
+단계에서 돌려 씁니다. 로그인 이후 수집은 계정별 HTTP 세션으로 진행합니다.
+"""
+import contextlib
+import io
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from cli import EXIT_CONNECTION, EXIT_ERROR, EXIT_LOGIN_FAILED, EXIT_NO_CONTENT, EXIT_OK, EXIT_USAGE, collect, write_output
+
+ACCOUNT_LINE = re.compile(r"([^,\t]+?)\s*[,\t](.+)$")  # 첫 쉼표/탭까지가 아이디, 나머지는 비밀번호
+RESULT_LABELS = {
+    EXIT_OK: "성공",
+    EXIT_ERROR: "오류",
+    EXIT_LOGIN_FAILED: "로그인 실패",
+    EXIT_CONNECTION: "연결 불가",
+}
+
+
+@dataclass
+class AccountResult:
+    """한 계정의 수집 결과와 단계별 소요 시간(초)."""
+    userid: str
+    code: int
+    contents: list
+    timings: dict
+
+
+def read_accounts(path):
+    """계정 목록 파일에서 [(아이디, 비밀번호), ...]를 읽습니다."""
+    if path == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+
+    accounts = []
+    seen = set()
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        match = ACCOUNT_LINE.match(line)
+        if not match:
+            raise ValueError(f"{path}:{number}: '아이디,비밀번호' 형식이 아닙니다.")
+        userid, password = match.groups()
+        if userid in seen:
+            raise ValueError(f"{path}:{number}: 아이디가 중복되었습니다: {userid}")
+        seen.add(userid)
+        accounts.append((userid, password))
+    if not accounts:
+        raise ValueError(f"{path}: 계정이 없습니다.")
+    return accounts
+
+
+def account_slug(userid):
+    """계정별 파일 이름에 쓸 수 있도록 아이디의 특수 문자를 바꿉니다."""
+    return re.sub(r"[^\w.-]", "_", userid)
+
+
+def collect_accounts(accounts, args):
+    """계정들을 최대 --jobs개씩 동시에 수집하고 계정 순서대로 결과를 반환합니다."""
+    from crawler.browser import DriverPool
+    from crawler.course_cache import CourseTitleCache
+    from crawler.session_cache import SessionCache
+    from crawler.store import ContentStore
+    from utils import tracing
+    from utils.config import ACCOUNTS_DIR, BATCH_BROWSERS, BATCH_WORKERS, DATA_SOURCE
+
+    tracing.start_from_config()
+    pool = DriverPool(size=args.browsers or BATCH_BROWSERS)
+    course_titles = CourseTitleCache.load()  # 강좌명은 계정과 무관하므로 함께 사용
+    source = args.source or DATA_SOURCE
+
+    def run(account):
+        userid, password = account
+        slug = account_slug(userid)
+        # 같은 페이지라도 계정마다 제출 상태가 다르므로 저장소와 세션은 계정별로 분리
+        store = ContentStore(os.path.join(ACCOUNTS_DIR, f"{slug}.sqlite3"))
+        session_cache = SessionCache(path=os.path.join(ACCOUNTS_DIR, f"{slug}.session.bin"))
+        timings = {}
+        started = time.perf_counter()
+        try:
+            code, contents = collect(userid, password, args.period, source, pool, store, session_cache,
+                                     course_titles, timings)
+        finally:
+            store.close()
+        timings["total"] = time.perf_counter() - started
+        print(f"[{userid}] {RESULT_LABELS.get(code, code)}: {len(contents)}개, {timings['total']:.1f}초")
+        return AccountResult(userid, code, contents, timings)
+
+    try:
+        with ThreadPoolExecutor(max_workers=args.jobs or BATCH_WORKERS, thread_name_prefix="account") as executor:
+            return list(executor.map(run, accounts))
+    finally:
+        stats = pool.stats()
+        tabs = f", 정리한 탭 {stats['tabs_closed']}개" if stats['tabs_closed'] else ""
+        print(f"Chrome {stats['started']}개로 {len(accounts)}개 계정을 처리했습니다 "
+              f"(재사용 {stats['reused']}회{tabs}).")
+        pool.close()
+        tracing.finish()
+
+
+def print_report(results, stream):
+    """계정별 결과와 소요 시간을 표로 출력합니다."""
+    print("\n===== 계정별 수집 결과 =====", file=stream)
+    print(f"{'아이디':<14} {'결과':<8} {'로그인':>8} {'수집':>8} {'전체':>8} {'항목':>5}", file=stream)
+    for result in results:
+        timings = result.timings
+        login = "세션" if timings.get("restored") else (f"{timings['login']:.1f}s" if "login" in timings else "-")
+        crawl = f"{timings['crawl']:.1f}s" if "crawl" in timings else "-"
+        print(
+            f"{result.userid:<14} {RESULT_LABELS.get(result.code, result.code):<8} {login:>8} {crawl:>8} "
+            f"{timings.get('total', 0):7.1f}s {len(result.contents):>5}",
+            file=stream,
+        )
+
+
+def write_results(results, args, stdout):
+    """성공한 계정의 결과를 하나로 합치거나 (--split이면) 계정별 파일로 저장합니다."""
+    from crawler.deadline import parse_due_date
+    from utils.export import EXPORT_FIELDS
+
+    succeeded = [result for result in results if result.code == EXIT_OK]
+    if args.split:
+        os.makedirs(args.output, exist_ok=True)
+        for result in succeeded:
+            path = os.path.join(args.output, f"{account_slug(result.userid)}.{args.format}")
+            write_output(result.contents, args.format, path, stdout)
+        return
+
+    merged = [dict(content, account=result.userid) for result in succeeded for content in result.contents]
+    merged.sort(key=lambda content: parse_due_date(content["due_date"]))
+    write_output(merged, args.format, args.output, stdout, fields=("account",) + EXPORT_FIELDS)
+
+
+def run_batch(args):
+    """일괄 모드 진입점. 모든 계정이 성공하면 0, 아니면 처음 실패한 계정의 종료 코드를 반환합니다."""
+    try:
+        accounts = read_accounts(args.accounts)
+    except (OSError, ValueError) as e:
+        print(str(e), file=sys.stderr)
+        return EXIT_USAGE
+    if args.split and args.output == "-":
+        print("--split에는 결과를 저장할 디렉터리(-o)가 필요합니다.", file=sys.stderr)
+        return EXIT_USAGE
+
+    stdout = sys.stdout
+    log = io.StringIO() if args.quiet else sys.stderr
+    with contextlib.redirect_stdout(log):
+        results = collect_accounts(accounts, args)
+
+    code = next((result.code for result in results if result.code != EXIT_OK), EXIT_OK)
+    if code != EXIT_OK and args.quiet:
+        sys.stderr.write(log.getvalue()[-2000:])
+    print_report(results, sys.stderr)
+    write_results(results, args, stdout)
+    if code == EXIT_OK and args.fail_empty and not any(result.contents for result in results):
+        return EXIT_NO_CONTENT
+    return code
@@ -0,0 +1,213 @@
+"""디스플레이 없이 실행하는 CLI 모드 (cron, systemd 타이머 등 무인 실행용).
+
+    SMU_ID=20250000 SMU_PASSWORD=... python src/main.py --cli --format ics -o deadlines.ics
+    printf '%s\\n%s\\n' "$ID" "$PW" | python src/main.py --cli --format csv
+
+아이디/비밀번호는 환경 변수(SMU_ID, SMU_PASSWORD)에서 먼저 찾고, 없으면 표준 입력에서
+한 줄씩 읽습니다. 수집 로그는 표준 오류로 출력되므로 표준 출력에는 결과만 남습니다.
+"""
+import argparse
+import contextlib
+import getpass
+import io
+import os
+import sys
+import time
+
+EXIT_OK = 0
+EXIT_ERROR = 1  # 예기치 못한 오류
+EXIT_USAGE = 2  # 잘못된 인자, 로그인 정보 없음
+EXIT_LOGIN_FAILED = 3
+EXIT_CONNECTION = 4  # 학교 서버에 연결할 수 없음
+EXIT_NO_CONTENT = 5  # --fail-empty 지정 시 기간 내 콘텐츠가 없음
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="main.py --cli", description="SMU e-캠퍼스 마감 예정 콘텐츠 수집 (CLI)")
+    parser.add_argument("--cli", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("-f", "--format", choices=["json", "csv", "ics"], default="json", help="출력 형식 (기본: json)")
+    parser.add_argument("-o", "--output", default="-", help="출력 파일 경로 (기본: 표준 출력)")
+    parser.add_argument("-p", "--period", type=int, default=7, help="수집 기간 (일, 기본: 7)")
+    parser.add_argument("-u", "--user", help="아이디 (기본: 환경 변수 SMU_ID 또는 표준 입력)")
+    parser.add_argument("--source", choices=["ajax", "html"], help="수집 방식 (기본: 설정 파일의 DATA_SOURCE)")
+    parser.add_argument("--fail-empty", action="store_true", help="기간 내 콘텐츠가 없으면 종료 코드 5로 종료")
+    parser.add_argument("-q", "--quiet", action="store_true", help="수집 로그를 출력하지 않음")
+    batch = parser.add_argument_group("여러 계정 일괄 수집")
+    batch.add_argument("--accounts", metavar="FILE",
+                       help="'아이디,비밀번호' 형식의 계정 목록 파일 ('-'이면 표준 입력)")
+    batch.add_argument("-j", "--jobs", type=int, help="동시에 수집할 계정 수 (기본: 설정 파일의 BATCH_WORKERS)")
+    batch.add_argument("--browsers", type=int, help="로그인에 함께 쓸 Chrome 수 (기본: 설정 파일의 BATCH_BROWSERS)")
+    batch.add_argument("--split", action="store_true", help="계정별 파일로 저장 (-o는 디렉터리)")
+    return parser.parse_args(argv)
+
+
+def _read_line(prompt, secret=False):
+    if sys.stdin.isatty():
+        return getpass.getpass(prompt) if secret else input(prompt)
+    return sys.stdin.readline().rstrip("\r\n")
+
+
+def read_credentials(args):
+    """환경 변수 또는 표준 입력에서 (아이디, 비밀번호)를 읽습니다."""
+    userid = args.user or os.environ.get("SMU_ID") or _read_line("아이디: ")
+    password = os.environ.get("SMU_PASSWORD") or _read_line("비밀번호: ", secret=True)
+    if not userid or not password:
+        raise ValueError("아이디와 비밀번호가 필요합니다 (SMU_ID/SMU_PASSWORD 또는 표준 입력).")
+    return userid.strip(), password
+
+
+def open_session(userid, password, period, pool, session_cache):
+    """저장된 세션을 확인하거나 Chrome으로 로그인합니다.
+
+    (종료 코드, HTTP 세션, 대시보드 HTML, 저장된 세션 사용 여부)를 반환합니다.
+    """
+    import main
+    from crawler.http_session import HttpSession
+    from crawler.login import Login
+    from utils import tracing
+
+    # 같은 아이디의 저장된 세션이 아직 유효하면 Chrome을 쓰지 않음
+    restored = session_cache.restore(userid=userid)
+    if restored:
+        session, dashboard_html, _ = restored
+        return EXIT_OK, session, dashboard_html, True
+
+    with pool.driver() as driver:
+        login = Login(driver, userid, password)
+        try:
+            login.open_login_page()
+        except Exception as e:
+            print(f"[{userid}] 서버 연결 오류: {str(e)}")
+            return (EXIT_CONNECTION if main.is_connection_error(e) else EXIT_ERROR), None, None, False
+
+        with tracing.span("login", userid=userid):
+            success, message = login.perform_login()
+        if not success:
+            print(f"[{userid}] {message}")
+            return EXIT_LOGIN_FAILED, None, None, False
+
+        dashboard_html = driver.page_source
+        session = HttpSession.from_driver(driver)
+    session_cache.save(session, userid, period)
+    return EXIT_OK, session, dashboard_html, False
+
+
+def crawl_once(session, dashboard_html, period, source, store, course_titles, dashboard_rendered=True,
+               userid=None):
+    """로그인된 세션으로 기간 내 마감 콘텐츠를 한 번 수집합니다 (HUD 없이).
+
+    dashboard_html을 Chrome이 아닌 HTTP로 받았으면 dashboard_rendered=False로 넘깁니다.
+    userid는 저장소에 수집한 사용자로 기록됩니다.
+    """
+    import main
+    from utils.events import EventBus
+
+    shared_data = dict(main.shared_data)
+    shared_data.update({
+        "events": EventBus(),  # 구독하는 HUD가 없으므로 이벤트는 쌓이기만 함
+        "running": True,
+        "exit": False,
+        "due_period": period,
+        "userid": userid,
+    })
+    return main.crawl_contents(session, dashboard_html, course_titles, store, shared_data, data_source=source,
+                               dashboard_rendered=dashboard_rendered) or []
+
+
+def collect(userid, password, period, source, pool, store, session_cache, course_titles, timings=None):
+    """한 계정의 로그인부터 수집까지 실행하고 (종료 코드, 콘텐츠 목록)을 반환합니다.
+
+    timings가 주어지면 로그인(login)과 수집(crawl)에 걸린 시간을 초 단위로 기록합니다.
+    계정별 상태는 모두 인자로 받으므로 여러 계정을 동시에 수집할 수 있습니다.
+    """
+    import main
+
+    timings = {} if timings is None else timings
+    session = None
+    try:
+        started = time.perf_counter()
+        code, session, dashboard_html, timings["restored"] = open_session(userid, password, period, pool,
+                                                                          session_cache)
+        if code != EXIT_OK:
+            return code, []
+        timings["login"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        contents = crawl_once(session, dashboard_html, period, source, store, course_titles,
+                              dashboard_rendered=not timings["restored"], userid=userid)
+        timings["crawl"] = time.perf_counter() - started
+        return EXIT_OK, contents
+    except Exception as e:
+        print(f"[{userid}] 수집 중 오류 발생: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return (EXIT_CONNECTION if main.is_connection_error(e) else EXIT_ERROR), []
+    finally:
+        if session:
+            session.close()
+
+
+def collect_single(args, userid, password):
+    """CLI 기본 모드: 한 계정을 기본 저장소와 세션 캐시로 수집합니다."""
+    from crawler.browser import DriverPool
+    from crawler.course_cache import CourseTitleCache
+    from crawler.session_cache import SessionCache
+    from crawler.store import ContentStore
+    from utils import tracing
+    from utils.config import DATA_SOURCE
+
+    tracing.start_from_config()
+    store = ContentStore()
+    pool = DriverPool(size=1, reuse=False)  # 로그인 직후 브라우저 종료
+    try:
+        return collect(userid, password, args.period, args.source or DATA_SOURCE, pool, store,
+                       SessionCache(), CourseTitleCache.load())
+    finally:
+        pool.close()
+        store.close()
+        tracing.finish()
+
+
+def write_output(contents, fmt, output, stdout, **options):
+    """결과를 output 경로('-'이면 표준 출력)에 fmt 형식으로 씁니다. options는 내보내기 함수에 전달됩니다."""
+    from utils.export import EXPORTERS
+
+    exporter = EXPORTERS[fmt]
+    if output == "-":
+        exporter(contents, stdout, **options)
+        stdout.flush()
+        return
+    # 수집 도중 실패해도 이전 결과 파일이 깨지지 않도록 임시 파일에 쓴 뒤 교체
+    temp_path = f"{output}.tmp"
+    with open(temp_path, "w", encoding="utf-8", newline="") as f:
+        exporter(contents, f, **options)
+    os.replace(temp_path, output)
+
+
+def run_cli(argv):
+    """CLI 모드 진입점. 종료 코드를 반환합니다."""
+    args = parse_args(argv)
+    if args.accounts:
+        from batch import run_batch
+        return run_batch(args)
+
+    try:
+        userid, password = read_credentials(args)
+    except (ValueError, EOFError) as e:
+        print(str(e) or "아이디와 비밀번호가 필요합니다.", file=sys.stderr)
+        return EXIT_USAGE
+
+    stdout = sys.stdout
+    log = io.StringIO() if args.quiet else sys.stderr
+    with contextlib.redirect_stdout(log):
+        code, contents = collect_single(args, userid, password)
+    if code != EXIT_OK:
+        if args.quiet:
+            sys.stderr.write(log.getvalue()[-2000:])
+        return code
+
+    write_output(contents, args.format, args.output, stdout)
+    print(f"{args.period}일 이내 마감 예정 콘텐츠 {len(contents)}개", file=sys.stderr)
+    if args.fail_empty and not contents:
+        return EXIT_NO_CONTENT
+    return EXIT_OK
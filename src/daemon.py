@@ -0,0 +1,277 @@
+"""로그인 세션을 유지하며 주기적으로 다시 수집하고, 결과를 localhost HTTP API로 제공하는 데몬 모드.
+
+    SMU_ID=20250000 SMU_PASSWORD=... python src/main.py --daemon
+    curl http://127.0.0.1:8765/contents
+    curl 'http://127.0.0.1:8765/contents?format=ics&days=3'
+    curl -X POST http://127.0.0.1:8765/refresh
+
+수집 간격은 가장 가까운 마감까지 남은 시간에 맞춰 DAEMON_MIN_INTERVAL ~ DAEMON_MAX_INTERVAL
+사이에서 조절됩니다. HUD도 데몬이 실행 중이면 로그인 대신 이 API의 목록을 표시합니다.
+
+API
+    GET  /contents  현재 목록 (format=json|csv|ics, days=N 으로 기간 축소)
+    GET  /status    마지막 수집 시각, 다음 수집 예정 시각, 항목 수 등
+    POST /refresh   즉시 다시 수집
+"""
+import argparse
+import io
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from utils.config import DAEMON_HOST, DAEMON_MAX_INTERVAL, DAEMON_MIN_INTERVAL, DAEMON_PORT
+
+CONTENT_TYPES = {
+    "json": "application/json; charset=utf-8",
+    "csv": "text/csv; charset=utf-8",
+    "ics": "text/calendar; charset=utf-8",
+}
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="main.py --daemon", description="SMU e-캠퍼스 마감 콘텐츠 수집 데몬")
+    parser.add_argument("--daemon", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, default=DAEMON_PORT, help=f"API 포트 (기본: {DAEMON_PORT})")
+    parser.add_argument("-p", "--period", type=int, default=14, help="수집 기간 (일, 기본: 14)")
+    parser.add_argument("-u", "--user", help="아이디 (기본: 환경 변수 SMU_ID 또는 표준 입력)")
+    parser.add_argument("--source", choices=["ajax", "html"], help="수집 방식 (기본: 설정 파일의 DATA_SOURCE)")
+    return parser.parse_args(argv)
+
+
+def refresh_interval(contents, current_time=None):
+    """다음 수집까지 기다릴 시간(초). 가장 가까운 마감까지 남은 시간의 1/4을 최소/최대 간격 사이로 맞춥니다."""
+    from crawler.deadline import now, parse_due_date
+
+    current_time = current_time or now()
+    remaining = [
+        (parse_due_date(content["due_date"]) - current_time).total_seconds()
+        for content in contents
+    ]
+    upcoming = [seconds for seconds in remaining if seconds > 0]
+    if not upcoming:
+        return DAEMON_MAX_INTERVAL
+    return max(DAEMON_MIN_INTERVAL, min(DAEMON_MAX_INTERVAL, min(upcoming) / 4))
+
+
+class ContentsSnapshot:
+    """마지막 수집 결과. API 스레드들이 읽고 수집 스레드만 교체합니다."""
+
+    def __init__(self, period):
+        self.lock = threading.Lock()
+        self.period = period
+        self.contents = []
+        self.updated_at = None
+        self.next_refresh = None
+        self.last_error = None
+        self.refreshing = False
+        self._encoded = {}
+
+    def update(self, contents, next_refresh):
+        with self.lock:
+            self.contents = list(contents)
+            self.updated_at = time.time()
+            self.next_refresh = next_refresh
+            self.last_error = None
+            self._encoded = {}  # 형식별 응답 본문은 다음 요청 때 다시 만듦
+
+    def fail(self, message, next_refresh):
+        with self.lock:
+            self.last_error = message
+            self.next_refresh = next_refresh
+
+    def _summary(self):
+        return {
+            "period": self.period,
+            "count": len(self.contents),
+            "updated_at": self.updated_at,
+            "next_refresh": self.next_refresh,
+        }
+
+    def status(self):
+        with self.lock:
+            return {**self._summary(), "refreshing": self.refreshing, "last_error": self.last_error}
+
+    def encoded(self, fmt, days=None):
+        """목록을 fmt 형식으로 직렬화한 본문을 반환합니다. 기간 축소가 없으면 결과를 재사용합니다."""
+        from crawler.deadline import days_until, parse_due_date
+        from utils.export import EXPORTERS, export_rows
+
+        with self.lock:
+            key = (fmt, days)
+            if key in self._encoded:
+                return self._encoded[key]
+            contents = self.contents
+            if days is not None:
+                contents = [content for content in contents if days_until(parse_due_date(content["due_date"])) <= days]
+            buffer = io.StringIO()
+            if fmt == "json":
+                json.dump({**self._summary(), "contents": export_rows(contents)}, buffer, ensure_ascii=False)
+            else:
+                EXPORTERS[fmt](contents, buffer)
+            body = buffer.getvalue().encode("utf-8")
+            if days is None:
+                self._encoded[key] = body
+            return body
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    server_version = "SMUCollectorDaemon/1.0"
+
+    def log_message(self, format, *args):
+        pass  # 요청마다 로그를 남기지 않음
+
+    def _send(self, status, body, content_type="application/json; charset=utf-8"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status, payload):
+        self._send(status, json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        snapshot = self.server.snapshot
+        if url.path == "/status":
+            self._send_json(200, snapshot.status())
+        elif url.path == "/contents":
+            fmt = query.get("format", ["json"])[0]
+            if fmt not in CONTENT_TYPES:
+                self._send_json(400, {"error": f"지원하지 않는 형식: {fmt}"})
+                return
+            try:
+                days = int(query["days"][0]) if "days" in query else None
+            except ValueError:
+                self._send_json(400, {"error": "days는 정수여야 합니다."})
+                return
+            self._send(200, snapshot.encoded(fmt, days), CONTENT_TYPES[fmt])
+        else:
+            self._send_json(404, {"error": "없는 경로입니다."})
+
+    def do_POST(self):
+        if urlparse(self.path).path != "/refresh":
+            self._send_json(404, {"error": "없는 경로입니다."})
+            return
+        self.server.refresh_requested.set()
+        self._send_json(202, {"refreshing": True})
+
+
+def start_api(snapshot, refresh_requested, port=DAEMON_PORT, host=DAEMON_HOST):
+    """API 서버를 백그라운드 스레드에서 시작하고 서버 객체를 반환합니다."""
+    server = ThreadingHTTPServer((host, port), ApiHandler)
+    server.daemon_threads = True
+    server.snapshot = snapshot
+    server.refresh_requested = refresh_requested
+    threading.Thread(target=server.serve_forever, name="daemon-api", daemon=True).start()
+    print(f"API 서버 시작: http://{host}:{server.server_address[1]}/contents")
+    return server
+
+
+def fetch_snapshot(port=DAEMON_PORT, host=DAEMON_HOST, timeout=0.5):
+    """실행 중인 데몬의 목록(JSON)을 가져옵니다. 데몬이 없으면 None."""
+    from urllib.error import URLError
+    from urllib.request import urlopen
+
+    try:
+        with urlopen(f"http://{host}:{port}/contents", timeout=timeout) as response:
+            return json.load(response)
+    except (URLError, OSError, ValueError):
+        return None
+
+
+def serve(userid, password, period, source, port):
+    """로그인 세션을 유지하며 주기적으로 수집합니다. 로그인 정보가 틀리면 종료 코드를 반환합니다."""
+    from cli import EXIT_LOGIN_FAILED, EXIT_OK, crawl_once, open_session
+    from crawler.browser import DriverPool
+    from crawler.course_cache import CourseTitleCache
+    from crawler.http_session import SessionExpiredError
+    from crawler.session_cache import SessionCache
+    from crawler.store import ContentStore
+    from utils.config import DASHBOARD_URL
+
+    snapshot = ContentsSnapshot(period)
+    refresh_requested = threading.Event()
+    api = start_api(snapshot, refresh_requested, port)
+    pool = DriverPool(size=1, reuse=False)  # 로그인(재로그인) 때만 Chrome 실행
+    store = ContentStore()
+    session_cache = SessionCache()
+    course_titles = CourseTitleCache.load()
+    session = None
+    try:
+        while True:
+            snapshot.refreshing = True
+            logged_in = False
+            dashboard_rendered = False  # Chrome으로 방금 로그인한 경우에만 타임라인 블록이 그려져 있음
+            try:
+                if session is None:
+                    logged_in = True
+                    code, session, dashboard_html, restored = open_session(userid, password, period, pool, session_cache)
+                    dashboard_rendered = not restored
+                    if code == EXIT_LOGIN_FAILED:
+                        return code
+                    if code != EXIT_OK:
+                        raise ConnectionError("로그인 페이지에 연결할 수 없습니다.")
+                else:
+                    # 대시보드 요청이 세션 유지와 만료 확인을 겸함
+                    dashboard_html = session.get(DASHBOARD_URL)
+                contents = crawl_once(session, dashboard_html, period, source, store, course_titles,
+                                      dashboard_rendered=dashboard_rendered, userid=userid)
+                interval = refresh_interval(contents)
+                snapshot.update(contents, time.time() + interval)
+                print(f"{len(contents)}개 항목 수집, {interval / 60:.0f}분 뒤 다시 수집합니다.")
+            except SessionExpiredError as e:
+                session.close()
+                session = None
+                session_cache.clear()
+                if not logged_in:
+                    print("로그인 세션이 만료되어 다시 로그인합니다.")
+                    continue
+                # 방금 로그인한 세션도 만료되면 바로 재시도하지 않고 잠시 기다림
+                interval = DAEMON_MIN_INTERVAL
+                snapshot.fail(str(e), time.time() + interval)
+            except Exception as e:
+                interval = DAEMON_MIN_INTERVAL
+                snapshot.fail(str(e), time.time() + interval)
+                print(f"수집 실패, {interval / 60:.0f}분 뒤 다시 시도합니다: {str(e)}")
+            finally:
+                snapshot.refreshing = False
+
+            # 예정 시각이 되거나 POST /refresh 요청이 오면 다시 수집
+            refresh_requested.wait(interval)
+            refresh_requested.clear()
+    finally:
+        api.shutdown()
+        api.server_close()
+        if session:
+            session.close()
+        pool.close()
+        store.close()
+
+
+def run_daemon(argv):
+    """데몬 모드 진입점. Ctrl+C로 종료합니다."""
+    from cli import EXIT_OK, EXIT_USAGE, read_credentials
+
+    args = parse_args(argv)
+    try:
+        userid, password = read_credentials(args)
+    except (ValueError, EOFError) as e:
+        print(str(e) or "아이디와 비밀번호가 필요합니다.", file=sys.stderr)
+        return EXIT_USAGE
+
+    from utils.config import DATA_SOURCE
+
+    try:
+        return serve(userid, password, args.period, args.source or DATA_SOURCE, args.port)
+    except OSError as e:
+        print(f"API 서버를 시작할 수 없습니다 (포트 {args.port}): {str(e)}", file=sys.stderr)
+        return EXIT_USAGE
+    except KeyboardInterrupt:
+        print("데몬을 종료합니다.")
+        return EXIT_OK
@@ -1,41 +1,93 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+import os
+import sys
 import time
+
+STARTED_AT = time.perf_counter()  # 시작 시간 측정 기준
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# selenium, webdriver_manager, requests, tkinter는 실제로 필요한 시점에 불러옴 (시작 시간 단축)
+import bisect
 import re
 import datetime
-import tkinter as tk
-from tkinter import ttk, font, StringVar, IntVar
 import webbrowser
+from dataclasses import replace
+from operator import attrgetter
 from threading import Thread, Event
 
+from crawler.browser import start_chrome, wait_for_selector
+from crawler.login import LOGIN_FORM_READY, Login
+from crawler.page_parser import (
+    parse_bulk_table,
+    parse_course_activities,
+    parse_course_links,
+    parse_detail_page,
+    parse_sesskey,
+    parse_timeline_events,
+)
+from crawler.moodle_api import MoodleAjaxSource
+from crawler.scheduler import run_course_tasks
+from crawler.deadline import (
+    days_until,
+    end_of_day,
+    format_due,
+    now as now_kst,
+    parse_deadline,
+    parse_due_date,
+)
+from crawler.content import ContentItem, ContentTable, Status
+from crawler.countdown import DeadlineScheduler
+from crawler.detail_cache import DetailCache
+from crawler.course_cache import CourseTitleCache, course_id_from_url
+from crawler.pipeline import ContentSink, due_key, merge_sorted
+from crawler.store import ContentStore, fingerprint
+from utils.events import (
+    ContentsAdded,
+    ContentsUpdated,
+    CrawlCompleted,
+    CrawlProgress,
+    DetailLoaded,
+    EventBus,
+    LoginStatus,
+    SessionRestored,
+    StatusMessage,
+)
+from utils import tracing
+from utils.tracing import StartupTimer
+from utils.config import (
+    COURSE_PAGE_MAX_AGE,
+    DAEMON_POLL_INTERVAL,
+    DASHBOARD_URL,
+    DATA_SOURCE,
+    DETAIL_PREFETCH,
+    ECAMPUS_URL,
+    INCREMENTAL_CRAWL,
+    LAZY_DETAILS,
+    LOGIN_URL,
+)
+
+startup = StartupTimer(STARTED_AT)
+startup.mark("imports")
+
 shared_data = {
-    "contents": [],  # 수집된 콘텐츠 목록
+    "contents": [],  # HUD 시작 시 표시할 콘텐츠 목록 (지난 실행 결과)
+    "cached_contents": [],  # 아직 다시 확인되지 않은 지난 실행 결과
+    "events": None,  # 크롤러 → HUD 이벤트 버스 (utils.events.EventBus)
     "running": True,  # 크롤링 실행 상태
     "exit": False,  # 프로그램 종료 여부
-    "updated": False,  # HUD 업데이트 여부
-    "crawling_complete": False,  # 크롤링 완료 여부
     "driver": None,  # Selenium 드라이버 객체
-    "control_var": None,  # 컨트롤 버튼 텍스트 변수
-    "control_button": None,  # 컨트롤 버튼 객체
     "login_attempted": False,  # 로그인 시도 여부
     "login_successful": False,  # 로그인 성공 여부
     "login_event": None,  # 로그인 이벤트 객체
-    "due_period": 7,  # 기본값 1주일(7일)
-    "login_status_var": None,  # 로그인 상태 메시지 변수
-    "status_label": None  # 상태 메시지 레이블
+    "userid": None,  # 로그인한 아이디 (로그인 세션 저장용)
+    "due_period": 7  # 기본값 1주일(7일)
 }
 
-def calculate_remaining_time(deadline):
-    """마감일까지 남은 시간을 계산 (Nd HH:MM 형식)"""
-    now = datetime.datetime.now()
-    if isinstance(deadline, datetime.date):
-        deadline = datetime.datetime.combine(deadline, datetime.time(23, 59, 59))
-    
-    time_diff = deadline - now
+UNKNOWN_COURSE = "미확인 강좌"
+
+def calculate_remaining_time(deadline, current_time=None):
+    """마감 일시까지 남은 시간을 계산 (Nd HH:MM 형식)"""
+    time_diff = deadline - (current_time or now_kst())
     total_seconds = max(0, time_diff.total_seconds())
     
     days = int(total_seconds // (24 * 3600))
@@ -44,33 +96,12 @@ def calculate_remaining_time(deadline):
     
     return f"{days}d {hours:02d}:{minutes:02d}"
 
-def extract_course_details(course_name):
-    """과목명에서 학수번호와 교수 이름을 분리."""
-    course_code = None
-    professor_name = None
-    
-    # 학수번호 추출 (예: HBXX0000 형식)
-    course_code_match = re.search(r'\b[A-Z]{2,4}\d{4}\b', course_name)
-    if course_code_match:
-        course_code = course_code_match.group()
-        course_name = course_name.replace(course_code, "").strip()
-    
-    # 교수 이름 추출 (예: '최영훈' 형식)
-    professor_name_match = re.search(r'[가-힣]{2,4}', course_name)
-    if professor_name_match:
-        professor_name = professor_name_match.group()
-        course_name = course_name.replace(professor_name, "").strip()
-    
-    course_name = re.sub(r'\[.*?\]', '', course_name)  # 대괄호 내용 제거
-    # ')' 이후 남은 내용 제거
-    if '(' in course_name:
-        course_name = course_name.split('(')[0]
-    course_name = course_name.strip()
-    
-    return course_name, course_code, professor_name
-
 def create_hud(shared_data):
     """외부 HUD 창을 생성하여 마감 예정 콘텐츠를 표시합니다."""
+    # CLI 모드는 디스플레이가 없는 환경에서도 실행되도록 tkinter를 HUD에서만 불러옴
+    import tkinter as tk
+    from tkinter import ttk, font, StringVar, IntVar
+    
     root = tk.Tk()
     root.title("SMU eCampus 마감 예정 콘텐츠")
     root.geometry("950x600")  # 창 크기 조정
@@ -114,7 +145,7 @@ def create_hud(shared_data):
     period_label = ttk.Label(period_frame, text="마감 기간 선택:")
     period_label.pack(side=tk.LEFT, padx=(0, 10))
     
-    period_var = IntVar(value=7)  # 기본값 7일
+    period_var = IntVar(value=shared_data.get("due_period", 7))  # 저장된 세션의 기간, 없으면 7일
     
     def update_period(value):
         shared_data["due_period"] = value
@@ -158,10 +189,34 @@ def create_hud(shared_data):
     login_status = ttk.Label(login_form_frame, textvariable=login_status_var)
     login_status.grid(row=3, column=0, columnspan=3, padx=5, pady=5, sticky=tk.W)
     
-    # 로그인 상태 변수를 shared_data에 저장
-    shared_data["login_status_var"] = login_status_var
+    def show_content_frames():
+        """콘텐츠 목록, 상세 정보, 상태 표시줄을 화면에 배치합니다."""
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        separator1.pack(fill=tk.X, padx=10, pady=(0, 10))
+        details_frame.pack(fill=tk.X, padx=10, pady=10)
+        separator2.pack(fill=tk.X, padx=10, pady=(0, 10))
+        status_frame.pack(fill=tk.X, side=tk.BOTTOM, padx=10, pady=5)
+        
+        # 트리뷰와 스크롤바 다시 설정
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        hscrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+    
+    def show_logged_in_view():
+        """로그인 폼을 제거하고 콘텐츠 화면과 불러오는 중 상태를 표시합니다."""
+        login_frame.pack_forget()
+        period_choice.current(1 if shared_data.get("due_period", 7) == 14 else 0)
+        
+        # 기본 컨트롤 프레임과 기타 UI 요소 표시 (이미 표시된 요소는 순서대로 다시 배치됨)
+        control_frame.pack(fill=tk.X, padx=10, pady=(10, 0))
+        show_content_frames()
+        
+        # 상태 메시지 설정
+        status_label.config(text="데이터를 불러오는 중")
+        animate_loading_text()  # 애니메이션 시작
     
     # 로그인 버튼
+    @tracing.traced("login")
     def attempt_login():
         userid = id_var.get().strip()
         password = pw_var.get().strip()
@@ -176,108 +231,25 @@ def create_hud(shared_data):
         try:
             driver = shared_data.get("driver")
             if not driver:
-                login_status_var.set("브라우저 연결 실패")
+                login_status_var.set("브라우저를 준비하는 중입니다. 잠시 후 다시 시도해주세요.")
                 login_button.config(state=tk.NORMAL)
                 return
             
             print("로그인 시도 중... (ID: " + userid + ")")
             
-            # 로그인 페이지에 있는지 확인
-            if "login.php" not in driver.current_url:
-                print("로그인 페이지로 이동합니다.")
-                driver.get("https://ecampus.smu.ac.kr/login.php")
-                wait_for_page_load(driver)
-            
-            # 페이지 소스 출력하여 디버깅
-            print("로그인 페이지 HTML 요소 확인:")
-            username_fields = driver.find_elements(By.ID, "input-username") or driver.find_elements(By.CSS_SELECTOR, "input[name='username']")
-            password_fields = driver.find_elements(By.ID, "input-password") or driver.find_elements(By.CSS_SELECTOR, "input[name='password']")
-            
-            print(f"ID 필드 발견: {len(username_fields)}")
-            print(f"비밀번호 필드 발견: {len(password_fields)}")
-            
-            if not username_fields or not password_fields:
-                print("로그인 폼 요소를 찾을 수 없습니다. 페이지 소스 일부:")
-                print(driver.page_source[:500])
-                login_status_var.set("로그인 폼을 찾을 수 없습니다. 새로고침 후 다시 시도하세요.")
-                login_button.config(state=tk.NORMAL)
-                return
-            
-            # 아이디 입력
-            id_field = username_fields[0]
-            id_field.clear()
-            id_field.send_keys(userid)
-            print("아이디 입력 완료")
-            login_status_var.set("아이디 입력 완료, 비밀번호 처리 중...")
-            root.update()
-            
-            # 비밀번호 입력
-            pw_field = password_fields[0]
-            pw_field.clear()
-            pw_field.send_keys(password)
-            print("비밀번호 입력 완료")
-            login_status_var.set("로그인 정보 입력 완료, 로그인 시도 중...")
-            root.update()
-            
-            # 로그인 버튼 찾기
-            login_buttons = driver.find_elements(By.CSS_SELECTOR, "button[type='submit'], input[type='submit'], .btn-login")
-            if not login_buttons:
-                print("로그인 버튼을 찾을 수 없습니다.")
-                login_status_var.set("로그인 버튼을 찾을 수 없습니다.")
-                login_button.config(state=tk.NORMAL)
-                return
-            
-            # 로그인 버튼 클릭
-            print("로그인 버튼 클릭")
-            login_status_var.set("로그인 진행 중입니다. 잠시만 기다려주세요...")
-            root.update()
-            login_buttons[0].click()
-            
-            # 로그인 결과 확인
-            print("로그인 결과 확인 중...")
-            login_status_var.set("로그인 확인 중입니다. 잠시만 기다려주세요...")
-            root.update()
-            time.sleep(5)  # 로그인 처리를 위한 대기 시간 증가
+            def report(message):
+                login_status_var.set(message)
+                root.update()
             
-            current_url = driver.current_url
-            print(f"현재 URL: {current_url}")
+            success, message = Login(driver, userid, password).perform_login(on_status=report)
+            login_status_var.set(message)
             
-            if "ecampus.smu.ac.kr/login" not in current_url:
-                print("로그인 성공으로 판단됨")
-                login_status_var.set("로그인 성공! 데이터를 불러오는 중...")
+            if success:
                 shared_data["login_successful"] = True
-                
-                # UI 전환 - 로그인 폼을 제거하고 콘텐츠 화면 표시
-                login_frame.pack_forget()
-                
-                # 기본 컨트롤 프레임과 기타 UI 요소 표시
-                control_frame.pack(fill=tk.X, padx=10, pady=(10, 0))
-                main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-                separator1.pack(fill=tk.X, padx=10, pady=(0, 10))
-                details_frame.pack(fill=tk.X, padx=10, pady=10)
-                separator2.pack(fill=tk.X, padx=10, pady=(0, 10))
-                status_frame.pack(fill=tk.X, side=tk.BOTTOM, padx=10, pady=5)
-                
-                # 트리뷰와 스크롤바 다시 설정
-                tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-                scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-                hscrollbar.pack(side=tk.BOTTOM, fill=tk.X)
-                
-                # 상태 메시지 설정
-                status_label.config(text="데이터를 불러오는 중")
-                animate_loading_text()  # 애니메이션 시작
+                shared_data["userid"] = userid  # 로그인 세션 저장용
+                show_logged_in_view()
                 root.update()
             else:
-                # 로그인 실패 확인
-                print("로그인 실패 - 페이지에 오류 메시지 확인 중")
-                error_elements = driver.find_elements(By.CSS_SELECTOR, ".loginerrors, .alert, .alert-danger, .error")
-                
-                error_message = "알 수 없는 오류로 로그인에 실패했습니다."
-                if error_elements:
-                    error_message = error_elements[0].text
-                    print(f"오류 메시지: {error_message}")
-                
-                login_status_var.set(f"로그인 실패: {error_message}")
                 login_button.config(state=tk.NORMAL)
                 shared_data["login_successful"] = False
         
@@ -296,9 +268,6 @@ def create_hud(shared_data):
     login_button = ttk.Button(login_form_frame, text="로그인", command=attempt_login)
     login_button.grid(row=2, column=2, padx=5, pady=5)
     
-    # 로그인 버튼을 shared_data에 저장
-    shared_data["login_button"] = login_button
-    
     # 엔터키 바인딩
     def on_enter(event):
         attempt_login()
@@ -312,21 +281,18 @@ def create_hud(shared_data):
     title_label.pack(side=tk.LEFT, pady=(0, 10))
     
     control_var = tk.StringVar(value="중단")
-    shared_data["control_var"] = control_var  # shared_data에 control_var 저장
     
     def toggle_crawl():
         """크롤링 시작/중단 토글."""
         if control_var.get() == "중단":
             control_var.set("재시작")
             shared_data["running"] = False
-            shared_data["updated"] = True  # 중단 시에도 즉시 데이터 갱신 플래그 설정
             status_label.config(text="크롤링이 중단되었습니다. 재시작 버튼을 누르면 계속합니다.")
             # 즉시 트리 데이터 업데이트
             update_tree_data()
         else:
             control_var.set("중단")
             shared_data["running"] = True
-            shared_data["updated"] = True  # 재시작 시 데이터 갱신 플래그 설정
             status_label.config(text="크롤링이 다시 시작되었습니다")
             animate_loading_text()  # 애니메이션 다시 시작
     
@@ -337,7 +303,62 @@ def create_hud(shared_data):
         width=10
     )
     control_button.pack(side=tk.RIGHT, padx=5, pady=(0, 10))
-    shared_data["control_button"] = control_button  # shared_data에 control_button 저장
+    
+    # 로그인 폼을 건너뛰어도(저장된 세션) 마감 기간을 바꿀 수 있도록 목록 화면에도 둠
+    period_choice = ttk.Combobox(control_frame, values=["1주일", "2주일"], state="readonly", width=6)
+    period_choice.current(0)
+    period_choice.pack(side=tk.RIGHT, padx=5, pady=(0, 10))
+    
+    def change_period(event=None):
+        """목록 화면에서 마감 기간을 바꾸면 지금 목록을 지난 결과로 표시하고 새 기간으로 다시 수집합니다."""
+        nonlocal current_contents, crawl_done
+        value = 14 if period_choice.current() == 1 else 7
+        if value == shared_data.get("due_period", 7):
+            return
+        update_period(value)
+        period_var.set(value)
+        current_contents = [replace(content, cached=True) for content in current_contents]
+        table.set_items(current_contents)
+        crawl_done = False
+        control_var.set("중단")
+        control_button.config(state=tk.NORMAL)
+        update_tree_data()
+        status_label.config(text=f"{value}일 이내 마감 콘텐츠를 다시 불러오는 중")
+        animate_loading_text()
+        shared_data["period_changed"].set()
+    
+    period_choice.bind("<<ComboboxSelected>>", change_period)
+    
+    # 검색어와 상태/유형/강좌 필터 (필터의 첫 항목은 전체)
+    filter_frame = ttk.Frame(control_frame)
+    filter_frame.pack(side=tk.RIGHT, padx=5, pady=(0, 10))
+    
+    # 입력할 때마다 제목, 강좌명, 학수번호, 교수 이름에서 검색
+    search_var = StringVar()
+    ttk.Label(filter_frame, text="검색:").pack(side=tk.LEFT, padx=(0, 5))
+    search_entry = ttk.Entry(filter_frame, textvariable=search_var, width=18)
+    search_entry.pack(side=tk.LEFT, padx=(0, 10))
+    search_entry.bind("<Escape>", lambda event: search_var.set(""))
+    search_var.trace_add("write", lambda *args: apply_filters())
+    
+    status_filter = ttk.Combobox(filter_frame, values=["전체 상태"] + [status.value for status in Status],
+                                 state="readonly", width=9)
+    type_filter = ttk.Combobox(filter_frame, values=["전체 유형", "과제", "영상", "기타"], state="readonly", width=9)
+    course_filter = ttk.Combobox(filter_frame, values=["전체 강좌"], state="readonly", width=20)
+    for combobox in (course_filter, type_filter, status_filter):
+        combobox.current(0)
+        combobox.pack(side=tk.LEFT, padx=(0, 5))
+        combobox.bind("<<ComboboxSelected>>", lambda event: apply_filters())
+    
+    def apply_filters():
+        """검색어와 필터 선택을 목록에 반영하고 맨 위부터 다시 표시합니다."""
+        nonlocal offset
+        table.set_query(search_var.get())
+        table.set_filter('status', Status(status_filter.get()) if status_filter.current() > 0 else None)
+        table.set_filter('type', type_filter.get() if type_filter.current() > 0 else None)
+        table.set_filter('course', course_filter.get() if course_filter.current() > 0 else None)
+        offset = 0
+        update_tree_data()
     
     main_frame = ttk.Frame(root)
     separator1 = ttk.Separator(root, orient=tk.HORIZONTAL)
@@ -347,15 +368,20 @@ def create_hud(shared_data):
     
     # HUD 칼럼 재구성 및 스타일 개선
     columns = ('course', 'title', 'type', 'submission', 'due_date', 'remaining_time')
-    tree = ttk.Treeview(main_frame, columns=columns, show='headings')
-    
-    # 모든 헤더 가운데 정렬
-    tree.heading('course', text='강좌명', anchor=tk.CENTER)
-    tree.heading('title', text='콘텐츠 제목', anchor=tk.CENTER)
-    tree.heading('type', text='유형', anchor=tk.CENTER)
-    tree.heading('submission', text='제출상태', anchor=tk.CENTER)
-    tree.heading('due_date', text='마감일', anchor=tk.CENTER)
-    tree.heading('remaining_time', text='남은 시간', anchor=tk.CENTER)
+    visible_rows = 20  # 화면에 보이는 행 수 (창 크기가 정해지면 다시 계산)
+    tree = ttk.Treeview(main_frame, columns=columns, show='headings', height=visible_rows)
+    
+    # 모든 헤더 가운데 정렬, 헤더를 누르면 해당 칼럼으로 정렬
+    headings = {
+        'course': '강좌명',
+        'title': '콘텐츠 제목',
+        'type': '유형',
+        'submission': '제출상태',
+        'due_date': '마감일',
+        'remaining_time': '남은 시간',
+    }
+    for col, text in headings.items():
+        tree.heading(col, text=text, anchor=tk.CENTER, command=lambda col=col: sort_tree(col))
     
     # 칼럼 너비 조정 - course와 title은 유동적, 나머지는 고정 크기
     tree.column('course', width=240, minwidth=240, stretch=True, anchor='w')
@@ -373,93 +399,232 @@ def create_hud(shared_data):
     tree.configure(xscrollcommand=hscrollbar.set)
     hscrollbar.pack(side=tk.BOTTOM, fill=tk.X)
     
-    scrollbar = ttk.Scrollbar(main_frame, orient=tk.VERTICAL, command=tree.yview)
-    tree.configure(yscroll=scrollbar.set)
+    # 트리뷰에는 보이는 범위의 행만 만들고, 세로 스크롤은 목록에서의 위치(offset)로 처리
+    scrollbar = ttk.Scrollbar(main_frame, orient=tk.VERTICAL, command=lambda *args: on_scroll(*args))
     
     tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
     scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
     
-    item_deadlines = {}
-    
+    def to_items(contents):
+        """수집 결과를 ContentItem 목록으로 바꿉니다. 이미 가져온 상세 정보가 있으면 반영합니다."""
+        details = shared_data.get("details")
+        items = []
+        for content in contents:
+            if content.get('detail_pending') and details:
+                detail = details.get(content['link'])
+                if detail is not None:
+                    content = apply_detail(content, detail, shared_data.get("due_period", 7))
+                    if content is None:
+                        continue  # 상세 페이지의 마감일이 기간 밖
+            items.append(ContentItem.from_dict(content))
+        return items
+    
+    def request_detail(content):
+        """상세 페이지를 미룬 항목이면 작업 스레드에서 가져오게 합니다 (결과는 DetailLoaded 이벤트)."""
+        details = shared_data.get("details")
+        if content.detail_pending and details:
+            details.request(content.link, lambda link, detail: bus.publish(DetailLoaded(link, detail)))
+    
+    current_contents = to_items(shared_data["contents"])  # 마지막으로 받은 수집 목록
+    table = ContentTable(current_contents)  # 정렬/필터를 적용한 표시 목록
+    deadlines = DeadlineScheduler()  # 마감/마감 임박 알림 시점
+    course_filter.config(values=["전체 강좌"] + table.courses())
+    crawl_done = False
+    offset = 0  # 표시 범위의 첫 행 위치
+    selected_key = None  # 스크롤로 행이 사라져도 선택을 기억
+    row_contents = {}  # 표시 중인 행 ID(링크) → ContentItem
+    row_states = {}  # 행 ID → 마지막으로 반영한 (values, tags)
+    
+    # 행마다 태그를 만들지 않고 상태별 공용 태그를 재사용
+    tree.tag_configure('unsubmitted', background='#ffcccc')  # 미제출 빨간색 강조
+    tree.tag_configure('normal', background='#ffffff')  # 기본 흰색
+    tree.tag_configure('cached', foreground='#888888')  # 지난 실행 결과는 회색 글자
+    tree.tag_configure('expired', background='#eeeeee', foreground='#888888')  # 마감이 지난 항목
+    
+    def row_view(key, content, current_time):
+        """행의 (values, tags). 강좌명, 제목, 마감일 표시 문자열은 ContentItem을 만들 때 계산해 둠."""
+        expired = key in deadlines.expired
+        if expired:
+            tags = ('expired',)
+        else:
+            tags = ('unsubmitted' if content.unsubmitted else 'normal',)
+        if content.cached:
+            tags += ('cached',)
+        
+        values = (
+            content.course_name,
+            content.display_title,
+            content.type,
+            content.status.value,
+            content.due_label,
+            "마감됨" if expired else calculate_remaining_time(content.deadline, current_time)
+        )
+        return values, tags
+    
+    @tracing.traced("hud_refresh")
     def update_tree_data():
-        """HUD 데이터를 갱신합니다."""
-        for item in tree.get_children():
-            tree.delete(item)
-            
-        item_deadlines.clear()
+        """표시 범위의 행만 링크 기준으로 비교해 바뀐 행만 추가/이동/수정/삭제합니다."""
+        nonlocal offset
+        current_time = now_kst()
+        view = table.rows()
+        offset = max(0, min(offset, len(view) - visible_rows))
         
-        for i, content in enumerate(shared_data["contents"]):
-            # 과목명에서 학수번호와 교수 이름 분리 및 개행문자, 괄호 제거
-            course_name, course_code, professor_name = extract_course_details(content['course'])
-            course_name = re.sub(r'\(.*?\)', '', course_name).replace("\n", " ").strip()  # 괄호 및 개행문자 제거
-            content['course_code'] = course_code  # 학수번호 저장
-            content['professor_name'] = professor_name  # 교수 이름 저장
-            
-            # 콘텐츠 제목에서 개행문자 제거
-            title = content['title'].replace("\n", " ").strip()
-            
-            deadline_date = datetime.datetime.strptime(content['due_date'], '%Y-%m-%d').date()
-            deadline = datetime.datetime.combine(deadline_date, datetime.time(23, 59, 59))
-            remaining_time = calculate_remaining_time(deadline)
-            
-            tag = f"item{i}"
-            
-            # 미제출 과제 강조
-            if content['status'] == "미제출":
-                tree.tag_configure(tag, background='#ffcccc')  # 빨간색 강조
+        rows = []
+        row_contents.clear()
+        for key, content in view[offset:offset + visible_rows]:
+            values, tags = row_view(key, content, current_time)
+            rows.append((key, values, tags))
+            row_contents[key] = content
+        
+        # 표시 범위를 벗어난 행 삭제
+        stale = [item for item in tree.get_children() if item not in row_contents]
+        if stale:
+            tree.delete(*stale)
+        for item in stale:
+            row_states.pop(item, None)
+        
+        # 새 행은 제자리에 추가, 기존 행은 값이 바뀐 경우에만 수정하고 위치가 다르면 이동
+        order = list(tree.get_children())
+        for index, (key, values, tags) in enumerate(rows):
+            if key not in row_states:
+                tree.insert('', index, iid=key, values=values, tags=tags)
+                order.insert(index, key)
             else:
-                tree.tag_configure(tag, background='#ffffff')  # 기본 흰색
-            
-            item_id = tree.insert('', tk.END, values=(
-                course_name,
-                title,
-                content['type'],
-                content['status'],
-                content['due_date'],
-                remaining_time
-            ), tags=(tag,))
-            
-            item_deadlines[item_id] = deadline_date
+                if row_states[key] != (values, tags):
+                    tree.item(key, values=values, tags=tags)
+                if order[index] != key:
+                    tree.move(key, '', index)
+                    order.remove(key)
+                    order.insert(index, key)
+            row_states[key] = (values, tags)
+        
+        if view:
+            scrollbar.set(offset / len(view), min(1.0, (offset + visible_rows) / len(view)))
+        else:
+            scrollbar.set(0.0, 1.0)
+        
+        # 선택 유지 및 선택된 항목의 상세 정보 갱신
+        if selected_key in row_contents and tree.selection() != (selected_key,):
+            tree.selection_set(selected_key)
+        if selected_key in table.by_key:
+            show_details(selected_key)
         
         # 타이틀 변경으로 여기 수정
         due_period = shared_data.get("due_period", 7)
         title_label.config(text=f"{due_period}일 이내 마감 예정 콘텐츠 목록")
-        status_label.config(text=f"총 {len(shared_data['contents'])}개의 콘텐츠가 {due_period}일 이내 마감 예정입니다.")
+        cached_count = sum(1 for content in current_contents if content.cached)
+        if cached_count:
+            status_text = f"총 {len(current_contents)}개 중 {cached_count}개는 지난 실행 결과입니다 (회색, 로그인 후 갱신)."
+        else:
+            status_text = f"총 {len(current_contents)}개의 콘텐츠가 {due_period}일 이내 마감 예정입니다."
+        if len(view) != len(current_contents):
+            status_text += f" (검색/필터: {len(view)}개 표시)"
+        status_label.config(text=status_text)
+    
+    def scroll_to(new_offset):
+        """표시 범위를 new_offset 행부터로 옮깁니다."""
+        nonlocal offset
+        new_offset = max(0, min(new_offset, len(table.rows()) - visible_rows))
+        if new_offset != offset:
+            offset = new_offset
+            update_tree_data()
+    
+    def on_scroll(action, amount, unit=None):
+        """세로 스크롤바 명령 (moveto 비율 / scroll N units|pages)."""
+        if action == 'moveto':
+            scroll_to(round(float(amount) * len(table.rows())))
+        elif action == 'scroll':
+            scroll_to(offset + int(amount) * (visible_rows if unit == 'pages' else 1))
+    
+    def on_mousewheel(event):
+        scroll_to(offset + (-3 if event.num == 4 or event.delta > 0 else 3))
+        return "break"
+    
+    def on_arrow_key(event):
+        """표시 범위의 첫/마지막 행에서 위/아래 키를 누르면 한 행씩 스크롤합니다."""
+        children = tree.get_children()
+        selection = tree.selection()
+        if not children or not selection:
+            return None
+        step = 1 if event.keysym == 'Down' else -1
+        edge = children[-1] if step > 0 else children[0]
+        if selection[0] != edge:
+            return None
+        scroll_to(offset + step)
+        children = tree.get_children()
+        next_key = children[-1] if step > 0 else children[0]
+        tree.selection_set(next_key)
+        tree.focus(next_key)
+        tree.see(next_key)
+        return "break"
+    
+    def on_tree_resize(event):
+        """트리뷰 높이에 맞춰 표시할 행 수를 다시 계산합니다."""
+        nonlocal visible_rows
+        row_height = int(style.lookup("Treeview", "rowheight") or 20)
+        rows = max(1, event.height // row_height - 1)  # 헤더 한 줄 제외
+        if rows != visible_rows:
+            visible_rows = rows
+            update_tree_data()
+    
+    def sort_tree(column):
+        """헤더를 누른 칼럼으로 정렬합니다. 같은 헤더를 다시 누르면 역순으로 정렬합니다."""
+        nonlocal offset
+        table.sort_by(column)
+        for col, text in headings.items():
+            arrow = (" ▼" if table.descending else " ▲") if col == table.sort_column else ""
+            tree.heading(col, text=text + arrow)
+        offset = 0
+        update_tree_data()
     
     def on_tree_select(event):
+        nonlocal selected_key
+        selected_items = tree.selection()
+        if selected_items:
+            selected_key = selected_items[0]
+            show_details(selected_key)
+            content = table.by_key.get(selected_key)
+            if content:
+                request_detail(content)
+    
+    def show_details(item_id):
+        """선택한 행의 상세 정보를 표시합니다."""
         try:
-            selected_items = tree.selection()
-            if selected_items:
-                selected_item = selected_items[0]
-                idx = tree.index(selected_item)
-                if 0 <= idx < len(shared_data["contents"]):
-                    content = shared_data["contents"][idx]
-                    details_text.config(state=tk.NORMAL)
-                    details_text.delete(1.0, tk.END)
-                    details_info = f"제목: {content['title']}\n"
-                    details_info += f"강좌: {content['course']}\n"
-                    details_info += f"마감일: {content['due_date']}\n"
-                    
-                    deadline_date = datetime.datetime.strptime(content['due_date'], '%Y-%m-%d').date()
-                    deadline = datetime.datetime.combine(deadline_date, datetime.time(23, 59, 59))
-                    details_info += f"남은 시간: {calculate_remaining_time(deadline)}\n"
-                    
-                    details_info += f"상태: {content['status']}\n"
-                    details_info += f"링크: {content['link']}\n\n"
-                    details_info += f"내용: {content['context']}"
-                    details_text.insert(tk.END, details_info)
-                    details_text.config(state=tk.DISABLED)
-                    
-                    if content['link']:
-                        more_button.config(state=tk.NORMAL)
-                        more_button.link = content['link']
-                    else:
-                        more_button.config(state=tk.DISABLED)
-                        more_button.link = None
+            content = table.by_key.get(item_id)
+            if content:
+                details_text.config(state=tk.NORMAL)
+                details_text.delete(1.0, tk.END)
+                details_info = f"제목: {content.title}\n"
+                details_info += f"강좌: {content.course}\n"
+                details_info += f"마감일: {content.due_date}\n"
+                details_info += f"남은 시간: {calculate_remaining_time(content.deadline)}\n"
+                
+                details_info += f"상태: {content.status.value}\n"
+                details_info += f"링크: {content.link}\n\n"
+                details_info += f"내용: {content.context}"
+                if content.cached:
+                    details_info += "\n\n(지난 실행 결과 - 아직 다시 확인되지 않았습니다)"
+                elif content.detail_pending and shared_data.get("details"):
+                    details_info += "\n\n(상세 정보를 불러오는 중입니다...)"
+                details_text.insert(tk.END, details_info)
+                details_text.config(state=tk.DISABLED)
+                
+                if content.link:
+                    more_button.config(state=tk.NORMAL)
+                    more_button.link = content.link
+                else:
+                    more_button.config(state=tk.DISABLED)
+                    more_button.link = None
         except Exception as e:
             print(f"상세 정보 표시 오류: {str(e)}")
     
     tree.bind('<<TreeviewSelect>>', on_tree_select)
+    tree.bind('<Configure>', on_tree_resize)
+    tree.bind('<MouseWheel>', on_mousewheel)
+    tree.bind('<Button-4>', on_mousewheel)  # X11 휠 위
+    tree.bind('<Button-5>', on_mousewheel)  # X11 휠 아래
+    tree.bind('<Up>', on_arrow_key)
+    tree.bind('<Down>', on_arrow_key)
     
     details_content_frame = ttk.Frame(details_frame)
     details_content_frame.pack(fill=tk.X, expand=True, padx=5, pady=5)
@@ -492,13 +657,10 @@ def create_hud(shared_data):
     )
     status_label.pack(side=tk.LEFT)
     
-    # 상태 레이블을 shared_data에 저장
-    shared_data["status_label"] = status_label
-    
     def animate_loading_text():
         """로딩 텍스트에 애니메이션 효과를 추가합니다."""
         nonlocal loading_dots_state
-        if not shared_data["running"] or shared_data.get("crawling_complete", False) or shared_data.get("exit", False):
+        if not shared_data["running"] or crawl_done or shared_data.get("exit", False):
             return
             
         dots = "." * (loading_dots_state % 4)
@@ -512,757 +674,904 @@ def create_hud(shared_data):
         
         root.after(500, animate_loading_text)
     
+    def track_deadlines():
+        """표시 목록의 마감 일시를 스케줄러에 맞춥니다 (새 항목만 등록)."""
+        deadlines.sync({key: content.deadline for key, content in table.by_key.items()}, now_kst())
+    
+    def notify_deadline(key, hours):
+        """마감 임박 알림. 제출하지 않은 항목만 상태 표시줄과 알림음으로 알립니다."""
+        content = table.by_key.get(key)
+        if not content or content.status is Status.SUBMITTED:
+            return
+        message = f"'{content.display_title}' 마감 {hours}시간 전입니다 ({content.status.value})."
+        print(message)
+        status_label.config(text=message)
+        root.bell()
+    
+    deadlines.alert_hooks.append(notify_deadline)
+    
     def update_remaining_time():
-        """남은 시간을 업데이트하고 크롤링 상태를 확인합니다."""
-        for item_id in item_deadlines:
+        """남은 시간 표시가 바뀌는 시각(분 경계)이나 마감/알림 시점에 깨어나 바뀐 행만 고칩니다."""
+        current_time = now_kst()
+        newly_expired = set(deadlines.advance(current_time)[0])
+        
+        # 이미 마감된 행은 표시가 더 바뀌지 않으므로 건너뜀
+        for item_id, content in row_contents.items():
+            if item_id in deadlines.expired and item_id not in newly_expired:
+                continue
             try:
-                deadline_date = item_deadlines[item_id]
-                deadline = datetime.datetime.combine(deadline_date, datetime.time(23, 59, 59))
-                remaining = calculate_remaining_time(deadline)
-
-                current_values = tree.item(item_id, 'values')
-                new_values = list(current_values)
-                new_values[5] = remaining
-                tree.item(item_id, values=new_values)
-            except:
-                pass
-
-        # 크롤링 완료 시 버튼 상태 변경 및 브라우저 종료
-        if shared_data.get("crawling_complete", False):
-            shared_data["control_var"].set("완료됨")
-            shared_data["control_button"].config(state=tk.DISABLED)
-            if "driver" in shared_data and shared_data["driver"]:
-                shared_data["driver"].quit()  # Selenium 브라우저 종료
-                shared_data["driver"] = None
-            return
+                state = row_view(item_id, content, current_time)
+                if row_states[item_id] != state:
+                    values, tags = state
+                    tree.item(item_id, values=values, tags=tags)
+                    row_states[item_id] = state
+            except Exception as e:
+                print(f"남은 시간 갱신 오류: {str(e)}")
 
         if shared_data.get("exit", False):
             return
 
-        root.after(60000, update_remaining_time)
-    
-    def check_data_update():
-        """데이터 업데이트를 확인하고 HUD를 갱신합니다."""
-        if shared_data.get("updated", False):
-            shared_data["updated"] = False
-            update_tree_data()
-        
-        # 크롤링 종료 시 불필요한 기능 비활성화
-        if shared_data.get("exit", False):
+        delay = (deadlines.next_wake(current_time) - now_kst()).total_seconds()
+        root.after(max(0, int(delay * 1000)) + 50, update_remaining_time)
+    
+    def process_events():
+        """크롤러가 보낸 이벤트를 한꺼번에 꺼내 Tk 스레드에서 반영합니다."""
+        nonlocal current_contents, crawl_done
+        events = bus.drain()
+        if not events or shared_data.get("exit", False):
             return
         
-        root.after(500, check_data_update)
+        # 전체 스냅샷은 받은 즉시 교체하고, 새 항목은 마감 순서를 유지하며 끼워 넣음.
+        # 표는 한 번에 모아서 갱신
+        contents_changed = False
+        for event in events:
+            if isinstance(event, ContentsUpdated):
+                current_contents = to_items(event.contents)
+                contents_changed = True
+            elif isinstance(event, ContentsAdded):
+                added_links = {item['link'] for item in event.items}
+                # 다시 확인된 지난 실행 항목은 새 항목으로 교체
+                if any(content.cached and content.link in added_links for content in current_contents):
+                    current_contents = [content for content in current_contents
+                                        if not (content.cached and content.link in added_links)]
+                for item in to_items(event.items):
+                    bisect.insort(current_contents, item, key=attrgetter("sort_key"))
+                contents_changed = True
+            elif isinstance(event, DetailLoaded):
+                if event.detail is None:
+                    status_label.config(text="상세 정보를 불러오지 못했습니다.")
+                    continue
+                # 상세 정보로 마감일이 바뀔 수 있으므로 다시 마감 순으로 정렬
+                pending = [content for content in current_contents
+                           if content.detail_pending and content.link == event.link]
+                if pending:
+                    resolved = to_items([content.to_dict() for content in pending])
+                    current_contents = [content for content in current_contents
+                                        if not (content.detail_pending and content.link == event.link)]
+                    current_contents.extend(resolved)
+                    current_contents.sort(key=attrgetter("sort_key"))
+                    contents_changed = True
+            elif isinstance(event, StatusMessage):
+                status_label.config(text=event.text)
+            elif isinstance(event, CrawlProgress):
+                status_label.config(text=f"데이터를 불러오는 중 ({event.done}/{event.total})")
+            elif isinstance(event, LoginStatus):
+                login_status_var.set(event.text)
+                if event.retry:
+                    login_button.config(state=tk.NORMAL)
+            elif isinstance(event, SessionRestored):
+                period_var.set(shared_data.get("due_period", 7))
+                show_logged_in_view()
+                if event.userid == "daemon":
+                    period_choice.config(state=tk.DISABLED)  # 기간은 데몬 설정을 따름
+            elif isinstance(event, CrawlCompleted):
+                crawl_done = True
+                control_var.set("완료됨")
+                control_button.config(state=tk.DISABLED)
+        
+        if contents_changed:
+            table.set_items(current_contents)
+            track_deadlines()
+            course_filter.config(values=["전체 강좌"] + table.courses())
+            update_tree_data()
+    
+    # 크롤러 스레드는 가상 이벤트로 깨우기만 하고, 실제 처리는 유휴 시점에 모아서 수행
+    bus = shared_data["events"]
+    root.bind("<<CrawlerEvent>>", lambda event: root.after_idle(process_events))
+    bus.connect(lambda: root.event_generate("<<CrawlerEvent>>", when="tail"))
+    
+    # 지난 실행 결과가 있으면 로그인 폼 아래에 바로 표시
+    if current_contents:
+        show_content_frames()
     
+    track_deadlines()
     update_tree_data()
-    check_data_update()
+    process_events()  # HUD가 뜨기 전에 쌓인 이벤트 처리
     update_remaining_time()
     
     def on_closing():
         """HUD 창 닫기 이벤트 처리."""
         shared_data["running"] = False
         shared_data["exit"] = True
+        bus.connect(None)
         root.destroy()
         
     root.protocol("WM_DELETE_WINDOW", on_closing)
+
+    def mark_first_paint():
+        root.update_idletasks()
+        startup.mark("first_paint")
+
+    root.after(0, mark_first_paint)
     root.mainloop()
 
-def wait_for_page_load(driver, timeout=10):
-    WebDriverWait(driver, timeout).until(
-        lambda d: d.execute_script("return document.readyState") == "complete"
-    )
+def print_contents(all_contents, due_period):
+    """수집 결과를 콘솔에 출력합니다."""
+    print("\n===== 수집 완료 =====")
+    print(f"총 {len(all_contents)}개 항목 발견")
+    
+    if all_contents:
+        print(f"\n===== {due_period}일 이내 마감 예정 콘텐츠 목록 =====")
+        for idx, content in enumerate(all_contents):
+            remaining = calculate_remaining_time(parse_due_date(content['due_date']))
+            
+            print(f"\n[{idx+1}] {content['course']} - {content['title']} ({content['type']})")
+            print(f"마감일: {content['due_date']}")
+            print(f"남은 시간: {remaining}")
+            print(f"상태: {content['status']}")
+            print(f"링크: {content['link']}")
+            print("-" * 50)
+        
+        print(f"\n총 {len(all_contents)}개의 콘텐츠가 {due_period}일 이내 마감 예정입니다.")
+    else:
+        print(f"\n{due_period}일 이내 마감 예정인 콘텐츠가 없습니다.")
+    
+    print("\n크롤링이 완료되었습니다. 결과를 확인하세요.")
 
-def main():
-    # Headless 모드 설정
-    options = webdriver.ChromeOptions()
-    options.add_argument('--headless=new')  # 최신 Headless 모드 사용
-    options.add_argument('--disable-gpu')
-    options.add_argument('--disable-extensions')
-    options.add_argument('--disable-infobars')
-    options.add_argument('--disable-notifications')
-    options.add_argument('--window-size=1920,1080')  # 해상도 설정
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36")
+def wait_for_period_change(session, session_cache, shared_data):
+    """수집이 끝난 뒤 대기합니다.
+    
+    HUD에서 마감 기간을 바꾸면 다시 수집할 대시보드 HTML을, 종료/중단되면 None을 반환합니다.
+    세션이 만료됐으면 HUD에 알리고 계속 대기합니다.
+    """
+    from crawler.http_session import SessionExpiredError
+    
+    period_changed = shared_data["period_changed"]
+    while not shared_data["exit"]:
+        if not shared_data["running"]:
+            print("크롤링이 완료되었으며, 브라우저를 종료합니다.")
+            return None
+        if not period_changed.wait(0.5):
+            continue
+        period_changed.clear()
+        try:
+            return session.get(DASHBOARD_URL)
+        except SessionExpiredError:
+            session_cache.clear()
+            shared_data["events"].publish(CrawlCompleted(0))
+            shared_data["events"].publish(StatusMessage("로그인 세션이 만료되었습니다. 프로그램을 다시 실행해 로그인해주세요."))
+    return None
+
+def is_connection_error(e):
+    """학교 서버와 연결할 수 없는 오류인지 확인합니다."""
+    import requests
+    
+    if isinstance(e, requests.ConnectionError):
+        return True
+    return "ERR_CONNECTION_TIMED_OUT" in str(e) or "RemoteDisconnected" in str(e)
 
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+def login_with_browser(shared_data, login_event):
+    """Chrome으로 로그인 페이지를 열고 HUD의 로그인을 기다린 뒤 (HTTP 세션, 대시보드 HTML)을 반환합니다.
+
+    로그인 시간이 초과되거나 사용자가 종료하면 None을 반환합니다.
+    """
+    events = shared_data["events"]
+    
+    # HUD를 그리는 동안 이 스레드에서 selenium import, 드라이버 경로 확인, Chrome 실행을 진행
+    driver = start_chrome(startup)
     shared_data["driver"] = driver  # shared_data에 드라이버 저장
+    startup.mark("browser_ready")
+    
+    try:
+        driver.get(LOGIN_URL)
+        wait_for_selector(driver, LOGIN_FORM_READY)
+        print("로그인 페이지가 열렸습니다. HUD에서 로그인 정보를 입력해 주세요.")
+    except Exception as e:
+        print(f"서버 연결 오류: {str(e)}")
+        
+        # 로그인 상태 메시지 업데이트 및 로그인 버튼 활성화
+        if is_connection_error(e):
+            events.publish(LoginStatus("학교 서버와 연결할 수 없습니다. 인터넷 연결을 확인하거나 잠시 후 다시 시도해주세요.", retry=True))
+        else:
+            events.publish(LoginStatus(f"서버 연결 오류: {str(e)}", retry=True))
+        
+        # 로그인 이벤트 재설정 및 다시 시도 준비
+        shared_data["login_attempted"] = False
+        if shared_data.get("login_event"):
+            shared_data["login_event"].clear()
+        
+        # 프로그램 종료하지 않고 대기
+        print("학교 서버와 연결할 수 없습니다. 다시 시도해주세요.")
+        
+        # 다시 로그인 대기
+        print("재연결 및 로그인을 기다립니다...")
+        login_success = login_event.wait(timeout=300)  # 5분간 대기
+        
+        # 여전히 연결 실패 상태라면 종료
+        if not shared_data.get("login_successful", False):
+            if shared_data.get("exit", False):
+                print("사용자에 의해 프로그램이 종료되었습니다.")
+            else:
+                print("서버 연결 재시도 시간이 초과되었습니다. 프로그램을 종료합니다.")
+            return None
+    
+    # 로그인 완료 대기
+    login_timeout = 300  # 5분
+    print(f"로그인 입력을 {login_timeout}초 동안 기다립니다...")
+    login_success = login_event.wait(timeout=login_timeout)
+    
+    # timeout 후 로그인 시도 여부 확인
+    if not shared_data.get("login_attempted", False):
+        print("로그인 시간이 초과되었습니다.")
+        return None
+        
+    if shared_data["exit"]:
+        print("사용자에 의해 프로그램이 종료되었습니다.")
+        return None
+        
+    if not shared_data.get("login_successful", False):
+        print("로그인에 실패했습니다. 다시 로그인을 시도하세요.")
+        
+        # 로그인 상태 메시지 업데이트 및 로그인 버튼 활성화하여 재시도할 수 있도록 함
+        events.publish(LoginStatus("로그인에 실패했습니다. 다시 시도해주세요.", retry=True))
+            
+        # 로그인 이벤트 재설정
+        shared_data["login_attempted"] = False
+        login_event.clear()
+        
+        # 다시 로그인 대기
+        print("재로그인을 기다립니다...")
+        login_success = login_event.wait(timeout=300)  # 5분간 대기
+        
+        # 여전히 로그인 실패 상태라면 종료
+        if not shared_data.get("login_successful", False):
+            if shared_data.get("exit", False):
+                print("사용자에 의해 프로그램이 종료되었습니다.")
+            else:
+                print("로그인 재시도 시간이 초과되었습니다. 프로그램을 종료합니다.")
+            return None
+    
+    print("로그인이 성공적으로 완료되었습니다.")
+    
+    # 대시보드는 JavaScript로 렌더링되므로 page_source를 한 번만 가져와 파싱합니다.
+    dashboard_html = driver.page_source
+    
+    # 로그인 이후 페이지는 브라우저 대신 로그인 쿠키를 복사한 HTTP 세션으로 가져옵니다.
+    from crawler.http_session import HttpSession
+    session = HttpSession.from_driver(driver)
+    driver.quit()
+    shared_data["driver"] = None
+    print("로그인 세션을 HTTP 세션으로 전환하고 브라우저를 종료했습니다.")
+    return session, dashboard_html
+
+def follow_daemon(shared_data, snapshot):
+    """실행 중인 데몬의 목록을 HUD에 표시하고, 데몬이 다시 수집할 때마다 갱신합니다."""
+    from daemon import fetch_snapshot
+    
+    events = shared_data["events"]
+    shared_data["due_period"] = snapshot["period"]
+    shared_data["login_successful"] = True
+    events.publish(SessionRestored("daemon"))
+    print("실행 중인 데몬의 목록을 표시합니다.")
+    
+    updated_at = None
+    while not shared_data["exit"]:
+        if snapshot is None:
+            events.publish(StatusMessage("데몬과 연결할 수 없습니다. 마지막 목록을 표시합니다."))
+        elif not snapshot["updated_at"]:
+            events.publish(StatusMessage("데몬이 첫 수집을 진행 중입니다..."))
+        elif snapshot["updated_at"] != updated_at:
+            if updated_at is None:
+                events.publish(CrawlCompleted(snapshot["count"]))  # 불러오는 중 표시 종료
+            updated_at = snapshot["updated_at"]
+            events.publish(ContentsUpdated(snapshot["contents"]))
+        
+        next_poll = time.time() + DAEMON_POLL_INTERVAL
+        while time.time() < next_poll and not shared_data["exit"]:
+            time.sleep(0.5)
+        snapshot = fetch_snapshot()
 
+def main():
+    tracing.start_from_config()  # SMU_TRACE_FILE이 설정된 경우에만 구간별 실행 시간 기록
+    
     # 로그인 이벤트 생성
     login_event = Event()
     shared_data["login_event"] = login_event
 
+    # 지난 실행 결과를 먼저 표시하고, 로그인 후 수집 결과로 갱신합니다.
+    # 다른 계정의 목록이 보이지 않도록 저장된 로그인 세션의 사용자가 수집한 결과만, 그 사용자의 기간으로 표시
+    from crawler.session_cache import SessionCache
+    session_cache = SessionCache()
+    saved = session_cache.load() or {}
+    store = ContentStore()
+    cached_contents = []
+    if saved.get("userid"):
+        cached_contents = load_cached_contents(store, saved.get("due_period", 7), saved["userid"])
+
+    events = EventBus()
     shared_data.update({
-        "contents": [],
+        "contents": list(cached_contents),
+        "cached_contents": cached_contents,
+        "events": events,
         "running": True,
         "exit": False,
-        "updated": False,
-        "crawling_complete": False,
         "login_attempted": False,
         "login_successful": False,
-        "due_period": 7  # 기본값 1주일
+        "lazy_details": LAZY_DETAILS,  # 상세 페이지는 HUD에서 행을 선택할 때 가져옴
+        "details": None,  # 상세 페이지 캐시 (로그인 후 생성)
+        "period_changed": Event(),  # 로그인 후 HUD에서 마감 기간을 바꾸면 설정됨
+        "due_period": saved.get("due_period", 7)  # 기본값 1주일
     })
     
+    # 브라우저 실행을 기다리지 않도록 HUD를 먼저 띄움
     hud_thread = Thread(target=create_hud, args=(shared_data,))
     hud_thread.daemon = True
     hud_thread.start()
     
+    session = None
+    details = None
     try:
-        try:
-            driver.get("https://ecampus.smu.ac.kr/login.php")
-            wait_for_page_load(driver)
-            print("로그인 페이지가 열렸습니다. HUD에서 로그인 정보를 입력해 주세요.")
-        except Exception as e:
-            print(f"서버 연결 오류: {str(e)}")
-            
-            # HUD 창이 나타날 때까지 대기
-            time.sleep(3)
-            if shared_data.get("login_button"):
-                shared_data["login_button"].config(state=tk.NORMAL)
-            
-            # 로그인 상태 레이블 접근 및 메시지 업데이트
-            login_status_var = shared_data.get("login_status_var")
-            if login_status_var:
-                if "ERR_CONNECTION_TIMED_OUT" in str(e) or "RemoteDisconnected" in str(e):
-                    login_status_var.set("학교 서버와 연결할 수 없습니다. 인터넷 연결을 확인하거나 잠시 후 다시 시도해주세요.")
-                else:
-                    login_status_var.set(f"서버 연결 오류: {str(e)}")
-            
-            # 로그인 이벤트 재설정 및 다시 시도 준비
-            shared_data["login_attempted"] = False
-            if shared_data.get("login_event"):
-                shared_data["login_event"].clear()
-            
-            # 프로그램 종료하지 않고 대기
-            print("학교 서버와 연결할 수 없습니다. 다시 시도해주세요.")
-            
-            # 다시 로그인 대기
-            print("재연결 및 로그인을 기다립니다...")
-            login_success = login_event.wait(timeout=300)  # 5분간 대기
-            
-            # 여전히 연결 실패 상태라면 종료
-            if not shared_data.get("login_successful", False):
-                if shared_data.get("exit", False):
-                    print("사용자에 의해 프로그램이 종료되었습니다.")
-                else:
-                    print("서버 연결 재시도 시간이 초과되었습니다. 프로그램을 종료합니다.")
+        # 데몬이 실행 중이면 로그인하지 않고 데몬이 수집한 목록을 표시
+        from daemon import fetch_snapshot
+        snapshot = fetch_snapshot()
+        if snapshot is not None:
+            follow_daemon(shared_data, snapshot)
+            return
+        
+        # 저장된 로그인 세션이 아직 유효하면 브라우저를 띄우지 않고 로그인 폼도 건너뜀
+        restored = session_cache.restore()
+        if restored:
+            session, dashboard_html, saved = restored
+            shared_data["due_period"] = saved.get("due_period", 7)
+            shared_data["userid"] = saved.get("userid")
+            shared_data["login_successful"] = True
+            startup.mark("session_restored")
+            events.publish(SessionRestored(saved.get("userid", "")))
+        else:
+            logged_in = login_with_browser(shared_data, login_event)
+            if logged_in is None:
                 return
+            session, dashboard_html = logged_in
+            if cached_contents and shared_data.get("userid") != saved.get("userid"):
+                # 저장된 세션과 다른 계정으로 로그인하면 표시해 둔 지난 실행 결과를 지움
+                shared_data["cached_contents"] = []
+                publish_contents([], shared_data)
+            session_cache.save(session, shared_data.get("userid"), shared_data.get("due_period", 7))
         
-        # 로그인 완료 대기
-        login_timeout = 300  # 5분
-        print(f"로그인 입력을 {login_timeout}초 동안 기다립니다...")
-        login_success = login_event.wait(timeout=login_timeout)
+        if LAZY_DETAILS:
+            details = DetailCache(lambda link: parse_detail_page(session.get(link)))
+            shared_data["details"] = details
         
-        # timeout 후 로그인 시도 여부 확인
-        if not shared_data.get("login_attempted", False):
-            print("로그인 시간이 초과되었습니다.")
-            return
+        course_titles = CourseTitleCache.load()
+        dashboard_rendered = not restored  # 저장된 세션의 대시보드는 HTTP로 받아 타임라인 블록이 비어 있음
+        while True:
+            due_period = shared_data.get("due_period", 7)
+            print(f"\n===== {due_period}일 이내 마감 콘텐츠 수집 시작 =====")
+            
+            all_contents = crawl_contents(session, dashboard_html, course_titles, store, shared_data,
+                                          dashboard_rendered=dashboard_rendered)
+            if all_contents is None:
+                return
+            
+            events.publish(CrawlCompleted(len(all_contents)))  # 버튼 상태 변경은 HUD 스레드에서 처리
+            if details:
+                # 마감이 가까운 항목의 상세 페이지는 선택하기 전에 미리 가져옴
+                pending = [content['link'] for content in all_contents if content.get('detail_pending')]
+                details.prefetch(pending[:DETAIL_PREFETCH], lambda link, detail: events.publish(DetailLoaded(link, detail)))
+            print_contents(all_contents, due_period)
             
+            # HUD에서 마감 기간을 바꾸면 대시보드를 다시 받아 새 기간으로 수집
+            dashboard_html = wait_for_period_change(session, session_cache, shared_data)
+            if dashboard_html is None:
+                break
+            session_cache.save(session, shared_data.get("userid"), shared_data.get("due_period", 7))
+            dashboard_rendered = False
+    
+    except Exception as e:
+        print(f"프로그램 실행 중 오류 발생: {str(e)}")
+        import traceback
+        traceback.print_exc()
+    
+    finally:
+        shared_data["exit"] = True
+        if details:
+            details.close()
+        if session:
+            session.close()
+        if store:
+            store.close()
+        if shared_data["driver"]:
+            shared_data["driver"].quit()
+            shared_data["driver"] = None
+        print("Selenium 브라우저가 종료되었습니다.")
+        tracing.finish()
+
+@tracing.traced("crawl")
+def crawl_contents(session, dashboard_html, course_titles, store, shared_data, data_source=DATA_SOURCE,
+                   dashboard_rendered=True):
+    """로그인된 세션으로 기간 내 마감 콘텐츠를 수집해 저장하고 목록을 반환합니다.
+    
+    각 수집 단계는 항목을 생성기로 흘려보내고(탐색 → 요청 → 파싱 → 기간 필터), 마지막
+    ContentSink가 중복을 거르며 마감 순서대로 모읍니다. HUD에는 페이지마다 새 항목만 전달합니다.
+    dashboard_rendered가 False이면(저장된 세션이나 HTTP로 받은 대시보드) 스크립트로 채워지는
+    타임라인 블록이 비어 있으므로, 페이지에서 찾지 못한 일정을 AJAX 일정 조회로 보탭니다.
+    사용자가 프로그램을 종료하면 None을 반환합니다.
+    """
+    events = shared_data["events"]
+    sink = ContentSink(on_delta=lambda added: events.publish(ContentsAdded(tuple(added))), prepare=categorize)
+    crawl_started = time.time()
+    
+    # 강좌명은 지난 실행의 캐시와 대시보드의 강좌 목록에서 찾고, 페이지를 따로 열지 않습니다.
+    course_titles.update_from_links(parse_course_links(dashboard_html))
+    
+    collected = False
+    if data_source == "ajax":
+        collected = collect_ajax_items(session, dashboard_html, course_titles, sink, shared_data)
+    if not collected:
+        if dashboard_rendered:
+            collect_timeline_items(dashboard_html, course_titles, sink, shared_data)
+        collect_course_items(session, course_titles, sink, shared_data, store if INCREMENTAL_CRAWL else None)
         if shared_data["exit"]:
-            print("사용자에 의해 프로그램이 종료되었습니다.")
+            return None
+        # 타임라인 블록이 비어 있는 대시보드면 일괄/강좌 페이지에 없던 일정만 AJAX 일정 조회로 보탬
+        # (같은 항목은 제출 상태가 정확한 페이지 쪽 결과를 남기도록 마지막에 추가)
+        if not dashboard_rendered and (data_source == "ajax"
+                                       or not collect_ajax_items(session, dashboard_html, course_titles, sink, shared_data)):
+            print("타임라인 블록이 그려지지 않은 대시보드라 타임라인에만 있는 항목은 빠질 수 있습니다.")
+    course_titles.save()
+    
+    # 다시 확인되지 않은 지난 실행 항목은 목록에서 제거
+    all_contents = sink.items()
+    shared_data["cached_contents"] = []
+    publish_contents(all_contents, shared_data)
+    store.save_items(all_contents, crawl_started, shared_data.get("userid"))
+    return all_contents
+
+def categorize(content):
+    """강좌명 앞의 구분(천안CTL, SM-CLASS, 교과 기타)을 category로 옮깁니다."""
+    if 'category' in content:  # 저장소에서 불러온 항목은 이미 분류됨
+        return
+    course_name = content['course']
+    for category in ("천안CTL", "SM-CLASS", "교과 기타"):
+        if category in course_name:
+            content['category'] = category
+            content['course'] = course_name.replace(category, "").strip()
             return
+    content['category'] = "일반"
+
+def load_cached_contents(store, due_period, userid):
+    """userid의 지난 실행에서 저장한 항목 중 기간 내 마감 항목을 캐시 표시와 함께 마감 순으로 반환합니다."""
+    today = now_kst().date()
+    cached_contents = []
+    for content in store.load_items(userid=userid):
+        try:
+            diff_days = days_until(parse_due_date(content['due_date']), today)
+        except (TypeError, ValueError):
+            continue
+        if 0 <= diff_days <= due_period:
+            content['cached'] = True
+            cached_contents.append(content)
+    cached_contents.sort(key=due_key)
+    return cached_contents
+
+def publish_contents(all_contents, shared_data):
+    """마감 순 수집 목록 전체를 HUD에 게시합니다. 아직 다시 확인되지 않은 캐시 항목은 함께 표시합니다."""
+    seen_links = {content['link'] for content in all_contents}
+    stale_contents = [c for c in shared_data.get("cached_contents", []) if c['link'] not in seen_links]
+    shared_data["events"].publish(ContentsUpdated(merge_sorted(all_contents, stale_contents)))
+
+@tracing.traced("ajax_collect")
+def collect_ajax_items(session, dashboard_html, course_titles, sink, shared_data):
+    """Moodle AJAX API로 기간 내 마감 일정을 가져옵니다. 실패하면 False를 반환합니다."""
+    sesskey = parse_sesskey(dashboard_html)
+    if not sesskey:
+        print("sesskey를 찾을 수 없어 HTML 수집으로 진행합니다.")
+        return False
+    
+    source = MoodleAjaxSource(session, sesskey)
+    try:
+        items = source.collect(shared_data.get("due_period", 7))
+    except Exception as e:
+        print(f"AJAX 일정 조회 실패, HTML 수집으로 진행합니다: {str(e)}")
+        return False
+    
+    for course_id, course_name in source.courses.items():
+        course_titles.set(course_id, course_name)
+    
+    print(f"AJAX 일정 조회로 {len(items)}개 항목 발견")
+    sink.extend(items)
+    sink.flush()
+    return True
+
+def content_type_from_link(link):
+    if "/mod/assign/" in link:
+        return "과제"
+    if "/mod/econtents/" in link:
+        return "영상"
+    return "기타"
+
+def timeline_items(timeline_events, course_titles, due_period, today):
+    """타임라인 일정을 콘텐츠로 바꾸고 기간 밖의 항목을 걸러 내보냅니다."""
+    for event in timeline_events:
+        try:
+            event_text = event["text"]
+            link = event["link"]
+            title = event["title"]
+            print(f"활동 발견: {title}")
             
-        if not shared_data.get("login_successful", False):
-            print("로그인에 실패했습니다. 다시 로그인을 시도하세요.")
-            
-            # 로그인 버튼 활성화하여 재시도할 수 있도록 함
-            if shared_data.get("login_button"):
-                shared_data["login_button"].config(state=tk.NORMAL)
-                
-            # 로그인 상태 메시지 업데이트
-            if shared_data.get("login_status_var"):
-                shared_data["login_status_var"].set("로그인에 실패했습니다. 다시 시도해주세요.")
-                
-            # 로그인 이벤트 재설정
-            shared_data["login_attempted"] = False
-            login_event.clear()
+            deadline = parse_deadline(event_text, today)
+            if not deadline:
+                deadline = end_of_day(today + datetime.timedelta(days=due_period))
             
-            # 다시 로그인 대기
-            print("재로그인을 기다립니다...")
-            login_success = login_event.wait(timeout=300)  # 5분간 대기
+            # 지정된 기간 내에 있는지 확인
+            diff_days = days_until(deadline, today)
+            if not (0 <= diff_days <= due_period):
+                continue
             
-            # 여전히 로그인 실패 상태라면 종료
-            if not shared_data.get("login_successful", False):
-                if shared_data.get("exit", False):
-                    print("사용자에 의해 프로그램이 종료되었습니다.")
-                else:
-                    print("로그인 재시도 시간이 초과되었습니다. 프로그램을 종료합니다.")
-                return
-        
-        print("로그인이 성공적으로 완료되었습니다.")
-        due_period = shared_data.get("due_period", 7)
-        print(f"\n===== {due_period}일 이내 마감 콘텐츠 수집 시작 =====")
-        
-        all_contents = []
-        processed_items = set()
+            yield {
+                "course": course_titles.get(course_id_from_url(link), UNKNOWN_COURSE),
+                "title": title,
+                "link": link,
+                "due_date": format_due(deadline),
+                "status": "확인필요",
+                "context": event_text,
+                "type": content_type_from_link(link)
+            }
+        except Exception as e:
+            print(f"항목 처리 오류: {str(e)}")
+            continue
+
+@tracing.traced("timeline_scan")
+def collect_timeline_items(dashboard_html, course_titles, sink, shared_data):
+    """대시보드 타임라인/다가오는 일정 블록에서 기간 내 항목을 수집합니다."""
+    timeline_events = parse_timeline_events(dashboard_html)
+    print(f"타임라인에서 {len(timeline_events)}개 항목 발견")
+    sink.extend(timeline_items(timeline_events, course_titles, shared_data.get("due_period", 7), now_kst().date()))
+    sink.flush()
+
+def collect_course_items(session, course_titles, sink, shared_data, store=None):
+    """강좌 목록을 가져와 강좌별 일괄 페이지와 강좌 페이지를 병렬로 수집합니다."""
+    print("\n강좌 목록을 수집 중...")
+    with tracing.span("course_discovery"):
+        try:
+            main_page_html = session.get(f"{ECAMPUS_URL}/")
+        except Exception as e:
+            print(f"메인페이지 접속 오류: {str(e)}")
+            if is_connection_error(e):
+                shared_data["events"].publish(StatusMessage("학교 서버와 연결할 수 없습니다. 인터넷 연결을 확인해주세요."))
+            else:
+                shared_data["events"].publish(StatusMessage(f"서버 오류: {str(e)}"))
+            return
         
-        upcoming_blocks = driver.find_elements(By.CSS_SELECTOR, ".block_timeline, .block_calendar_upcoming, .block_myoverview")
+        course_links = parse_course_links(main_page_html)
+        print(f"{len(course_links)}개 강좌 발견")
+    
+    # 타임라인에서 강좌명을 찾지 못한 항목은 방금 수집한 강좌 목록으로 채움
+    course_titles.update_from_links(course_links)
+    def rename(content):
+        # HUD에 이미 게시된 항목이므로 고치지 않고 강좌명을 바꾼 사본을 만듦
+        if content["course"] != UNKNOWN_COURSE:
+            return None
+        course_name = course_titles.get(course_id_from_url(content["link"]), UNKNOWN_COURSE)
+        if course_name == UNKNOWN_COURSE:
+            return None
+        renamed = dict(content, course=course_name)
+        renamed.pop("category", None)
+        categorize(renamed)
+        return renamed
+    
+    if sink.replace(rename):
+        publish_contents(sink.items(), shared_data)
+    
+    def submit_course(idx, course_url, course_title):
+        """강좌 하나의 일괄 페이지 2개와 강좌 페이지를 작업으로 만듭니다."""
+        print(f"\n[{idx+1}/{len(course_links)}] '{course_title}' 강좌 처리 중...")
+        tasks = []
         
-        for block in upcoming_blocks:
-            try:
-                block_title = block.find_element(By.CSS_SELECTOR, ".card-title, .header").text.strip()
-                print(f"블록 확인: {block_title}")
-                
-                events = block.find_elements(By.CSS_SELECTOR, ".list-group-item, .event")
-                print(f"{len(events)}개 항목 발견")
-                
-                for event in events:
-                    try:
-                        event_text = event.text.strip()
-                        links = event.find_elements(By.TAG_NAME, "a")
-                        
-                        if not links:
-                            continue
-                            
-                        link = links[0].get_attribute("href")
-                        if not link or not any(keyword in link for keyword in ['/mod/assign/', '/mod/econtents/']):
-                            continue
-                            
-                        title = links[0].text.strip()
-                        print(f"활동 발견: {title}")
-                        
-                        date_match = re.search(r'(\d{1,2})\s*(?:월|月)\s*(\d{1,2})', event_text)
-                        deadline = None
-                        
-                        if date_match:
-                            month = int(date_match.group(1))
-                            day = int(date_match.group(2))
-                            
-                            year = datetime.date.today().year
-                            estimated_date = datetime.date(year, month, day)
-                            
-                            if estimated_date < datetime.date.today():
-                                estimated_date = datetime.date(year + 1, month, day)
-                                
-                            deadline = estimated_date
-                        
-                        content_type = "기타"
-                        if "/mod/assign/" in link:
-                            content_type = "과제"
-                        elif "/mod/econtents/" in link:
-                            content_type = "영상"
-                        
-                        if (title, link) in processed_items:
-                            continue
-                            
-                        processed_items.add((title, link))
-                        
-                        course_name = "미확인 강좌"
-                        course_match = re.search(r'course=(\d+)', link)
-                        if course_match:
-                            try:
-                                course_link = f"https://ecampus.smu.ac.kr/course/view.php?id={course_match.group(1)}"
-                                driver.execute_script("window.open(arguments[0]);", course_link)
-                                driver.switch_to.window(driver.window_handles[-1])
-                                wait_for_page_load(driver, 5)
-                                try:
-                                    course_title_elem = driver.find_element(By.CSS_SELECTOR, ".page-header-headings h1")
-                                    course_name = course_title_elem.text.strip().replace("[천안]", "").strip()
-                                except:
-                                    pass
-                                
-                                driver.close()
-                                driver.switch_to.window(driver.window_handles[0])
-                            except:
-                                pass
-                        
-                        if not deadline:
-                            deadline = datetime.date.today() + datetime.timedelta(days=due_period)
-                        
-                        # 지정된 기간 내에 있는지 확인
-                        diff_days = (deadline - datetime.date.today()).days
-                        if not (0 <= diff_days <= due_period):
-                            continue
-                            
-                        all_contents.append({
-                            "course": course_name,
-                            "title": title,
-                            "link": link,
-                            "due_date": str(deadline),
-                            "status": "확인필요",
-                            "context": event_text,
-                            "type": content_type
-                        })
-                        
-                        all_contents.sort(key=lambda x: x['due_date'])
-                        shared_data["contents"] = all_contents
-                        shared_data["updated"] = True
-                    except Exception as e:
-                        print(f"항목 처리 오류: {str(e)}")
-                        continue
-            except Exception as e:
-                print(f"블록 처리 오류: {str(e)}")
-                continue
+        course_id_match = re.search(r'id=(\d+)', course_url)
+        if course_id_match:
+            course_id = course_id_match.group(1)
+            bulk_pages = (
+                ("과제", f"{ECAMPUS_URL}/mod/assign/index.php?id={course_id}"),
+                ("영상", f"{ECAMPUS_URL}/mod/econtents/index.php?id={course_id}"),
+            )
+            if store:
+                # 일괄 페이지를 확인한 뒤에야 강좌 페이지를 건너뛸지 알 수 있으므로 한 작업으로 처리
+                return [("강좌", process_course_incremental, (
+                    session, bulk_pages, course_url, course_title, sink, shared_data, store))]
+            for content_type, url in bulk_pages:
+                tasks.append((f"{content_type} 일괄 페이지", process_bulk_page, (
+                    session, url, course_title, content_type, sink, shared_data, store)))
         
-        print("\n강좌 목록을 수집 중...")
+        tasks.append(("강좌 페이지", process_course_page, (
+            session, course_url, course_title, sink, shared_data, store)))
+        return tasks
+    
+    run_course_tasks(
+        course_links,
+        submit_course,
+        shared_data,
+        on_progress=lambda done, total: shared_data["events"].publish(CrawlProgress(done, total)),
+    )
+
+def process_course_incremental(session, bulk_pages, course_url, course_title, sink, shared_data, store):
+    """일괄 페이지 2개를 확인하고, 강좌 페이지는 바뀌었을 수 있을 때만 요청합니다.
+    
+    두 일괄 페이지의 해시가 강좌 페이지를 마지막으로 가져올 때와 같으면 저장된 항목을 씁니다.
+    강좌 페이지에만 있는 활동의 변경은 일괄 페이지에 드러나지 않으므로, 강좌 페이지를
+    가져온 지 COURSE_PAGE_MAX_AGE가 지나면 일괄 페이지가 그대로여도 다시 요청합니다.
+    """
+    bulk_fingerprints = []
+    for content_type, url in bulk_pages:
         try:
-            driver.get("https://ecampus.smu.ac.kr/")
-            wait_for_page_load(driver, 5)
+            bulk_fingerprints.append(process_bulk_page(session, url, course_title, content_type, sink, shared_data, store))
         except Exception as e:
-            print(f"메인페이지 접속 오류: {str(e)}")
-            if "ERR_CONNECTION_TIMED_OUT" in str(e) or "RemoteDisconnected" in str(e):
-                if shared_data.get("status_label"):
-                    shared_data["status_label"].config(text="학교 서버와 연결할 수 없습니다. 인터넷 연결을 확인해주세요.")
-            else:
-                if shared_data.get("status_label"):
-                    shared_data["status_label"].config(text=f"서버 오류: {str(e)}")
-            # 계속 실행 (다음 단계로 진행)
-            course_links = []  # 빈 리스트로 초기화
-        else:  # 오류가 없을 경우 실행됨
-            course_links = []
-            course_elems = driver.find_elements(By.CSS_SELECTOR, ".course_box, .coursebox, .course-listitem")
-            
-            for elem in course_elems:
-                try:
-                    links = elem.find_elements(By.TAG_NAME, "a")
-                    for link in links:
-                        href = link.get_attribute("href")
-                        if href and "course/view.php?id=" in href:
-                            title = link.text.strip().replace("[천안]", "").strip()
-                            if title:
-                                course_links.append((href, title))
-                                break
-                except:
-                    continue
-            
-            if len(course_links) < 3:
-                all_links = driver.find_elements(By.TAG_NAME, "a")
-                for link in all_links:
-                    try:
-                        href = link.get_attribute("href")
-                        if href and "course/view.php?id=" in href:
-                            title = link.text.strip().replace("[천안]", "").strip()
-                            if title and len(title) > 3 and (href, title) not in course_links:
-                                course_links.append((href, title))
-                    except:
-                        continue
-            
-            print(f"{len(course_links)}개 강좌 발견")
-            
-            for idx, (course_url, course_title) in enumerate(course_links):
-                if not shared_data["running"] or shared_data["exit"]:
-                    if shared_data["exit"]: return
-                    print("크롤링이 일시 중단되었습니다. HUD에서 '재시작' 버튼을 누르면 계속됩니다.")
-                    while not shared_data["running"] and not shared_data["exit"]:
-                        time.sleep(1)
-                    if shared_data["exit"]: return
-                    print("크롤링을 재개합니다.")
-                
-                print(f"\n[{idx+1}/{len(course_links)}] '{course_title}' 강좌 처리 중...")
-                
-                course_id_match = re.search(r'id=(\d+)', course_url)
-                if course_id_match:
-                    course_id = course_id_match.group(1)
-                    
-                    try:
-                        process_bulk_page(driver, f"https://ecampus.smu.ac.kr/mod/assign/index.php?id={course_id}", 
-                                         course_title, "과제", all_contents, processed_items, shared_data)
-                    except Exception as e:
-                        print(f"과제 일괄 페이지 처리 오류: {str(e)}")
-                    
-                    try:
-                        process_bulk_page(driver, f"https://ecampus.smu.ac.kr/mod/econtents/index.php?id={course_id}", 
-                                         course_title, "영상", all_contents, processed_items, shared_data)
-                    except Exception as e:
-                        print(f"영상 일괄 페이지 처리 오류: {str(e)}")
-                
-                try:
-                    driver.get(course_url)
-                    wait_for_page_load(driver, 5)
-                except Exception as e:
-                    print(f"강좌 페이지 접속 오류: {str(e)}")
-                    if "ERR_CONNECTION_TIMED_OUT" in str(e) or "RemoteDisconnected" in str(e):
-                        if not shared_data.get("exit", False) and shared_data.get("status_label"):
-                            shared_data["status_label"].config(text="학교 서버와 연결할 수 없습니다. 인터넷 연결을 확인해주세요.")
-                    # 다음 강좌로 진행
-                    continue
-                
-                try:
-                    activity_items = driver.find_elements(By.CSS_SELECTOR, ".activity, .modtype_assign, .modtype_econtents, .activityinstance, .activity-item")
-                    
-                    for item in activity_items:
-                        try:
-                            item_html = item.get_attribute("outerHTML")
-                            
-                            if not ("mod/assign" in item_html or "mod/econtents" in item_html):
-                                continue
-                                
-                            links = item.find_elements(By.TAG_NAME, "a")
-                            if not links:
-                                continue
-                                
-                            link = links[0].get_attribute("href")
-                            title = links[0].text.strip()
-                            
-                            if not link or not title:
-                                continue
-                            
-                            if "/mod/assign/view.php" in link or "/mod/econtents/view.php" in link:
-                                continue
-                            
-                            if (title, link) in processed_items:
-                                continue
-                                
-                            processed_items.add((title, link))
-                            
-                            content_type = "기타"
-                            if "/mod/assign/" in link:
-                                content_type = "과제"
-                            elif "/mod/econtents/" in link:
-                                content_type = "영상"
-                            else:
-                                continue
-                            
-                            deadline = None
-                            item_text = item.text
-                            
-                            date_patterns = [
-                                r'(\d{4})[-년/\.]\s*(\d{1,2})[-월/\.]\s*(\d{1,2})',
-                                r'(\d{2})[-/\.]\s*(\d{1,2})[-/\.]\s*(\d{1,2})',
-                                r'(\d{1,2})\s*[월/]\s*(\d{1,2})'
-                            ]
-                            
-                            for pattern in date_patterns:
-                                date_match = re.search(pattern, item_text)
-                                if date_match:
-                                    try:
-                                        if len(date_match.groups()) == 3:
-                                            year = int(date_match.group(1))
-                                            if year < 100:
-                                                year += 2000
-                                            month = int(date_match.group(2))
-                                            day = int(date_match.group(3))
-                                        else:
-                                            month = int(date_match.group(1))
-                                            day = int(date_match.group(2))
-                                            year = datetime.date.today().year
-                                            
-                                        deadline = datetime.date(year, month, day)
-                                        
-                                        if deadline < datetime.date.today():
-                                            deadline = datetime.date(year + 1, month, day)
-                                        
-                                        break
-                                    except:
-                                        continue
-                            
-                            if not deadline:
-                                try:
-                                    driver.execute_script("window.open(arguments[0]);", link)
-                                    driver.switch_to.window(driver.window_handles[-1])
-                                    wait_for_page_load(driver, 5)
-                                    
-                                    page_text = driver.find_element(By.TAG_NAME, "body").text
-                                    for pattern in date_patterns:
-                                        date_match = re.search(pattern, page_text)
-                                        if date_match:
-                                            try:
-                                                if len(date_match.groups()) == 3:
-                                                    year = int(date_match.group(1))
-                                                    if year < 100:
-                                                        year += 2000
-                                                    month = int(date_match.group(2))
-                                                    day = int(date_match.group(3))
-                                                else:
-                                                    month = int(date_match.group(1))
-                                                    day = int(date_match.group(2))
-                                                    year = datetime.date.today().year
-                                                    
-                                                deadline = datetime.date(year, month, day)
-                                                
-                                                if deadline < datetime.date.today():
-                                                    if len(date_match.groups()) == 2:
-                                                        deadline = datetime.date(year + 1, month, day)
-                                                
-                                                break
-                                            except:
-                                                continue
-                                    
-                                    status = "확인필요"
-                                    if content_type == "과제":
-                                        status_elems = driver.find_elements(By.CSS_SELECTOR, ".submissionstatustable .c1, .statedetails")
-                                        if status_elems:
-                                            status_text = status_elems[0].text.strip()
-                                            if "미제출" in status_text:
-                                                status = "미제출"
-                                            elif "제출" in status_text and "미제출" not in status_text:
-                                                status = "제출됨"
-                                    elif content_type == "영상":
-                                        progress_elems = driver.find_elements(By.CSS_SELECTOR, ".progress-bar, .progresstext")
-                                        if progress_elems:
-                                            progress_text = progress_elems[0].text.strip()
-                                            if "100%" in progress_text or "완료" in progress_text:
-                                                status = "제출됨"
-                                            else:
-                                                status = "미제출"
-                                    
-                                    context = "세부 정보 없음"
-                                    try:
-                                        main_content = driver.find_element(By.ID, "region-main")
-                                        context = main_content.text[:150] + "..."
-                                    except:
-                                        pass
-                                    
-                                    driver.close()
-                                    driver.switch_to.window(driver.window_handles[0])
-                                except Exception as e:
-                                    print(f"상세 페이지 확인 오류: {str(e)}")
-                                    
-                                    if len(driver.window_handles) > 1:
-                                        driver.close()
-                                        driver.switch_to.window(driver.window_handles[0])
-                                    
-                                    # 기간 설정 적용
-                                    deadline = datetime.date.today() + datetime.timedelta(days=shared_data.get("due_period", 7))
-                                    status = "확인필요"
-                                    context = item_text
-                            
-                            if not deadline:
-                                # 기간 설정 적용
-                                deadline = datetime.date.today() + datetime.timedelta(days=shared_data.get("due_period", 7))
-                            
-                            # 사용자가 선택한 기간 적용
-                            due_period = shared_data.get("due_period", 7)
-                            diff_days = (deadline - datetime.date.today()).days
-                            if not (0 <= diff_days <= due_period):
-                                continue
-                            
-                            print(f"{content_type} 발견: {title}, 마감일: {deadline}")
-                            
-                            all_contents.append({
-                                "course": course_title,
-                                "title": title,
-                                "link": link,
-                                "due_date": str(deadline),
-                                "status": status if 'status' in locals() else "확인필요",
-                                "context": context if 'context' in locals() else item_text,
-                                "type": content_type
-                            })
-                        except Exception as e:
-                            print(f"활동 항목 처리 오류: {str(e)}")
-                            continue
-                            
-                except Exception as e:
-                    print(f"강좌 페이지 처리 오류: {str(e)}")
-                    continue
-            
-            for content in shared_data["contents"]:
-                course_name = content['course']
-                if "천안CTL" in course_name:
-                    content['category'] = "천안CTL"
-                    content['course'] = course_name.replace("천안CTL", "").strip()
-                elif "SM-CLASS" in course_name:
-                    content['category'] = "SM-CLASS"
-                    content['course'] = course_name.replace("SM-CLASS", "").strip()
-                elif "교과 기타" in course_name:
-                    content['category'] = "교과 기타"
-                    content['course'] = course_name.replace("교과 기타", "").strip()
-                else:
-                    content['category'] = "일반"
-            
-            all_contents.sort(key=lambda x: x['due_date'])
-            shared_data["contents"] = all_contents
-            shared_data["updated"] = True
-            
-            shared_data["crawling_complete"] = True  # 크롤링 완료 플래그 설정
-            print("\n크롤링이 완료되었습니다. 결과를 확인하세요.")
+            print(f"{content_type} 일괄 페이지 처리 오류: {str(e)}")
+            bulk_fingerprints.append(None)
+    
+    index_fingerprint = None
+    if None not in bulk_fingerprints:
+        index_fingerprint = fingerprint(*bulk_fingerprints, shared_data.get("lazy_details", False))
+        if store.page_index_fingerprint(course_url, COURSE_PAGE_MAX_AGE) == index_fingerprint:
+            merge_stored_items(store.page_items(course_url), sink)
+            print(f"일괄 페이지 변경 없음, 강좌 페이지 요청 생략: {course_title}")
+            return
+    process_course_page(session, course_url, course_title, sink, shared_data, store, index_fingerprint)
 
-            # 크롤링 완료 즉시 버튼 상태 변경 및 브라우저 종료 (메인 스레드에서 직접 처리)
-            if shared_data["control_var"] and shared_data["control_button"]:
-                shared_data["control_var"].set("완료됨")
-                shared_data["control_button"].config(state=tk.DISABLED)
-            
-            # 드라이버 종료를 즉시 실행
-            if shared_data["driver"]:
-                shared_data["driver"].quit()
-                shared_data["driver"] = None
-                print("Selenium 브라우저가 종료되었습니다.")
+def merge_stored_items(items, sink):
+    """저장소에서 꺼낸 항목을 중복 없이 수집 목록에 병합합니다."""
+    sink.extend(items)
+    sink.flush()
 
-            while not shared_data["exit"]:
-                if shared_data.get("crawling_complete") and not shared_data["running"]:
-                    print("크롤링이 완료되었으며, 브라우저를 종료합니다.")
-                    break
-                time.sleep(0.5)
+def bulk_status(content_type, status_text):
+    """일괄 페이지의 상태 칸 문구를 제출 상태로 바꿉니다."""
+    if content_type == "과제":
+        if "미제출" in status_text:
+            return "미제출"
+        if "제출" in status_text:
+            return "제출됨"
+    else:
+        if any(kw in status_text for kw in ["미시청", "미완료", "0%"]):
+            return "미제출"
+        if any(kw in status_text for kw in ["완료", "100%", "시청"]):
+            return "제출됨"
+    return "확인필요"
+
+def bulk_page_items(rows, course_title, content_type, due_period, today):
+    """일괄 페이지 표의 행을 콘텐츠로 바꾸고 기간 밖의 항목을 걸러 내보냅니다."""
+    for row in rows:
+        try:
+            title = row["title"]
             
-            print("\n===== 수집 완료 =====")
-            print(f"총 {len(all_contents)}개 항목 발견")
+            if row["due_text"] is None:
+                print(f"날짜 정보 없음: {title}")
+                continue
+            due_text = row["due_text"]
+            deadline = parse_deadline(due_text, today)
+            if not deadline:
+                print(f"날짜 정보 없음: {title}")
+                continue
             
-            if all_contents:
-                print(f"\n===== {due_period}일 이내 마감 예정 콘텐츠 목록 =====")
-                for idx, content in enumerate(all_contents):
-                    deadline_date = datetime.datetime.strptime(content['due_date'], '%Y-%m-%d').date()
-                    deadline = datetime.datetime.combine(deadline_date, datetime.time(23, 59, 59))
-                    remaining = calculate_remaining_time(deadline)
-                    
-                    print(f"\n[{idx+1}] {content['course']} - {content['title']} ({content['type']})")
-                    print(f"마감일: {content['due_date']}")
-                    print(f"남은 시간: {remaining}")
-                    print(f"상태: {content['status']}")
-                    print(f"링크: {content['link']}")
-                    print("-" * 50)
-                
-                print(f"\n총 {len(all_contents)}개의 콘텐츠가 {due_period}일 이내 마감 예정입니다.")
-            else:
-                print(f"\n{due_period}일 이내 마감 예정인 콘텐츠가 없습니다.")
+            # 사용자가 선택한 기간(7일 또는 14일) 내의 항목만 포함
+            diff_days = days_until(deadline, today)
+            if not (0 <= diff_days <= due_period):
+                continue
             
-            print("\n크롤링이 완료되었습니다. 결과를 확인하세요.")
+            status = "확인필요"
+            status_text = "상태 정보 없음"
+            if row["status_text"] is not None:
+                status_text = row["status_text"]
+                status = bulk_status(content_type, status_text)
             
-            while not shared_data["exit"]:
-                if shared_data.get("crawling_complete") and not shared_data["running"]:
-                    print("크롤링이 완료되었으며, 브라우저를 종료합니다.")
-                    break
-                time.sleep(0.5)  # 상태 확인 주기를 더 짧게 설정
-    
-    except Exception as e:
-        print(f"프로그램 실행 중 오류 발생: {str(e)}")
-        import traceback
-        traceback.print_exc()
-    
-    finally:
-        shared_data["exit"] = True
-        if driver.service.process:
-            driver.quit()
-        print("Selenium 브라우저가 종료되었습니다.")
+            print(f"{content_type} 발견: {title}, 마감일: {deadline}, 상태: {status}")
+            
+            yield {
+                "course": course_title,
+                "title": title,
+                "link": row["link"],
+                "due_date": format_due(deadline),
+                "status": status,
+                "context": f"마감일: {due_text}, 상태: {status_text}",
+                "type": content_type
+            }
+        except Exception as e:
+            print(f"행 처리 오류: {str(e)}")
+            continue
 
-def process_bulk_page(driver, url, course_title, content_type, all_contents, processed_items, shared_data):
+@tracing.traced("bulk_page", "course_title", "content_type", "url")
+def process_bulk_page(session, url, course_title, content_type, sink, shared_data, store=None):
+    """일괄 페이지 표에서 기간 내 항목을 수집하고, 표 내용과 기간 조건의 해시를 반환합니다."""
     print(f"{content_type} 일괄 페이지 확인: {url}")
-    driver.get(url)
-    wait_for_page_load(driver, 5)
+    table = parse_bulk_table(session.get(url))
+    today = now_kst().date()
+    due_period = shared_data.get("due_period", 7)
+    page_fingerprint = fingerprint(table[1] if table else None, course_title, due_period, today)
     
-    tables = driver.find_elements(By.CSS_SELECTOR, "table.generaltable")
-    
-    if not tables:
+    if table is None:
         print(f"{content_type} 테이블을 찾을 수 없습니다.")
-        return
-        
-    print(f"{content_type} 테이블 발견: {len(tables)}개")
+        return page_fingerprint
     
-    table = tables[0]
-    rows = table.find_elements(By.TAG_NAME, "tr")
+    (name_idx, due_idx, status_idx), rows = table
     
-    if len(rows) <= 1:
+    if not rows:
         print(f"{content_type} 항목이 없습니다.")
-        return
-        
-    headers = rows[0].find_elements(By.TAG_NAME, "th")
-    header_texts = [h.text.strip().lower() for h in headers]
-    
-    name_idx = 0
-    due_idx = 1
-    status_idx = 2
-    
-    for i, header in enumerate(header_texts):
-        if any(keyword in header for keyword in ["이름", "제목", "과제", "콘텐츠"]):
-            name_idx = i
-        elif any(keyword in header for keyword in ["기한", "마감", "종료", "due"]):
-            due_idx = i
-        elif any(keyword in header for keyword in ["상태", "제출", "시청", "status"]):
-            status_idx = i
+        return page_fingerprint
     
     print(f"컬럼 인덱스 - 이름: {name_idx}, 기한: {due_idx}, 상태: {status_idx}")
     
-    today = datetime.date.today()
-    found_content = False
+    # 표 내용과 기간 조건이 지난 실행과 같으면 저장소의 항목을 그대로 사용
+    if store and store.page_fingerprint(url) == page_fingerprint:
+        merge_stored_items(store.page_items(url), sink)
+        print(f"{content_type} 일괄 페이지 변경 없음, 저장된 항목 사용: {course_title}")
+        return page_fingerprint
     
-    for row_idx, row in enumerate(rows[1:], 1):
+    page_items = list(bulk_page_items(rows, course_title, content_type, due_period, today))
+    if sink.extend(page_items):
+        sink.flush()
+        print(f"{content_type} 정보 업데이트 완료: {course_title}")
+    else:
+        print(f"마감 예정 {content_type}가 없습니다.")
+    
+    if store:
+        store.save_page(url, page_fingerprint, page_items)
+    return page_fingerprint
+
+def detail_status(content_type, detail):
+    """상세 페이지의 제출/진도 문구를 제출 상태로 바꿉니다."""
+    if content_type == "과제":
+        status_text = detail["status_text"]
+        if status_text:
+            if "미제출" in status_text:
+                return "미제출"
+            if "제출" in status_text:
+                return "제출됨"
+    elif content_type == "영상":
+        progress_text = detail["progress_text"]
+        if progress_text:
+            return "제출됨" if "100%" in progress_text or "완료" in progress_text else "미제출"
+    return "확인필요"
+
+def detail_fields(content_type, detail, today):
+    """상세 페이지에서 (마감 일시 또는 None, 제출 상태, 내용)을 읽습니다."""
+    return parse_deadline(detail["text"], today), detail_status(content_type, detail), detail["context"] or "세부 정보 없음"
+
+def apply_detail(content, detail, due_period):
+    """나중에 가져온 상세 정보를 반영한 새 항목을 반환합니다. 마감이 기간 밖이면 None."""
+    today = now_kst().date()
+    deadline, status, context = detail_fields(content['type'], detail, today)
+    updated = dict(content, status=status, context=context)
+    updated.pop('detail_pending', None)
+    if deadline:
+        if not 0 <= days_until(deadline, today) <= due_period:
+            return None
+        updated['due_date'] = format_due(deadline)
+    return updated
+
+def course_page_items(session, activity_items, course_title, due_period, today, claim, lazy=False):
+    """강좌 페이지 활동 중 일괄 페이지에 없는 과제/영상을 콘텐츠로 내보냅니다.
+    
+    마감일이 활동 목록에 없으면 상세 페이지를 여는데, 그 전에 claim으로 중복을 확인해
+    이미 수집한 항목의 상세 페이지는 요청하지 않습니다. lazy이면 상세 페이지를 열지 않고
+    detail_pending 표시를 남겨 HUD에서 행을 선택할 때 가져오게 합니다.
+    """
+    default_deadline = end_of_day(today + datetime.timedelta(days=due_period))
+    for item in activity_items:
         try:
-            cells = row.find_elements(By.TAG_NAME, "td")
+            link = item["link"]
+            title = item["title"]
             
-            if len(cells) <= name_idx:
+            if "/mod/assign/view.php" in link or "/mod/econtents/view.php" in link:
                 continue
-                
-            name_cell = cells[name_idx]
-            links = name_cell.find_elements(By.TAG_NAME, "a")
-            
-            if not links:
+            content_type = content_type_from_link(link)
+            if content_type == "기타":
                 continue
-                
-            title = links[0].text.strip()
-            link = links[0].get_attribute("href")
-            
-            if (title, link) in processed_items:
+            if not claim(title, link):
                 continue
-                
-            processed_items.add((title, link))
             
-            deadline = None
-            due_text = "마감일 정보 없음"
+            item_text = item["text"]
+            status = "확인필요"
+            context = item_text
+            deadline = parse_deadline(item_text, today)
+            detail_pending = not deadline and lazy
             
-            if due_idx < len(cells):
-                due_cell = cells[due_idx]
-                due_text = due_cell.text.strip()
-                
-                date_patterns = [
-                    r'(\d{4})[-년/\.]\s*(\d{1,2})[-월/\.]\s*(\d{1,2})',
-                    r'(\d{2})[-/\.]\s*(\d{1,2})[-/\.]\s*(\d{1,2})'
-                ]
-                
-                for pattern in date_patterns:
-                    date_match = re.search(pattern, due_text)
-                    if date_match:
-                        try:
-                            if len(date_match.groups()) == 3:
-                                year = int(date_match.group(1))
-                                if year < 100:
-                                    year += 2000
-                                month = int(date_match.group(2))
-                                day = int(date_match.group(3))
-                                
-                                deadline = datetime.date(year, month, day)
-                                break
-                        except:
-                            continue
+            if not deadline and not lazy:
+                try:
+                    with tracing.span("detail_page", course=course_title, link=link):
+                        detail = parse_detail_page(session.get(link))
+                    deadline, status, context = detail_fields(content_type, detail, today)
+                except Exception as e:
+                    print(f"상세 페이지 확인 오류: {str(e)}")
+                    status = "확인필요"
+                    context = item_text
             
-            if not deadline:
-                print(f"날짜 정보 없음: {title}")
-                continue
+            # 마감일을 찾지 못하면 선택한 기간의 마지막 날로 표시
+            deadline = deadline or default_deadline
             
-            # 사용자가 선택한 기간(7일 또는 14일) 내의 항목만 포함
-            due_period = shared_data.get("due_period", 7)
-            diff_days = (deadline - today).days
+            # 사용자가 선택한 기간 적용
+            diff_days = days_until(deadline, today)
             if not (0 <= diff_days <= due_period):
                 continue
             
-            status = "확인필요"
-            status_text = "상태 정보 없음"
-            
-            if status_idx < len(cells):
-                status_cell = cells[status_idx]
-                status_text = status_cell.text.strip()
-                
-                if content_type == "과제":
-                    if "미제출" in status_text:
-                        status = "미제출"
-                    elif "제출" in status_text and "미제출" not in status_text:
-                        status = "제출됨"
-                else:
-                    if any(kw in status_text for kw in ["미시청", "미완료", "0%"]):
-                        status = "미제출"
-                    elif any(kw in status_text for kw in ["완료", "100%", "시청"]):
-                        status = "제출됨"
-            
-            print(f"{content_type} 발견: {title}, 마감일: {deadline}, 상태: {status}")
+            print(f"{content_type} 발견: {title}, 마감일: {deadline}")
             
-            all_contents.append({
+            content = {
                 "course": course_title,
                 "title": title,
                 "link": link,
-                "due_date": str(deadline),
+                "due_date": format_due(deadline),
                 "status": status,
-                "context": f"마감일: {due_text}, 상태: {status_text}",
+                "context": context,
                 "type": content_type
-            })
-            found_content = True
+            }
+            if detail_pending:
+                content["detail_pending"] = True
+            yield content
         except Exception as e:
-            print(f"행 처리 오류: {str(e)}")
+            print(f"활동 항목 처리 오류: {str(e)}")
             continue
+
+@tracing.traced("course_page", "course_title", "course_url")
+def process_course_page(session, course_url, course_title, sink, shared_data, store=None, index_fingerprint=None):
+    """강좌 페이지의 활동 목록에서 일괄 페이지에 없던 과제/영상을 찾습니다.
     
-    if found_content:
-        all_contents.sort(key=lambda x: x['due_date'])
-        shared_data["contents"] = all_contents
-        shared_data["updated"] = True
-        print(f"{content_type} 정보 업데이트 완료: {course_title}")
-    else:
-        print(f"마감 예정 {content_type}가 없습니다.")
+    index_fingerprint(이번 실행의 일괄 페이지 해시)는 저장소에 함께 기록해 다음 실행에서
+    강좌 페이지 요청을 건너뛸 수 있게 합니다.
+    """
+    try:
+        course_page_html = session.get(course_url)
+    except Exception as e:
+        print(f"강좌 페이지 접속 오류: {str(e)}")
+        if is_connection_error(e):
+            shared_data["events"].publish(StatusMessage("학교 서버와 연결할 수 없습니다. 인터넷 연결을 확인해주세요."))
+        return
+    
+    activity_items = parse_course_activities(course_page_html)
+    
+    # 활동 목록이 지난 실행과 같으면 상세 페이지를 다시 열지 않고 저장된 항목을 사용
+    today = now_kst().date()
+    due_period = shared_data.get("due_period", 7)
+    lazy = shared_data.get("lazy_details", False)
+    # 상세 페이지를 미룬 결과와 가져온 결과는 서로 재사용하지 않음
+    page_fingerprint = fingerprint(activity_items, course_title, due_period, today, *(("lazy",) if lazy else ()))
+    if store and store.page_fingerprint(course_url) == page_fingerprint:
+        stored_items = store.page_items(course_url)
+        merge_stored_items(stored_items, sink)
+        print(f"강좌 페이지 변경 없음, 저장된 항목 사용: {course_title}")
+        if index_fingerprint:
+            store.save_page(course_url, page_fingerprint, stored_items, index_fingerprint)
+        return
+    
+    page_items = []
+    try:
+        for content in course_page_items(session, activity_items, course_title, due_period, today, sink.claim, lazy):
+            sink.add(content, claimed=True)
+            page_items.append(content)
+    except Exception as e:
+        print(f"강좌 페이지 처리 오류: {str(e)}")
+        return
+    finally:
+        sink.flush()
+    
+    if store:
+        store.save_page(course_url, page_fingerprint, page_items, index_fingerprint)
 
 if __name__ == "__main__":
+    if "--cli" in sys.argv[1:]:
+        sys.modules.setdefault("main", sys.modules[__name__])  # cli의 import main이 이 모듈을 재사용하도록
+        from cli import run_cli
+        sys.exit(run_cli(sys.argv[1:]))
+    if "--daemon" in sys.argv[1:]:
+        sys.modules.setdefault("main", sys.modules[__name__])
+        from daemon import run_daemon
+        sys.exit(run_daemon(sys.argv[1:]))
     main()
\ No newline at end of file
@@ -1,13 +1,76 @@
 # Configuration settings for the e-campus crawler
 
-ECAMPUS_URL = "https://ecampus.smu.ac.kr"
+import os
+
+ECAMPUS_URL = os.environ.get("SMU_ECAMPUS_URL", "https://ecampus.smu.ac.kr")  # override to crawl a local stub server
 LOGIN_URL = f"{ECAMPUS_URL}/login.php"
+DASHBOARD_URL = f"{ECAMPUS_URL}/"
 COURSES_URL = f"{ECAMPUS_URL}/courses"
 ASSIGNMENT_URL_PATTERN = f"{ECAMPUS_URL}/mod/assign/~"
 
 # WebDriver settings
 WEBDRIVER_PATH = "/path/to/chromedriver"  # Update this path to your WebDriver executable
 HEADLESS = True  # Set to True to run in headless mode, False to see the browser window
+LEAN_BROWSER = os.environ.get("SMU_LEAN_BROWSER", "1") != "0"  # "eager" page loads and blocked heavy resources; set SMU_LEAN_BROWSER=0 to load everything
+# URL patterns (Network.setBlockedURLs wildcards) never fetched by the lean browser: images, media, fonts, analytics
+LEAN_BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.mp4", "*.webm", "*.mp3", "*.m4a",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*analytics.js*",
+]
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
 
 # Timeout settings
-TIMEOUT = 10  # seconds for waiting for elements to load
\ No newline at end of file
+TIMEOUT = 10  # seconds for waiting for elements to load
+TIMELINE_TIMEOUT = 3  # seconds the dashboard waits for the JS-filled timeline block once the page is up
+
+# Deadline settings
+UTC_OFFSET_HOURS = 9  # e-campus deadlines are in Korea Standard Time (no DST)
+DEADLINE_ALERT_HOURS = (24, 3)  # HUD alerts when an unsubmitted item gets this close (hours) to its deadline
+
+# HTTP session settings (used after login, instead of the browser)
+HTTP_POOL_SIZE = 8  # max keep-alive connections to the e-campus host
+HTTP_RETRIES = 1  # retries for failed connections
+CRAWL_WORKERS = 6  # course pages fetched in parallel (keep <= HTTP_POOL_SIZE)
+BATCH_WORKERS = 3  # accounts crawled at the same time in batch mode (each uses up to CRAWL_WORKERS threads)
+BATCH_BROWSERS = 2  # Chrome instances shared by all accounts for the login step in batch mode
+
+# Daemon settings (python src/main.py --daemon)
+DAEMON_HOST = "127.0.0.1"  # the API is only served on localhost
+DAEMON_PORT = int(os.environ.get("SMU_DAEMON_PORT", "8765"))
+DAEMON_MIN_INTERVAL = 5 * 60  # seconds between refreshes when a deadline is imminent
+DAEMON_MAX_INTERVAL = 60 * 60  # seconds between refreshes when nothing is due soon (also keeps the session alive)
+DAEMON_POLL_INTERVAL = 15  # seconds between HUD checks for a new daemon snapshot
+
+# Detail pages of undated course activities: with LAZY_DETAILS the HUD crawl skips them and
+# fetches one when its row is selected (the CLI and daemon always fetch them during the crawl)
+LAZY_DETAILS = os.environ.get("SMU_LAZY_DETAILS", "1") != "0"
+DETAIL_CACHE_SIZE = 256  # parsed detail pages kept in memory (least recently used are dropped)
+DETAIL_CACHE_TTL = 600  # seconds before a cached detail page is fetched again
+DETAIL_PREFETCH = 10  # pending details fetched in the background right after the crawl, nearest deadline first
+DETAIL_FETCH_WORKERS = 2  # concurrent detail page requests
+
+# Data source: "html" scrapes the timeline, index and course pages. "ajax" asks Moodle's AJAX
+# web service for upcoming deadlines first and falls back to HTML scraping on failure, but the
+# calendar only has action events: econtents videos without one are missed and the status is only
+# 미제출/확인필요 (no 제출 완료 or progress), so it stays opt-in (--source ajax or SMU_DATA_SOURCE=ajax)
+DATA_SOURCE = os.environ.get("SMU_DATA_SOURCE", "html")
+
+# Local cache settings (persisted between runs)
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".smu_assignment_collector")
+COURSE_TITLE_CACHE_PATH = os.path.join(CACHE_DIR, "course_titles.json")
+STORE_PATH = os.path.join(CACHE_DIR, "contents.sqlite3")
+CHROMEDRIVER_CACHE_PATH = os.path.join(CACHE_DIR, "chromedriver.json")
+CHROMEDRIVER_CACHE_TTL = 7 * 24 * 3600  # seconds before the cached chromedriver path is re-checked online
+SESSION_CACHE = os.environ.get("SMU_SESSION_CACHE", "1") != "0"  # reuse the saved login cookies while the session is valid (needs cryptography)
+SESSION_CACHE_PATH = os.path.join(CACHE_DIR, "session.bin")  # Fernet-encrypted cookie jar
+SESSION_KEY_PATH = os.path.join(CACHE_DIR, "session.key")  # encryption key, created with 0600 permissions
+ACCOUNTS_DIR = os.path.join(CACHE_DIR, "accounts")  # per-account store and session cache for batch mode
+INCREMENTAL_CRAWL = True  # reuse stored items for index/course pages whose content did not change
+COURSE_PAGE_MAX_AGE = 3 * 3600  # seconds a course page is reused without a GET while both index pages are unchanged
+
+# Tracing settings (opt-in, off unless SMU_TRACE_FILE is set)
+TRACE_FILE = os.environ.get("SMU_TRACE_FILE")  # Chrome trace JSON output, open in chrome://tracing or ui.perfetto.dev
+TRACE_CPROFILE = os.environ.get("SMU_TRACE_CPROFILE") == "1"  # also dump cProfile stats of the crawl thread
+TRACE_TRACEMALLOC = os.environ.get("SMU_TRACE_TRACEMALLOC") == "1"  # also write a tracemalloc snapshot
@@ -0,0 +1,93 @@
+import queue
+import threading
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ContentsUpdated:
+    """수집 목록 스냅샷 (마감일 순 정렬)."""
+    contents: list
+
+
+@dataclass(frozen=True)
+class ContentsAdded:
+    """마지막 게시 이후 새로 수집된 항목들 (마감일 순 정렬)."""
+    items: tuple
+
+
+@dataclass(frozen=True)
+class DetailLoaded:
+    """행을 선택하거나 미리 가져온 상세 페이지 결과. 가져오지 못했으면 detail은 None."""
+    link: str
+    detail: dict = None
+
+
+@dataclass(frozen=True)
+class StatusMessage:
+    """HUD 하단 상태 표시줄에 보여줄 메시지."""
+    text: str
+
+
+@dataclass(frozen=True)
+class LoginStatus:
+    """로그인 폼 상태 메시지. retry가 True이면 로그인 버튼을 다시 활성화합니다."""
+    text: str
+    retry: bool = False
+
+
+@dataclass(frozen=True)
+class SessionRestored:
+    """저장된 로그인 세션으로 로그인 폼 없이 로그인되었습니다."""
+    userid: str
+
+
+@dataclass(frozen=True)
+class CrawlProgress:
+    """강좌별 페이지 수집 진행률."""
+    done: int
+    total: int
+
+
+@dataclass(frozen=True)
+class CrawlCompleted:
+    """수집이 끝났음을 알립니다."""
+    count: int
+
+
+class EventBus:
+    """크롤러 스레드에서 HUD(Tk) 스레드로 이벤트를 전달하는 스레드 안전 큐.
+
+    publish()는 어느 스레드에서나 호출할 수 있고, 소비자가 연결되어 있으면
+    대기 중인 깨우기가 없을 때만 wakeup 콜백을 한 번 호출합니다. 소비자는
+    자신의 스레드에서 drain()으로 쌓인 이벤트를 한꺼번에 꺼내 처리합니다.
+    """
+
+    def __init__(self):
+        self._queue = queue.SimpleQueue()
+        self._wakeup = None
+        self._wakeup_pending = threading.Event()
+
+    def connect(self, wakeup):
+        """소비자의 깨우기 콜백을 등록합니다 (None이면 연결 해제)."""
+        self._wakeup = wakeup
+
+    def publish(self, event):
+        self._queue.put(event)
+        wakeup = self._wakeup
+        if wakeup and not self._wakeup_pending.is_set():
+            self._wakeup_pending.set()
+            try:
+                wakeup()
+            except Exception:
+                # HUD가 이미 닫힌 경우 등은 무시
+                self._wakeup_pending.clear()
+
+    def drain(self):
+        """쌓인 이벤트를 모두 꺼내 발생 순서대로 반환합니다."""
+        self._wakeup_pending.clear()
+        events = []
+        while True:
+            try:
+                events.append(self._queue.get_nowait())
+            except queue.Empty:
+                return events
@@ -0,0 +1,94 @@
+import csv
+import datetime
+import hashlib
+import json
+
+from crawler.deadline import parse_due_date
+
+EXPORT_FIELDS = ("course", "title", "type", "status", "due_date", "link", "category", "context")
+
+
+def export_rows(contents, fields=EXPORT_FIELDS):
+    """콘텐츠 목록에서 내보낼 필드만 골라 dict 목록으로 반환합니다."""
+    return [{field: content.get(field) for field in fields} for content in contents]
+
+
+def write_json(contents, stream, fields=EXPORT_FIELDS):
+    json.dump(export_rows(contents, fields), stream, ensure_ascii=False, indent=2)
+    stream.write("\n")
+
+
+def write_csv(contents, stream, fields=EXPORT_FIELDS):
+    writer = csv.DictWriter(stream, fieldnames=fields, lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(export_rows(contents, fields))
+
+
+def _ics_escape(text):
+    return (
+        str(text or "")
+        .replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _ics_fold(line):
+    """RFC 5545에 맞춰 75바이트를 넘는 줄을 접습니다."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line
+    parts = []
+    current = ""
+    limit = 75
+    for char in line:
+        if len((current + char).encode("utf-8")) > limit:
+            parts.append(current)
+            current = ""
+            limit = 74  # 이어지는 줄은 맨 앞 공백 1바이트 포함
+        current += char
+    parts.append(current)
+    return "\r\n ".join(parts)
+
+
+def write_ics(contents, stream, fields=EXPORT_FIELDS):
+    """마감 일시를 일정(VEVENT)으로 내보냅니다. 일정 길이는 마감 직전 1시간입니다.
+
+    fields에 account가 있으면 일정 설명에 계정을 함께 적습니다.
+    """
+    stamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//SMU AssignmentCollector//KO",
+        "CALSCALE:GREGORIAN",
+    ]
+    for content in contents:
+        deadline = parse_due_date(content["due_date"]).astimezone(datetime.timezone.utc)
+        account = content.get("account") if "account" in fields else None
+        uid_source = f"{content['link']}|{content['title']}" + (f"|{account}" if account else "")
+        uid = hashlib.sha1(uid_source.encode("utf-8")).hexdigest()
+        summary = f"[{content['type']}] {content['title']}"
+        description = f"{content['course']} / {content['status']}" + (f" / {account}" if account else "")
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{uid}@smu-assignment-collector",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART:{(deadline - datetime.timedelta(hours=1)).strftime('%Y%m%dT%H%M%SZ')}",
+            f"DTEND:{deadline.strftime('%Y%m%dT%H%M%SZ')}",
+            f"SUMMARY:{_ics_escape(summary)}",
+            f"DESCRIPTION:{_ics_escape(description)}",
+            f"URL:{content['link']}",
+            "END:VEVENT",
+        ]
+    lines.append("END:VCALENDAR")
+    stream.write("".join(f"{_ics_fold(line)}\r\n" for line in lines))
+
+
+EXPORTERS = {
+    "json": write_json,
+    "csv": write_csv,
+    "ics": write_ics,
+}
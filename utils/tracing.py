@@ -0,0 +1,264 @@
+import cProfile
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+from utils.config import TRACE_CPROFILE, TRACE_FILE, TRACE_TRACEMALLOC
+
+
+class _NullSpan:
+    """추적이 꺼져 있을 때 쓰는 빈 컨텍스트 (호출 비용 최소화)."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """구간별 실행 시간과 카운터를 모아 Chrome 트레이스(JSON) 파일로 저장합니다.
+
+    chrome://tracing 또는 https://ui.perfetto.dev 에서 파일을 열면 스레드별 타임라인으로
+    볼 수 있습니다. cProfile은 start()를 호출한 스레드만, tracemalloc은 프로세스 전체를
+    대상으로 하며 결과는 트레이스 파일 옆에 .prof / .tracemalloc.txt로 저장됩니다.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.path = None
+        self.events = []
+        self.counters = Counter()
+        self.lock = threading.Lock()
+        self.origin = time.perf_counter()
+        self.profiler = None
+        self.thread_names = {}
+
+    def start(self, path, cpu_profile=False, memory_profile=False):
+        self.enabled = True
+        self.path = path
+        self.origin = time.perf_counter()
+        if memory_profile:
+            tracemalloc.start()
+        if cpu_profile:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        print(f"실행 추적을 시작합니다: {path}")
+
+    def _now_us(self):
+        return (time.perf_counter() - self.origin) * 1e6
+
+    def _thread_id(self):
+        thread = threading.current_thread()
+        self.thread_names.setdefault(thread.ident, thread.name)
+        return thread.ident
+
+    @contextmanager
+    def _span(self, name, args):
+        start = self._now_us()
+        try:
+            yield
+        finally:
+            event = {
+                "name": name,
+                "ph": "X",
+                "ts": start,
+                "dur": self._now_us() - start,
+                "pid": os.getpid(),
+                "tid": self._thread_id(),
+                "args": args,
+            }
+            with self.lock:
+                self.events.append(event)
+
+    def span(self, name, **args):
+        """구간 실행 시간을 기록하는 컨텍스트 관리자. 추적이 꺼져 있으면 아무것도 하지 않습니다."""
+        if not self.enabled:
+            return NULL_SPAN
+        return self._span(name, {key: str(value) for key, value in args.items()})
+
+    def count(self, name, amount=1):
+        if not self.enabled:
+            return
+        with self.lock:
+            self.counters[name] += amount
+            value = self.counters[name]
+            self.events.append({
+                "name": name,
+                "ph": "C",
+                "ts": self._now_us(),
+                "pid": os.getpid(),
+                "tid": self._thread_id(),
+                "args": {name: value},
+            })
+
+    def finish(self):
+        """트레이스 파일을 쓰고 구간별 요약을 출력합니다."""
+        if not self.enabled:
+            return
+        self.enabled = False
+
+        if self.profiler:
+            self.profiler.disable()
+            self.profiler.dump_stats(f"{self.path}.prof")
+            print(f"cProfile 결과 저장: {self.path}.prof")
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            with open(f"{self.path}.tracemalloc.txt", "w", encoding="utf-8") as f:
+                f.write(f"current={current / 1024:.1f} KiB peak={peak / 1024:.1f} KiB\n\n")
+                for stat in snapshot.statistics("lineno")[:50]:
+                    f.write(f"{stat}\n")
+            print(f"tracemalloc 결과 저장: {self.path}.tracemalloc.txt")
+
+        with self.lock:
+            events = list(self.events)
+            counters = dict(self.counters)
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": name}}
+            for tid, name in self.thread_names.items()
+        ]
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms",
+                       "otherData": {"counters": counters}}, f, ensure_ascii=False)
+        print(f"실행 추적 저장: {self.path}")
+        self.print_summary(events, counters)
+
+    @staticmethod
+    def print_summary(events, counters):
+        totals = defaultdict(lambda: [0, 0.0])
+        spans = [event for event in events if event["ph"] == "X"]
+        for event in spans:
+            total = totals[event["name"]]
+            total[0] += 1
+            total[1] += event["dur"]
+
+        print("\n===== 구간별 실행 시간 =====")
+        for name, (calls, duration) in sorted(totals.items(), key=lambda item: -item[1][1]):
+            print(f"{name:<24} {calls:5d}회 {duration / 1e6:9.3f}s")
+        print("\n===== 가장 오래 걸린 구간 =====")
+        for event in sorted(spans, key=lambda event: -event["dur"])[:10]:
+            detail = ", ".join(f"{key}={value}" for key, value in event["args"].items())
+            print(f"{event['dur'] / 1e6:8.3f}s {event['name']} {detail}")
+        if counters:
+            print("\n===== 카운터 =====")
+            for name, value in sorted(counters.items()):
+                print(f"{name:<24} {value}")
+
+
+class StartupTimer:
+    """프로그램 시작 단계별 소요 시간을 기록하고, 준비가 끝나면 한 번 출력합니다.
+
+    phase()는 구간 길이를, mark()는 시작 시점부터 경과 시간을 기록합니다.
+    HUD 첫 화면과 브라우저 준비(또는 저장된 세션 확인)가 모두 기록되면 요약을 출력합니다.
+    """
+
+    LABELS = {
+        "imports": "모듈 import 완료",
+        "first_paint": "HUD 첫 화면",
+        "selenium_import": "selenium import",
+        "driver_resolve": "chromedriver 경로 확인",
+        "browser_spawn": "Chrome 실행",
+        "browser_ready": "브라우저 준비 완료",
+        "session_restored": "저장된 세션 확인 완료",
+    }
+    READY_MARKS = ("browser_ready", "session_restored")  # 둘 중 하나와 first_paint가 기록되면 출력
+
+    def __init__(self, origin):
+        self.origin = origin
+        self.phases = {}
+        self.marks = {}
+        self.lock = threading.Lock()
+        self.reported = False
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            with tracer.span(name):
+                yield
+        finally:
+            with self.lock:
+                self.phases[name] = time.perf_counter() - start
+
+    def mark(self, name):
+        with self.lock:
+            self.marks[name] = time.perf_counter() - self.origin
+            ready = (
+                not self.reported
+                and "first_paint" in self.marks
+                and any(mark in self.marks for mark in self.READY_MARKS)
+            )
+            if ready:
+                self.reported = True
+        if ready:
+            self.report()
+
+    def report(self):
+        print("\n===== 시작 시간 =====")
+        for name, elapsed in sorted(self.marks.items(), key=lambda item: item[1]):
+            print(f"{self.LABELS.get(name, name):<24} {elapsed:7.3f}s (시작 후)")
+        for name, duration in self.phases.items():
+            print(f"  {self.LABELS.get(name, name):<22} {duration:7.3f}s")
+
+
+tracer = Tracer()
+
+
+def span(name, **args):
+    return tracer.span(name, **args)
+
+
+def count(name, amount=1):
+    tracer.count(name, amount)
+
+
+def traced(name, *arg_names):
+    """함수 호출을 구간으로 기록하는 데코레이터. arg_names의 인자 값은 구간 정보로 남깁니다."""
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            bound = signature.bind_partial(*args, **kwargs).arguments
+            with tracer.span(name, **{arg: bound.get(arg) for arg in arg_names}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def instrument_driver(driver):
+    """WebDriver 명령마다 구간과 카운터를 기록하도록 드라이버를 감쌉니다."""
+    if not tracer.enabled:
+        return driver
+    execute = driver.execute
+
+    def traced_execute(command, params=None):
+        tracer.count("webdriver_commands")
+        with tracer.span("webdriver", command=command):
+            return execute(command, params)
+
+    driver.execute = traced_execute
+    return driver
+
+
+def start_from_config():
+    """설정(환경 변수 SMU_TRACE_FILE 등)에 추적 파일이 지정된 경우에만 추적을 시작합니다."""
+    if TRACE_FILE:
+        tracer.start(TRACE_FILE, cpu_profile=TRACE_CPROFILE, memory_profile=TRACE_TRACEMALLOC)
+
+
+def finish():
+    tracer.finish()